@@ -1,5 +1,5 @@
 from pathlib import Path
-from pymongo import MongoClient
+from pymongo import ASCENDING, MongoClient
 from pymongo.errors import ConnectionFailure, OperationFailure
 import os
 from dotenv import load_dotenv
@@ -12,6 +12,13 @@ class MongoDBConnection:
     db = None
     base_dir = Path(__file__).resolve().parents[2]
 
+    # Index déclarés par collection : (champ, options create_index).
+    # Complétés par MONGO_INDEXES="collection.champ,collection.champ" (non uniques).
+    INDEXES = {
+        "conversations": [("lang639-2", {"unique": True})],
+    }
+    indexes_ready = False
+
     @classmethod
     def _load_env_config(cls):
         """Charge la configuration depuis les variables d'environnement"""
@@ -67,6 +74,9 @@ class MongoDBConnection:
                 print(f"Connecté à MongoDB Server version {server_info['version']}")
                 print(f"Base de données: {config['database']}")
 
+                # Une fois par processus (première connexion)
+                cls.ensure_indexes()
+
             except ConnectionFailure as e:
                 print(f"Erreur de connexion MongoDB: {e}")
                 cls.client = None
@@ -81,6 +91,42 @@ class MongoDBConnection:
                 cls.db = None
                 raise
 
+    @classmethod
+    def _load_index_config(cls):
+        """Index déclarés (INDEXES) + index configurés par MONGO_INDEXES\n
+        Returns:
+            dict: {collection: [(champ, options)]}
+        """
+        indexes = {name: list(specs) for name, specs in cls.INDEXES.items()}
+        for entry in os.getenv("MONGO_INDEXES", "").split(","):
+            collection, _, field = entry.strip().partition(".")
+            if collection and field:
+                specs = indexes.setdefault(collection, [])
+                if field not in {f for f, _ in specs}:
+                    specs.append((field, {}))
+        return indexes
+
+    @classmethod
+    def ensure_indexes(cls):
+        """Crée les index manquants (create_index est idempotent)\n
+        Un échec (doublons existants pour un index unique, droits...) est
+        signalé sans bloquer la connexion.
+        """
+        if cls.indexes_ready or cls.db is None:
+            return
+        failed = 0
+        for collection_name, specs in cls._load_index_config().items():
+            collection = cls.db[collection_name]
+            for field, options in specs:
+                try:
+                    name = collection.create_index([(field, ASCENDING)], **options)
+                    print(f"Index {collection_name}.{name} prêt")
+                except OperationFailure as e:
+                    failed += 1
+                    print(f"Index {collection_name}.{field} non créé: {e}")
+        # En cas d'échec, nouvelle tentative à la prochaine connexion
+        cls.indexes_ready = failed == 0
+
     @classmethod
     def close(cls):
         """Ferme la connexion"""
@@ -103,13 +149,14 @@ class MongoDBConnection:
         return cls.db[collection_name]
 
     @classmethod
-    def find(cls, collection_name, query=None, projection=None, limit=0):
+    def find(cls, collection_name, query=None, projection=None, limit=0, sort=None):
         """Exécute une requête de recherche\n
         Args:\n
             collection_name (str): Nom de la collection\n
             query (dict, optional): Filtre de recherche\n
             projection (dict, optional): Champs à retourner\n
             limit (int, optional): Nombre maximum de documents\n
+            sort (list, optional): Tri [(champ, 1 ou -1)]\n
         Returns:
             list: Liste des documents trouvés
         """
@@ -120,6 +167,8 @@ class MongoDBConnection:
             collection = cls.get_collection(collection_name)
             cursor = collection.find(query or {}, projection)
 
+            if sort:
+                cursor = cursor.sort(sort)
             if limit > 0:
                 cursor = cursor.limit(limit)
 
@@ -190,6 +239,31 @@ class MongoDBConnection:
             print(f"Erreur d'insertion multiple: {e}")
             raise
 
+    @classmethod
+    def bulk_write(cls, collection_name, operations, ordered=False):
+        """Exécute des opérations d'écriture groupées (un aller-retour par lot)\n
+        Args:\n
+            collection_name (str): Nom de la collection\n
+            operations (list): ReplaceOne, UpdateOne, DeleteMany...\n
+            ordered (bool): Arrêt à la première erreur\n
+        Returns:
+            BulkWriteResult: Résultat des écritures
+        """
+        if cls.db is None:
+            cls.connect()
+
+        try:
+            collection = cls.get_collection(collection_name)
+            result = collection.bulk_write(operations, ordered=ordered)
+            print(
+                f"{result.upserted_count} document(s) créé(s), "
+                f"{result.modified_count} modifié(s)"
+            )
+            return result
+        except OperationFailure as e:
+            print(f"Erreur d'écriture groupée: {e}")
+            raise
+
     @classmethod
     def update_one(cls, collection_name, query, update, upsert=False):
         """Met à jour un document\n
@@ -297,6 +371,45 @@ class MongoDBConnection:
             print(f"Erreur de comptage: {e}")
             raise
 
+    @classmethod
+    def distinct(cls, collection_name, key, query=None):
+        """Valeurs distinctes d'un champ (un seul aller-retour serveur)\n
+        Args:\n
+            collection_name (str): Nom de la collection\n
+            key (str): Champ dont on veut les valeurs\n
+            query (dict, optional): Filtre de sélection\n
+        Returns:
+            list: Valeurs distinctes
+        """
+        if cls.db is None:
+            cls.connect()
+
+        try:
+            collection = cls.get_collection(collection_name)
+            return collection.distinct(key, query or {})
+        except OperationFailure as e:
+            print(f"Erreur de distinct: {e}")
+            raise
+
+    @classmethod
+    def estimated_document_count(cls, collection_name):
+        """Nombre de documents d'après les métadonnées de la collection
+        (temps constant, sans parcours ; peut être approximatif après un arrêt brutal)\n
+        Args:\n
+            collection_name (str): Nom de la collection\n
+        Returns:
+            int: Nombre de documents
+        """
+        if cls.db is None:
+            cls.connect()
+
+        try:
+            collection = cls.get_collection(collection_name)
+            return collection.estimated_document_count()
+        except OperationFailure as e:
+            print(f"Erreur de comptage estimé: {e}")
+            raise
+
     @classmethod
     def aggregate(cls, collection_name, pipeline):
         """Exécute une pipeline d'agrégation\n
@@ -12,6 +12,11 @@ class MySQLConnection:
     cursor = None
     base_dir = Path(__file__).resolve().parents[2]
     init_sql_path = base_dir / "db" / "init_script.sql"
+    migration_sql_path = base_dir / "db" / "migration_script.sql"
+    # Codes MySQL ignorés par les migrations (colonne / index déjà existants,
+    # index à supprimer absent)
+    MIGRATION_IGNORED_ERRORS = (1060, 1061, 1091)
+    migrated = False
 
     @classmethod
     def _load_env_config(cls):
@@ -84,10 +89,39 @@ class MySQLConnection:
             print(f"Échec exécution script d'init: {e}")
             raise
 
+        cls.run_migrations()
+
     @classmethod
-    def run_sql_script(cls, path):
+    def run_migrations(cls):
+        """
+        Applique migration_script.sql (index, colonnes ajoutées) une seule fois
+        par processus. Rejouable : les objets déjà présents sont ignorés.
+        """
+        if cls.migrated:
+            return
+        try:
+            cls.run_sql_script(
+                cls.migration_sql_path, ignore_errors=cls.MIGRATION_IGNORED_ERRORS
+            )
+            cls.commit()
+            cls.migrated = True
+            print("Script de migration exécuté.")
+        except FileNotFoundError:
+            cls.migrated = True
+            print(f"Script de migration introuvable: {cls.migration_sql_path}")
+        except Exception as e:
+            cls.rollback()
+            print(f"Échec exécution script de migration: {e}")
+            raise
+
+    @classmethod
+    def run_sql_script(cls, path, ignore_errors=()):
         """
         Exécute un script SQL simple avec instructions terminées par ';'
+
+        Args:
+            path: Chemin du script
+            ignore_errors: Codes d'erreur MySQL (errno) à ignorer
         """
         if cls.cursor is None:
             cls.connect()
@@ -104,8 +138,13 @@ class MySQLConnection:
         for stmt in statements:
             if stmt:
                 try:
-                    cls.execute_update(stmt)
+                    if ignore_errors:
+                        cls.cursor.execute(stmt)
+                    else:
+                        cls.execute_update(stmt)
                 except Error as e:
+                    if e.errno in ignore_errors:
+                        continue
                     print(f"Erreur sur: {stmt}\nErreur: {e}")
                     raise
 
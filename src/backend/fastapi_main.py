@@ -12,6 +12,7 @@ from routers import (
     conversation_routeur,
     country_routeur,
     credits_routeur,
+    travel_score_routeur,
 )
 
 
@@ -45,6 +46,7 @@ app.include_router(currency_routeur.router)
 app.include_router(electricity_router.router)
 app.include_router(ville_routeur.router)
 app.include_router(week_meteo_routeur.router)
+app.include_router(travel_score_routeur.router)
 app.include_router(conversation_routeur.router)
 app.include_router(credits_routeur.router)
 
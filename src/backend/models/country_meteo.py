@@ -0,0 +1,47 @@
+from datetime import date
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class CountryMeteoWeek(BaseModel):
+    country_3166a2: str = Field(..., description="Code pays ISO 3166-1 alpha-2")
+    week_start_date: date = Field(..., description="Début de période (YYYY-MM-DD)")
+    week_end_date: date = Field(..., description="Fin de période (YYYY-MM-DD)")
+    cities_count: int = Field(..., description="Nombre de villes agrégées")
+    weighted: bool = Field(
+        False, description="Moyennes pondérées par la population des villes"
+    )
+    temperature_max_mean: Optional[float] = Field(
+        None, description="Moyenne des T° max des villes"
+    )
+    temperature_max_min: Optional[float] = Field(
+        None, description="T° max la plus basse parmi les villes"
+    )
+    temperature_max_max: Optional[float] = Field(
+        None, description="T° max la plus haute parmi les villes"
+    )
+    temperature_min_mean: Optional[float] = Field(
+        None, description="Moyenne des T° min des villes"
+    )
+    temperature_min_min: Optional[float] = Field(
+        None, description="T° min la plus basse parmi les villes"
+    )
+    temperature_min_max: Optional[float] = Field(
+        None, description="T° min la plus haute parmi les villes"
+    )
+    precipitation_mean: Optional[float] = Field(
+        None, description="Cumul moyen des précipitations des villes"
+    )
+    precipitation_min: Optional[float] = Field(
+        None, description="Plus faible cumul de précipitations parmi les villes"
+    )
+    precipitation_max: Optional[float] = Field(
+        None, description="Plus fort cumul de précipitations parmi les villes"
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CountryMeteoWeek":
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        return self.model_dump()
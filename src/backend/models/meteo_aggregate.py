@@ -0,0 +1,27 @@
+from datetime import date
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class MeteoAggregate(BaseModel):
+    geoname_id: int = Field(..., description="Identifiant GeoNames (FK vers Villes)")
+    window: str = Field(..., description="Fenêtre d'agrégation (ex: 7d, 30d, month)")
+    period_start: date = Field(..., description="Premier jour de la période")
+    period_end: date = Field(..., description="Dernier jour de la période")
+    days: int = Field(..., description="Nombre de jours observés dans la période")
+    temperature_max_avg: Optional[float] = Field(
+        None, description="Moyenne des T° max sur la période"
+    )
+    temperature_min_avg: Optional[float] = Field(
+        None, description="Moyenne des T° min sur la période"
+    )
+    precipitation_sum: Optional[float] = Field(
+        None, description="Somme des précipitations sur la période"
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MeteoAggregate":
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        return self.model_dump()
@@ -0,0 +1,44 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class MeteoNormal(BaseModel):
+    geoname_id: int = Field(..., description="Identifiant GeoNames (FK vers Villes)")
+    iso_week: int = Field(..., ge=1, le=53, description="Numéro de semaine ISO")
+    years_count: int = Field(..., description="Nombre d'années observées")
+    first_year: int = Field(..., description="Première année ISO observée")
+    last_year: int = Field(..., description="Dernière année ISO observée")
+    temperature_max_mean: Optional[float] = Field(
+        None, description="Moyenne interannuelle des T° max (moyenne 14 jours)"
+    )
+    temperature_max_min: Optional[float] = Field(
+        None, description="Plus faible moyenne des T° max observée"
+    )
+    temperature_max_max: Optional[float] = Field(
+        None, description="Plus forte moyenne des T° max observée"
+    )
+    temperature_min_mean: Optional[float] = Field(
+        None, description="Moyenne interannuelle des T° min (moyenne 14 jours)"
+    )
+    temperature_min_min: Optional[float] = Field(
+        None, description="Plus faible moyenne des T° min observée"
+    )
+    temperature_min_max: Optional[float] = Field(
+        None, description="Plus forte moyenne des T° min observée"
+    )
+    precipitation_mean: Optional[float] = Field(
+        None, description="Cumul moyen des précipitations (14 jours)"
+    )
+    precipitation_min: Optional[float] = Field(
+        None, description="Plus faible cumul de précipitations observé"
+    )
+    precipitation_max: Optional[float] = Field(
+        None, description="Plus fort cumul de précipitations observé"
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MeteoNormal":
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        return self.model_dump()
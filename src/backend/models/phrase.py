@@ -0,0 +1,52 @@
+from typing import List
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class PhraseMatch(BaseModel):
+    lang639_2: str = Field(
+        ..., alias="lang639-2", description="Code langue ISO 639-2 (ex: 'fra')"
+    )
+    key: str = Field(..., description="Clé de la phrase (ex: 'THANK_YOU')")
+    sentence: str = Field(..., description="Texte de la phrase dans cette langue")
+    score: float = Field(..., ge=0, description="Pertinence (BM25, plus haut = meilleur)")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PhraseMatch":
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        return self.model_dump(by_alias=True)
+
+
+class PhraseTranslation(BaseModel):
+    lang639_2: str = Field(..., alias="lang639-2", description="Code langue ISO 639-2")
+    sentence: str = Field(..., description="Texte de la phrase dans cette langue")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PhraseTranslation":
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        return self.model_dump(by_alias=True)
+
+
+class PhrasePivot(BaseModel):
+    key: str = Field(..., description="Clé de la phrase (ex: 'THANK_YOU')")
+    translations: List[PhraseTranslation] = Field(
+        default_factory=list, description="Phrase dans chaque langue qui la contient"
+    )
+    missing: List[str] = Field(
+        default_factory=list, description="Langues demandées sans cette phrase"
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PhrasePivot":
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        return self.model_dump(by_alias=True)
@@ -0,0 +1,82 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class ComfortProfile(BaseModel):
+    """Préférences de confort utilisées pour noter une semaine (score 0-100)"""
+
+    ideal_temp: float = Field(24.0, description="T° max idéale (°C)")
+    temp_tolerance: float = Field(
+        6.0, gt=0, description="Écart de T° (°C) qui divise le score T° par ~1.6"
+    )
+    rain_tolerance: float = Field(
+        20.0, gt=0, description="Cumul de pluie (mm / 14 jours) qui divise le score pluie par e"
+    )
+    rain_weight: float = Field(
+        0.3, ge=0, le=1, description="Poids de la pluie dans le score (0 à 1)"
+    )
+
+
+class WeekScore(BaseModel):
+    iso_week: int = Field(..., ge=1, le=53, description="Numéro de semaine ISO")
+    score: float = Field(..., description="Score de confort (0 à 100)")
+    temperature_max_avg: Optional[float] = Field(
+        None, description="T° max moyenne de la semaine (toutes années)"
+    )
+    temperature_min_avg: Optional[float] = Field(
+        None, description="T° min moyenne de la semaine (toutes années)"
+    )
+    precipitation_sum: Optional[float] = Field(
+        None, description="Cumul de précipitations moyen (14 jours)"
+    )
+    cities_count: int = Field(1, description="Nombre de villes notées")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WeekScore":
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        return self.model_dump()
+
+
+class CityScore(BaseModel):
+    geoname_id: int = Field(..., description="Identifiant GeoNames")
+    name_en: str = Field(..., description="Nom de la ville en anglais")
+    country_3166a2: Optional[str] = Field(None, description="Code pays ISO 3166-1 alpha-2")
+    iso_week: int = Field(..., ge=1, le=53, description="Numéro de semaine ISO")
+    score: float = Field(..., description="Score de confort (0 à 100)")
+    temperature_max_avg: Optional[float] = Field(None, description="T° max moyenne")
+    temperature_min_avg: Optional[float] = Field(None, description="T° min moyenne")
+    precipitation_sum: Optional[float] = Field(
+        None, description="Cumul de précipitations moyen (14 jours)"
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CityScore":
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        return self.model_dump()
+
+
+class SimilarCity(BaseModel):
+    geoname_id: int = Field(..., description="Identifiant GeoNames")
+    name_en: str = Field(..., description="Nom de la ville en anglais")
+    country_3166a2: Optional[str] = Field(None, description="Code pays ISO 3166-1 alpha-2")
+    iso_week: Optional[int] = Field(None, ge=1, le=53, description="Semaine ISO comparée")
+    month: Optional[int] = Field(None, ge=1, le=12, description="Mois comparé")
+    distance: float = Field(
+        ..., ge=0, description="Distance climatique à la ville de référence (0 = identique)"
+    )
+    temperature_max_avg: Optional[float] = Field(None, description="T° max moyenne")
+    temperature_min_avg: Optional[float] = Field(None, description="T° min moyenne")
+    precipitation_sum: Optional[float] = Field(
+        None, description="Cumul de précipitations moyen (14 jours)"
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SimilarCity":
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        return self.model_dump()
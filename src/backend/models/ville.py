@@ -11,6 +11,9 @@ class Ville(BaseModel):
         None, max_length=2, description="Code pays ISO 3166-1 alpha-2"
     )
     is_capital: bool = Field(..., description="Cette ville est la capitale du pays")
+    population: Optional[int] = Field(
+        None, ge=0, description="Population (GeoNames), pondère les agrégats pays"
+    )
 
     @classmethod
     def from_dict(cls, data: dict) -> "Ville":
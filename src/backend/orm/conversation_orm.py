@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from bson import ObjectId
 from bson.errors import InvalidId
 from connexion.mongo_connect import MongoDBConnection
@@ -10,17 +10,20 @@ class ConversationOrm:
     COLLECTION_NAME = "conversations"
 
     @staticmethod
-    def find_by_id(conversation_id: str) -> Optional[Dict[str, Any]]:
+    def find_by_id(
+        conversation_id: str, projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """Recherche une conversation par son _id
         Args:
             conversation_id (str): ID de la conversation
+            projection (dict, optional): Champs à retourner (tous si None)
         Returns:
             Dict ou None si non trouvée
         """
         try:
             obj_id = ObjectId(conversation_id)
             return MongoDBConnection.find_one(
-                ConversationOrm.COLLECTION_NAME, {"_id": obj_id}
+                ConversationOrm.COLLECTION_NAME, {"_id": obj_id}, projection
             )
         except InvalidId:
             return None
@@ -32,27 +35,88 @@ class ConversationOrm:
             limit (int): Nombre max de résultats
             skip (int): Nombre de documents à ignorer
         Returns:
-            Liste de conversations
+            Liste de conversations triées par _id (même ordre que find_page)
         """
         collection = MongoDBConnection.get_collection(ConversationOrm.COLLECTION_NAME)
-        cursor = collection.find().skip(skip).limit(limit)
+        cursor = collection.find().sort("_id", 1).skip(skip).limit(limit)
         return list(cursor)
 
     @staticmethod
-    def find_by_lang(lang_code: str, limit: int = 100) -> List[Dict[str, Any]]:
-        """Recherche des conversations par code langue
+    def find_page(
+        after: Optional[str] = None,
+        limit: int = 100,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Page de conversations par plage d'_id (index _id, sans skip)
+        Args:
+            after (str, optional): _id du dernier document de la page précédente
+            limit (int): Nombre max de résultats
+            projection (dict, optional): Champs à retourner (tous si None)
+        Returns:
+            Liste de conversations triées par _id
+        Raises:
+            InvalidId: Si `after` n'est pas un ObjectId valide
+        """
+        query = {"_id": {"$gt": ObjectId(after)}} if after else {}
+        return MongoDBConnection.find(
+            ConversationOrm.COLLECTION_NAME,
+            query,
+            projection=projection,
+            limit=limit,
+            sort=[("_id", 1)],
+        )
+
+    @staticmethod
+    def find_by_lang(
+        lang_code: str, limit: int = 100, projection: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Recherche des conversations par code langue (index unique lang639-2)
         Args:
             lang_code (str): Code ISO 639-2
             limit (int): Nombre max de résultats
+            projection (dict, optional): Champs à retourner (tous si None)
         Returns:
             Liste de conversations
         """
         return MongoDBConnection.find(
             ConversationOrm.COLLECTION_NAME,
             {"lang639-2": lang_code.lower()},
+            projection=projection,
             limit=limit,
         )
 
+    @staticmethod
+    def find_all_sentences() -> List[Dict[str, Any]]:
+        """Toutes les conversations réduites à lang639-2 et sentences
+        (construction de l'index de recherche plein texte)
+        Returns:
+            Liste de documents {"lang639-2", "sentences"}
+        """
+        return MongoDBConnection.find(
+            ConversationOrm.COLLECTION_NAME,
+            {},
+            projection={"_id": 0, "lang639-2": 1, "sentences": 1},
+        )
+
+    @staticmethod
+    def find_sentence(
+        key: str, lang_codes: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Une phrase dans plusieurs langues en une requête ($in sur l'index
+        lang639-2, projection limitée à sentences.<key>)
+        Args:
+            key (str): Clé de la phrase (ex: 'THANK_YOU')
+            lang_codes (list, optional): Codes ISO 639-2 (toutes les langues si None)
+        Returns:
+            Liste de documents {"lang639-2", "sentences": {key: texte}}
+        """
+        query = {"lang639-2": {"$in": lang_codes}} if lang_codes else {}
+        return MongoDBConnection.find(
+            ConversationOrm.COLLECTION_NAME,
+            query,
+            projection={"_id": 0, "lang639-2": 1, f"sentences.{key}": 1},
+        )
+
     @staticmethod
     def create(conversation_data: Dict[str, Any]) -> str:
         """Crée une nouvelle conversation
@@ -109,6 +173,16 @@ class ConversationOrm:
         """
         return MongoDBConnection.count_documents(ConversationOrm.COLLECTION_NAME)
 
+    @staticmethod
+    def count_estimated() -> int:
+        """Nombre de conversations lu dans les métadonnées (temps constant)
+        Returns:
+            int: Nombre de conversations
+        """
+        return MongoDBConnection.estimated_document_count(
+            ConversationOrm.COLLECTION_NAME
+        )
+
     @staticmethod
     def count_by_lang(lang_code: str) -> int:
         """Compte les conversations par langue
@@ -121,21 +195,65 @@ class ConversationOrm:
             ConversationOrm.COLLECTION_NAME, {"lang639-2": lang_code.lower()}
         )
 
+    @staticmethod
+    def get_lang_codes() -> Set[str]:
+        """Codes langue présents dans la collection (un seul appel distinct)
+        Sert à réconcilier is_in_mongo côté MySQL sans un comptage par langue.
+        Returns:
+            Ensemble des codes ISO 639-2 en minuscules
+        """
+        values = MongoDBConnection.distinct(
+            ConversationOrm.COLLECTION_NAME, "lang639-2"
+        )
+        return {str(v).lower() for v in values if v}
+
+    @staticmethod
+    def remove_duplicate_langs() -> int:
+        """Supprime les conversations en double pour une même langue
+        (la plus ancienne est conservée), préalable à l'index unique lang639-2
+        Returns:
+            int: Nombre de documents supprimés
+        """
+        pipeline = [
+            {"$sort": {"_id": 1}},
+            {"$group": {"_id": "$lang639-2", "ids": {"$push": "$_id"}}},
+            {"$match": {"ids.1": {"$exists": True}}},
+        ]
+        duplicates = [
+            _id
+            for group in MongoDBConnection.aggregate(
+                ConversationOrm.COLLECTION_NAME, pipeline
+            )
+            for _id in group["ids"][1:]
+        ]
+        if not duplicates:
+            return 0
+        result = MongoDBConnection.delete_many(
+            ConversationOrm.COLLECTION_NAME, {"_id": {"$in": duplicates}}
+        )
+        return result.deleted_count
+
     @staticmethod
     def search_by_field(
-        field_name: str, field_value: Any, limit: int = 50
+        field_name: str,
+        field_value: Any,
+        limit: int = 50,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """Recherche générique par n'importe quel champ
+        (indexé si déclaré dans MONGO_INDEXES, ex: conversations.sentences.hello)
         Args:
             field_name (str): Nom du champ
             field_value (Any): Valeur recherchée
             limit (int): Nombre max de résultats
+            projection (dict, optional): Champs à retourner (tous si None)
         Returns:
             Liste de conversations
         """
         return MongoDBConnection.find(
             ConversationOrm.COLLECTION_NAME,
             {field_name: field_value},
+            projection=projection,
             limit=limit,
         )
 
@@ -188,6 +188,68 @@ class CountryOrm:
 
         return countries
 
+    # --- PAYS - MÉTÉO -------------------------------------------------------
+    @staticmethod
+    def _mean_sql(column: str, weighted: bool) -> str:
+        """
+        Moyenne SQL d'une colonne de Meteo_Weekly (alias m) ; pondérée par la
+        population des villes (alias v) si demandé, avec repli sur la moyenne
+        simple quand aucune ville renseignée n'a de population.
+        """
+        if not weighted:
+            return f"AVG(m.{column})"
+        weight = "COALESCE(v.population, 0)"
+        return (
+            f"COALESCE(SUM(m.{column} * {weight}) / NULLIF(SUM(CASE WHEN m.{column} "
+            f"IS NOT NULL THEN {weight} END), 0), AVG(m.{column}))"
+        )
+
+    @staticmethod
+    def get_meteo_weeks(
+        iso2: str,
+        start_date: Optional[Any] = None,
+        end_date: Optional[Any] = None,
+        weighted: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Agrégats hebdomadaires d'un pays calculés en SQL (Villes JOIN Meteo_Weekly,
+        GROUP BY week_start_date) : moyenne (éventuellement pondérée par la
+        population), min et max entre villes de chaque métrique.
+        """
+        iso2 = ETLUtils.normalize_iso_code(iso2, 2)
+        metrics = {
+            "temperature_max": "temperature_max_avg",
+            "temperature_min": "temperature_min_avg",
+            "precipitation": "precipitation_sum",
+        }
+        select = ",\n                ".join(
+            f"{CountryOrm._mean_sql(col, weighted)} AS {name}_mean, "
+            f"MIN(m.{col}) AS {name}_min, MAX(m.{col}) AS {name}_max"
+            for name, col in metrics.items()
+        )
+        conditions = ["v.country_3166a2 = %s"]
+        params: List[Any] = [iso2]
+        if start_date:
+            conditions.append("m.week_start_date >= %s")
+            params.append(start_date)
+        if end_date:
+            conditions.append("m.week_end_date <= %s")
+            params.append(end_date)
+
+        query = f"""
+            SELECT
+                m.week_start_date,
+                MAX(m.week_end_date) AS week_end_date,
+                COUNT(*) AS cities_count,
+                {select}
+            FROM Villes v
+            INNER JOIN Meteo_Weekly m ON m.geoname_id = v.geoname_id
+            WHERE {" AND ".join(conditions)}
+            GROUP BY m.week_start_date
+            ORDER BY m.week_start_date
+        """
+        return MySQLConnection.execute_query(query, tuple(params)) or []
+
     # --- PAYS - ECRITURE ----------------------------------------------------
     @staticmethod
     def upsert_pays(
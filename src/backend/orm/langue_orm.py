@@ -1,10 +1,28 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from connexion.mysql_connect import MySQLConnection
 
 
 class LangueOrm:
     """Repository pour la gestion des langues en base de données"""
 
+    REPLACE_QUERY = """
+        REPLACE INTO Langues
+        (iso639_2, name_en, name_fr, name_local, famille_id, is_in_mongo)
+        VALUES (%s, %s, %s, %s, %s, %s)
+    """
+
+    UPSERT_QUERY = """
+        INSERT INTO Langues
+        (iso639_2, name_en, name_fr, name_local, famille_id, is_in_mongo)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+           name_en = VALUES(name_en),
+           name_fr = VALUES(name_fr),
+           name_local = VALUES(name_local),
+           famille_id = VALUES(famille_id),
+           is_in_mongo = VALUES(is_in_mongo)
+    """
+
     @staticmethod
     def find_by_iso639_2(iso639_2: str) -> Optional[Dict[str, Any]]:
         """Recherche une langue par son code ISO 639-2
@@ -106,6 +124,46 @@ class LangueOrm:
         result = MySQLConnection.execute_query(query, (branche_en, branche_en))
         return result[0]["id"] if result else None
 
+    @staticmethod
+    def get_famille_map() -> Dict[str, int]:
+        """Charge toutes les familles en une requête : {branche en minuscules: id}
+
+        Les noms anglais et français pointent vers le même id ; en cas de doublon,
+        le plus petit id l'emporte.
+
+        Returns:
+            Dictionnaire branche_en/branche_fr (minuscules) -> id
+        """
+        query = "SELECT id, branche_en, branche_fr FROM Familles ORDER BY id"
+        famille_map: Dict[str, int] = {}
+        for row in MySQLConnection.execute_query(query):
+            for branche in (row["branche_en"], row["branche_fr"]):
+                if branche:
+                    famille_map.setdefault(branche.lower(), row["id"])
+        return famille_map
+
+    @staticmethod
+    def get_rows_by_code() -> Dict[str, Tuple]:
+        """Toutes les langues en une requête, pour comparer un import à l'existant
+
+        Returns:
+            {iso639_2: (name_en, name_fr, name_local, famille_id, is_in_mongo)}
+        """
+        query = """
+            SELECT iso639_2, name_en, name_fr, name_local, famille_id, is_in_mongo
+            FROM Langues
+        """
+        return {
+            row["iso639_2"]: (
+                row["name_en"],
+                row["name_fr"],
+                row["name_local"],
+                row["famille_id"],
+                bool(row["is_in_mongo"]),
+            )
+            for row in MySQLConnection.execute_query(query)
+        }
+
     @staticmethod
     def create_or_replace(
         iso639_2: str,
@@ -132,52 +190,74 @@ class LangueOrm:
         if branche_en:
             famille_id = LangueOrm.get_famille_id_by_branche(branche_en)
 
-        query = """
-            REPLACE INTO Langues 
-            (iso639_2, name_en, name_fr, name_local, famille_id, is_in_mongo)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """
         return MySQLConnection.execute_update(
-            query, (iso639_2, name_en, name_fr, name_local, famille_id, is_in_mongo)
+            LangueOrm.REPLACE_QUERY,
+            (iso639_2, name_en, name_fr, name_local, famille_id, is_in_mongo),
         )
 
     @staticmethod
-    def create_or_replace_batch(langues: List[Dict[str, Any]]) -> int:
+    def create_or_replace_batch(
+        langues: List[Dict[str, Any]], chunk_size: int = 500
+    ) -> int:
         """Insertion/remplacement en masse de langues
 
+        Les familles sont chargées une seule fois (get_famille_map), puis les
+        lignes partent par paquets de chunk_size dans un REPLACE multi-lignes
+        (executemany). La transaction est laissée à l'appelant.
+
         Args:
             langues: Liste de dictionnaires contenant les données des langues
+            chunk_size: Nombre de lignes par executemany
 
         Returns:
-            Nombre total de lignes insérées/remplacées
+            Nombre total de lignes insérées/remplacées (rowcount MySQL)
         """
-        total_inserted = 0
+        if not langues:
+            return 0
 
-        for langue in langues:
-            famille_id = None
-            if langue.get("branche_en"):
-                famille_id = LangueOrm.get_famille_id_by_branche(langue["branche_en"])
-
-            query = """
-                REPLACE INTO Langues 
-                (iso639_2, name_en, name_fr, name_local, famille_id, is_in_mongo)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """
-            rowcount = MySQLConnection.execute_update(
-                query,
-                (
-                    langue["iso639_2"],
-                    langue["name_en"],
-                    langue["name_fr"],
-                    langue["name_local"],
-                    famille_id,
-                    langue.get("is_in_mongo", False),
-                ),
+        famille_map = (
+            LangueOrm.get_famille_map()
+            if any(langue.get("branche_en") for langue in langues)
+            else {}
+        )
+        rows = [
+            (
+                langue["iso639_2"],
+                langue["name_en"],
+                langue["name_fr"],
+                langue["name_local"],
+                famille_map.get((langue.get("branche_en") or "").lower()),
+                langue.get("is_in_mongo", False),
             )
-            total_inserted += rowcount
+            for langue in langues
+        ]
 
+        total_inserted = 0
+        for i in range(0, len(rows), chunk_size):
+            total_inserted += MySQLConnection.execute_update(
+                LangueOrm.REPLACE_QUERY, rows[i : i + chunk_size]
+            )
         return total_inserted
 
+    @staticmethod
+    def bulk_upsert(rows: Sequence[Tuple], chunk_size: int = 500) -> int:
+        """Upsert de tuples déjà prêts, par INSERT multi-lignes (executemany)
+
+        Args:
+            rows: Tuples (iso639_2, name_en, name_fr, name_local, famille_id,
+                is_in_mongo)
+            chunk_size: Nombre de lignes par executemany
+
+        Returns:
+            Somme des rowcount MySQL. La transaction est laissée à l'appelant.
+        """
+        rowcount = 0
+        for i in range(0, len(rows), chunk_size):
+            rowcount += MySQLConnection.execute_update(
+                LangueOrm.UPSERT_QUERY, list(rows[i : i + chunk_size])
+            )
+        return rowcount
+
     @staticmethod
     def update_partial(iso639_2: str, updates: Dict[str, Any]) -> int:
         """Mise à jour partielle d'une langue
@@ -248,19 +328,7 @@ class LangueOrm:
         if branche_en:
             famille_id = LangueOrm.get_famille_id_by_branche(branche_en)
 
-        query = """
-            INSERT INTO Langues 
-            (iso639_2, name_en, name_fr, name_local, famille_id, is_in_mongo)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-               iso639_2 = VALUES(iso639_2),
-               name_en = VALUES(name_en),
-               name_fr = VALUES(name_fr),
-               name_local = VALUES(name_local),
-               famille_id = VALUES(famille_id),
-               is_in_mongo = VALUES(is_in_mongo)
-            
-        """
         return MySQLConnection.execute_update(
-            query, (iso639_2, name_en, name_fr, name_local, famille_id, is_in_mongo)
+            LangueOrm.UPSERT_QUERY,
+            (iso639_2, name_en, name_fr, name_local, famille_id, is_in_mongo),
         )
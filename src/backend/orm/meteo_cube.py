@@ -0,0 +1,261 @@
+import json
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from models.week_meteo import WeekMeteo
+
+# Canaux du cube : T° max, T° min, précipitations, durée de la période (jours)
+METRICS = ("temperature_max_avg", "temperature_min_avg", "precipitation_sum")
+SPAN = 3
+
+
+class MeteoCube:
+    """
+    Export binaire de Meteo_Weekly, lu en mémoire partagée (mmap) par l'API.
+
+    <root>/cube.npy  float32 [ville, semaine, canal] ; canal 3 = week_end - week_start
+                     en jours (NaN = semaine absente)
+    <root>/ids.npy   int64, geoname_id de chaque ligne du cube (trié)
+    <root>/extra.npy float64 [ligne, 6] : semaines hors grille (geoname_id,
+                     début et fin en jours depuis l'origine, 3 métriques)
+    <root>/meta.json origine (lundi de la 1re semaine), dimensions, date d'export
+
+    La semaine d'une date se calcule par (date - origine) // 7 : une lecture de
+    plage est une tranche du tableau, sans requête SQL. Les semaines qui ne
+    commencent pas un lundi (période incomplète en fin d'ETL, saisie API) sont
+    gardées à part dans extra.npy : une lecture renvoie exactement les lignes
+    de MySQL. Les pages sont partagées entre workers uvicorn via le cache du
+    système.
+    """
+
+    root: Path = Path(
+        os.getenv(
+            "METEO_CUBE_DIR",
+            Path(__file__).resolve().parents[2] / "db" / "meteo_cube",
+        )
+    )
+    # Intervalle (s) entre deux vérifications de meta.json par un lecteur
+    CHECK_INTERVAL = 1.0
+
+    _lock = threading.Lock()
+    _loaded: Optional[dict] = None
+    _checked_at: float = 0.0
+
+    # ======================= EXPORT =======================
+    @classmethod
+    def build(cls, rows: List[dict]) -> int:
+        """
+        Écrit le cube à partir des lignes de Meteo_Weekly (écriture atomique
+        fichier par fichier, meta.json en dernier).
+        Les lignes dont la semaine ne commence pas un lundi de la grille
+        (dernière semaine ISO incomplète d'une période) vont dans extra.npy.
+
+        Args:
+            rows: geoname_id, week_start_date, week_end_date + métriques
+
+        Returns:
+            Nombre de villes exportées
+        """
+        df = pd.DataFrame(
+            rows,
+            columns=["geoname_id", "week_start_date", "week_end_date", *METRICS],
+        )
+        cls.root.mkdir(parents=True, exist_ok=True)
+        if df.empty:
+            cls.invalidate()
+            return 0
+
+        # DECIMAL MySQL (objets Decimal / None) -> float64 avec NaN
+        values = df[list(METRICS)].apply(pd.to_numeric, errors="coerce").to_numpy(
+            dtype=np.float64
+        )
+        gids = df["geoname_id"].to_numpy(dtype=np.int64)
+        start = pd.to_datetime(df["week_start_date"])
+        origin = start.min() - pd.Timedelta(days=int(start.min().weekday()))
+        offset = (start - origin).dt.days.to_numpy()
+        span = (pd.to_datetime(df["week_end_date"]) - start).dt.days.to_numpy()
+        on_grid = offset % 7 == 0
+
+        ids, slots = np.unique(gids, return_inverse=True)
+        weeks = offset[on_grid] // 7
+        n_weeks = int(weeks.max()) + 1 if len(weeks) else 0
+
+        cube = np.full((len(ids), n_weeks, len(METRICS) + 1), np.nan, dtype=np.float32)
+        cube[slots[on_grid], weeks, :SPAN] = values[on_grid]
+        cube[slots[on_grid], weeks, SPAN] = span[on_grid]
+
+        off = ~on_grid
+        extra = np.column_stack(
+            [gids[off], offset[off], offset[off] + span[off], values[off]]
+        ).astype(np.float64)
+
+        cls._write_npy("cube.npy", cube)
+        cls._write_npy("ids.npy", ids)
+        cls._write_npy("extra.npy", extra)
+        meta = {
+            "origin": origin.date().isoformat(),
+            "cities": int(len(ids)),
+            "weeks": n_weeks,
+            "rows": int(len(df)),
+            "extra_rows": int(off.sum()),
+            "exported_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        tmp = cls.root / "meta.json.tmp"
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, cls.root / "meta.json")
+        return len(ids)
+
+    @classmethod
+    def _write_npy(cls, name: str, array: np.ndarray) -> None:
+        # Les lecteurs gardent l'ancien fichier mappé jusqu'à leur rechargement
+        tmp = cls.root / f"{name}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp, cls.root / name)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Retire meta.json : tous les lecteurs repassent par MySQL"""
+        try:
+            (cls.root / "meta.json").unlink()
+        except FileNotFoundError:
+            pass
+        cls.reset()
+
+    # ======================= LECTURE =======================
+    @classmethod
+    def _current(cls) -> Optional[dict]:
+        """Cube mappé en mémoire, rechargé si meta.json a changé (None si absent)"""
+        with cls._lock:
+            now = time.monotonic()
+            if now - cls._checked_at < cls.CHECK_INTERVAL:
+                return cls._loaded
+            cls._checked_at = now
+            meta_path = cls.root / "meta.json"
+            try:
+                mtime = meta_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                cls._loaded = None
+                return None
+            if cls._loaded is not None and cls._loaded["mtime"] == mtime:
+                return cls._loaded
+            try:
+                meta = json.loads(meta_path.read_text())
+                ids = np.load(cls.root / "ids.npy")
+                cube = np.load(cls.root / "cube.npy", mmap_mode="r")
+                extra = np.load(cls.root / "extra.npy")
+            except (OSError, ValueError) as e:
+                print(f"Cube météo illisible : {e}")
+                cls._loaded = None
+                return None
+            extra_index: Dict[int, List[np.ndarray]] = {}
+            for row in extra:
+                extra_index.setdefault(int(row[0]), []).append(row)
+            cls._loaded = {
+                "mtime": mtime,
+                "origin": date.fromisoformat(meta["origin"]),
+                "index": {int(g): i for i, g in enumerate(ids)},
+                "cube": cube,
+                "extra": extra_index,
+            }
+            return cls._loaded
+
+    @classmethod
+    def reset(cls) -> None:
+        """Oublie le cube chargé (relu au prochain appel)"""
+        with cls._lock:
+            cls._loaded = None
+            cls._checked_at = 0.0
+
+    @classmethod
+    def get_range(
+        cls,
+        geoname_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Optional[List[WeekMeteo]]:
+        """
+        Semaines d'une ville depuis le cube (bornes inclusives comme
+        WeekMeteoOrm.get_range_many).
+
+        Returns:
+            Liste triée par date, ou None si le cube est absent ou ne contient
+            pas la ville (l'appelant interroge alors MySQL)
+        """
+        current = cls._current()
+        if current is None:
+            return None
+        slot = current["index"].get(int(geoname_id))
+        if slot is None:
+            return None
+
+        origin = current["origin"]
+        n_weeks = current["cube"].shape[1]
+        first = 0
+        last = n_weeks
+        if start_date:
+            first = min(n_weeks, max(0, -(-(start_date - origin).days // 7)))
+        if end_date:
+            last = max(first, min(n_weeks, (end_date - origin).days // 7 + 1))
+
+        block = np.array(current["cube"][slot, first:last])
+        cells = []
+        for w in np.flatnonzero(~np.isnan(block[:, SPAN])):
+            week_start = origin + timedelta(days=7 * (first + int(w)))
+            week_end = week_start + timedelta(days=int(block[w, SPAN]))
+            cells.append((week_start, week_end, block[w, :SPAN]))
+        # Semaines hors grille : mêmes bornes que la requête MySQL
+        for row in current["extra"].get(int(geoname_id), []):
+            week_start = origin + timedelta(days=int(row[1]))
+            if start_date and week_start < start_date:
+                continue
+            cells.append((week_start, origin + timedelta(days=int(row[2])), row[3:]))
+
+        result = []
+        for week_start, week_end, metrics in sorted(cells, key=lambda c: c[0]):
+            if end_date and week_end > end_date:
+                continue
+            values = [None if np.isnan(v) else round(float(v), 2) for v in metrics]
+            result.append(
+                WeekMeteo(
+                    geoname_id=int(geoname_id),
+                    week_start_date=week_start,
+                    week_end_date=week_end,
+                    **dict(zip(METRICS, values)),
+                )
+            )
+        return result
+
+    @classmethod
+    def get_range_many(
+        cls,
+        geoname_ids: List[int],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[int, List[WeekMeteo]]:
+        """Plusieurs villes ; seules les villes présentes dans le cube sont renvoyées"""
+        found = {}
+        for gid in geoname_ids:
+            weeks = cls.get_range(gid, start_date, end_date)
+            if weeks is not None:
+                found[gid] = weeks
+        return found
+
+
+def main():
+    """Exporte Meteo_Weekly vers le cube (python -m orm.meteo_cube)"""
+    from orm.week_meteo_orm import WeekMeteoOrm
+
+    count = MeteoCube.build(WeekMeteoOrm.get_all_rows())
+    print(f"Cube météo exporté : {count} villes ({MeteoCube.root})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import itertools
+import os
+import time
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+
+class MeteoDailyStore:
+    """
+    Relevés météo quotidiens en Parquet, partitionnés (Hive) par année et
+    par seau de villes : <root>/year=YYYY/city_bucket=NN/part-<n>.parquet
+
+    Chaque écriture ajoute un fichier par partition touchée (noms croissants
+    dans l'ordre d'écriture) ; à la lecture, le fichier le plus récent l'emporte
+    pour un même (geoname_id, date). compact() regroupe ensuite chaque
+    partition en un seul fichier, une fois en fin d'ETL.
+
+    Les lectures filtrent sur les colonnes de partition (élagage des dossiers)
+    puis sur geoname_id/date (statistiques des row groups).
+    """
+
+    BUCKETS = 64
+    # Départage les fichiers écrits dans la même nanoseconde (ordre d'écriture)
+    _sequence = itertools.count()
+    root: Path = Path(
+        os.getenv(
+            "METEO_PARQUET_DIR",
+            Path(__file__).resolve().parents[2] / "db" / "meteo_daily",
+        )
+    )
+
+    SCHEMA = pa.schema(
+        [
+            ("geoname_id", pa.int64()),
+            ("date", pa.date32()),
+            ("tmax", pa.float32()),
+            ("tmin", pa.float32()),
+            ("precip_sum", pa.float32()),
+        ]
+    )
+    PARTITIONING = ds.partitioning(
+        pa.schema([("year", pa.int32()), ("city_bucket", pa.int32())]),
+        flavor="hive",
+    )
+
+    @classmethod
+    def bucket(cls, geoname_id: int) -> int:
+        return int(geoname_id) % cls.BUCKETS
+
+    @classmethod
+    def _partition_dir(cls, year: int, bucket: int) -> Path:
+        return cls.root / f"year={year}" / f"city_bucket={bucket}"
+
+    @classmethod
+    def _write_part(cls, directory: Path, df: pd.DataFrame) -> Path:
+        """Écrit un nouveau fichier de partition, nommé après tous les existants"""
+        name = f"part-{time.time_ns():020d}-{next(cls._sequence):06d}.parquet"
+        table = pa.Table.from_pandas(df, schema=cls.SCHEMA, preserve_index=False)
+        directory.mkdir(parents=True, exist_ok=True)
+        # Préfixe "." : fichier temporaire ignoré par les lectures du dataset
+        tmp = directory / f".{name}.tmp"
+        pq.write_table(table, tmp)
+        os.replace(tmp, directory / name)
+        return directory / name
+
+    @staticmethod
+    def _parts(directory: Path) -> list:
+        """Fichiers d'une partition, du plus ancien au plus récent"""
+        return sorted(directory.glob("part-*.parquet"))
+
+    @classmethod
+    def write(cls, daily_df: pd.DataFrame) -> int:
+        """
+        Ajoute des relevés quotidiens au dataset : un fichier par partition
+        touchée, sans relire les fichiers existants (la nouvelle valeur remplace
+        l'ancienne à la lecture pour un même (geoname_id, date)).
+
+        Args:
+            daily_df: Colonnes geoname_id, date, tmax, tmin, precip_sum
+
+        Returns:
+            Nombre de lignes écrites (nouvelles ou remplacées)
+        """
+        if daily_df is None or daily_df.empty:
+            return 0
+
+        df = daily_df[["geoname_id", "date", "tmax", "tmin", "precip_sum"]].copy()
+        df["geoname_id"] = df["geoname_id"].astype("int64")
+        df["date"] = pd.to_datetime(df["date"])
+        year = df["date"].dt.year.to_numpy()
+        bucket = (df["geoname_id"] % cls.BUCKETS).to_numpy()
+
+        for (y, b), part in df.groupby([year, bucket], sort=False):
+            part = part.drop_duplicates(["geoname_id", "date"], keep="last")
+            part = part.sort_values(["geoname_id", "date"])
+            cls._write_part(cls._partition_dir(int(y), int(b)), part)
+
+        return len(df)
+
+    @classmethod
+    def compact(cls) -> int:
+        """
+        Regroupe les fichiers de chaque partition en un seul (dernière valeur
+        conservée par (geoname_id, date)). Le fichier fusionné est écrit avant
+        la suppression des anciens : une lecture concurrente reste cohérente.
+
+        Returns:
+            Nombre de partitions compactées
+        """
+        if not cls.root.exists():
+            return 0
+        compacted = 0
+        for directory in sorted(cls.root.glob("year=*/city_bucket=*")):
+            parts = cls._parts(directory)
+            if len(parts) < 2:
+                continue
+            df = pd.concat(
+                (pq.read_table(p).to_pandas() for p in parts), ignore_index=True
+            )
+            df = df.drop_duplicates(["geoname_id", "date"], keep="last")
+            cls._write_part(directory, df.sort_values(["geoname_id", "date"]))
+            for p in parts:
+                p.unlink()
+            compacted += 1
+        return compacted
+
+    @classmethod
+    def read(
+        cls,
+        geoname_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> pd.DataFrame:
+        """
+        Relevés quotidiens d'une ville sur [start_date, end_date] (bornes incluses).
+
+        Returns:
+            DataFrame trié par date (vide si aucune donnée)
+        """
+        empty = cls.SCHEMA.empty_table().to_pandas()
+        if not cls.root.exists():
+            return empty
+
+        # Partitions (élagage des dossiers) puis lignes (statistiques des row groups)
+        part_flt = ds.field("city_bucket") == cls.bucket(geoname_id)
+        row_flt = ds.field("geoname_id") == int(geoname_id)
+        if start_date is not None:
+            part_flt = part_flt & (ds.field("year") >= start_date.year)
+            row_flt = row_flt & (ds.field("date") >= pa.scalar(start_date, pa.date32()))
+        if end_date is not None:
+            part_flt = part_flt & (ds.field("year") <= end_date.year)
+            row_flt = row_flt & (ds.field("date") <= pa.scalar(end_date, pa.date32()))
+
+        dataset = ds.dataset(
+            cls.root, format="parquet", partitioning=cls.PARTITIONING
+        )
+        # Fichiers lus dans l'ordre d'écriture : le dernier l'emporte
+        fragments = sorted(
+            dataset.get_fragments(filter=part_flt), key=lambda f: f.path
+        )
+        tables = [
+            f.to_table(columns=cls.SCHEMA.names, filter=row_flt) for f in fragments
+        ]
+        tables = [t for t in tables if t.num_rows]
+        if not tables:
+            return empty
+        df = pa.concat_tables(tables).to_pandas()
+        df = df.drop_duplicates(["geoname_id", "date"], keep="last")
+        return df.sort_values("date").reset_index(drop=True)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+from typing import Iterable, List, Optional
+from models.meteo_normal import MeteoNormal
+from connexion.mysql_connect import MySQLConnection
+from orm.week_meteo_orm import WeekMeteoOrm
+
+
+class MeteoNormalsOrm:
+    """Accès table Meteo_Normals (clé primaire: geoname_id + iso_week)."""
+
+    COLUMNS = """
+        geoname_id, iso_week, years_count, first_year, last_year,
+        temperature_max_mean, temperature_max_min, temperature_max_max,
+        temperature_min_mean, temperature_min_min, temperature_min_max,
+        precipitation_mean, precipitation_min, precipitation_max
+    """
+
+    # Agrégat pluriannuel de Meteo_Weekly ; WEEK(..., 3) = semaine ISO (lundi, 1..53)
+    # et YEARWEEK(..., 3) DIV 100 = année ISO correspondante. Seules les périodes
+    # complètes sont agrégées (WeekMeteoOrm.full_week_condition).
+    AGGREGATE_SELECT = f"""
+        SELECT geoname_id,
+               WEEK(week_end_date, 3) AS iso_week,
+               COUNT(DISTINCT YEARWEEK(week_end_date, 3) DIV 100) AS years_count,
+               MIN(YEARWEEK(week_end_date, 3) DIV 100) AS first_year,
+               MAX(YEARWEEK(week_end_date, 3) DIV 100) AS last_year,
+               AVG(temperature_max_avg), MIN(temperature_max_avg), MAX(temperature_max_avg),
+               AVG(temperature_min_avg), MIN(temperature_min_avg), MAX(temperature_min_avg),
+               AVG(precipitation_sum), MIN(precipitation_sum), MAX(precipitation_sum)
+        FROM Meteo_Weekly
+        WHERE {WeekMeteoOrm.full_week_condition()}
+    """
+
+    @staticmethod
+    def get_for_city(
+        geoname_id: int, iso_week: Optional[int] = None
+    ) -> List[MeteoNormal]:
+        """
+        Normales d'une ville (toutes les semaines ou une seule).
+        Lecture par clé primaire (geoname_id, iso_week).
+        """
+        MySQLConnection.connect()
+        if iso_week is not None:
+            q = f"""
+                SELECT {MeteoNormalsOrm.COLUMNS}
+                FROM Meteo_Normals
+                WHERE geoname_id = %s AND iso_week = %s
+            """
+            params = (geoname_id, iso_week)
+        else:
+            q = f"""
+                SELECT {MeteoNormalsOrm.COLUMNS}
+                FROM Meteo_Normals
+                WHERE geoname_id = %s
+                ORDER BY iso_week ASC
+            """
+            params = (geoname_id,)
+        rows = MySQLConnection.execute_query(q, params)
+        return [MeteoNormal.from_dict(r) for r in rows]
+
+    @staticmethod
+    def refresh_for_cities(
+        geoname_ids: Optional[Iterable[int]] = None, chunk_size: int = 500
+    ) -> int:
+        """
+        Recalcule les normales des villes données depuis Meteo_Weekly
+        (toutes les villes si geoname_ids est None), dans une transaction unique.
+        Les lignes existantes des villes concernées sont remplacées.
+
+        Returns:
+            Nombre de lignes (ville, semaine) recalculées
+        """
+        MySQLConnection.connect()
+        insert = f"INSERT INTO Meteo_Normals ({MeteoNormalsOrm.COLUMNS}) "
+        group = " GROUP BY geoname_id, iso_week"
+
+        if geoname_ids is None:
+            MySQLConnection.execute_update("DELETE FROM Meteo_Normals")
+            count = MySQLConnection.execute_update(
+                insert + MeteoNormalsOrm.AGGREGATE_SELECT + group
+            )
+            MySQLConnection.commit()
+            return count
+
+        ids = sorted({int(g) for g in geoname_ids})
+        count = 0
+        for i in range(0, len(ids), chunk_size):
+            chunk = ids[i : i + chunk_size]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            where = f" WHERE geoname_id IN ({placeholders})"
+            MySQLConnection.execute_update(
+                "DELETE FROM Meteo_Normals" + where, tuple(chunk)
+            )
+            count += MySQLConnection.execute_update(
+                insert
+                + MeteoNormalsOrm.AGGREGATE_SELECT
+                + f" AND geoname_id IN ({placeholders})"
+                + group,
+                tuple(chunk),
+            )
+        MySQLConnection.commit()
+        return count
@@ -52,8 +52,8 @@ class VilleOrm:
         MySQLConnection.connect()
         query = """
             INSERT INTO Villes 
-            (geoname_id, name_en, latitude, longitude, country_3166a2,is_capital)
-            VALUES (%s, %s, %s, %s, %s,%s)
+            (geoname_id, name_en, latitude, longitude, country_3166a2,is_capital,population)
+            VALUES (%s, %s, %s, %s, %s,%s, %s)
         """
         params = (
             ville_data["geoname_id"],
@@ -62,6 +62,7 @@ class VilleOrm:
             ville_data.get("longitude"),
             ville_data.get("country_3166a2"),
             ville_data.get("is_capital"),
+            ville_data.get("population"),
         )
 
         MySQLConnection.execute_update(query, params)
@@ -119,14 +120,16 @@ class VilleOrm:
             return 0
         query = """
             INSERT INTO Villes
-            (geoname_id, name_en, latitude, longitude, country_3166a2, is_capital)
-            VALUES (%s, %s, %s, %s, %s, %s)
+            (geoname_id, name_en, latitude, longitude, country_3166a2, is_capital,
+             population)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
             ON DUPLICATE KEY UPDATE
                 name_en = VALUES(name_en),
                 latitude = VALUES(latitude),
                 longitude = VALUES(longitude),
                 country_3166a2 = VALUES(country_3166a2),
-                is_capital = VALUES(is_capital)
+                is_capital = VALUES(is_capital),
+                population = VALUES(population)
         """
         values = [
             (
@@ -136,6 +139,7 @@ class VilleOrm:
                 record.get("longitude"),
                 record.get("country_3166a2", ""),
                 record.get("is_capital"),
+                record.get("population", record.get("pop")),
             )
             for record in villes_data
         ]
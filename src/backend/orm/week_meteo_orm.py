@@ -1,6 +1,6 @@
 from __future__ import annotations
-from typing import List, Optional, Iterable, Tuple
-from datetime import date
+from typing import Dict, List, Optional, Iterable, Sequence, Tuple
+from datetime import date, datetime
 from models.week_meteo import WeekMeteo
 from connexion.mysql_connect import MySQLConnection
 
@@ -8,6 +8,18 @@ from connexion.mysql_connect import MySQLConnection
 class WeekMeteoOrm:
     """Accès table Meteo_Weekly (clé unique: geoname_id + week_start_date)."""
 
+    UPSERT_QUERY = """
+        INSERT INTO Meteo_Weekly
+        (geoname_id, week_start_date, week_end_date,
+         temperature_max_avg, temperature_min_avg, precipitation_sum)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+          week_end_date = VALUES(week_end_date),
+          temperature_max_avg = VALUES(temperature_max_avg),
+          temperature_min_avg = VALUES(temperature_min_avg),
+          precipitation_sum = VALUES(precipitation_sum)
+    """
+
     @staticmethod
     def get_by_pk(geoname_id: int, week_start_date: date) -> Optional[WeekMeteo]:
         MySQLConnection.connect()
@@ -50,6 +62,38 @@ class WeekMeteoOrm:
         rows = MySQLConnection.execute_query(q, params)
         return [WeekMeteo.from_dict(r) for r in rows]
 
+    @staticmethod
+    def get_range_many(
+        geoname_ids: Sequence[int],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[WeekMeteo]:
+        """
+        Semaines de plusieurs villes en une requête (WHERE geoname_id IN (...)),
+        triées par ville puis par date. Bornes de dates optionnelles et inclusives.
+        """
+        if not geoname_ids:
+            return []
+        MySQLConnection.connect()
+        placeholders = ", ".join(["%s"] * len(geoname_ids))
+        conditions = [f"geoname_id IN ({placeholders})"]
+        params = list(geoname_ids)
+        if start_date:
+            conditions.append("week_start_date >= %s")
+            params.append(start_date)
+        if end_date:
+            conditions.append("week_end_date <= %s")
+            params.append(end_date)
+        q = f"""
+            SELECT geoname_id, week_start_date, week_end_date,
+                   temperature_max_avg, temperature_min_avg, precipitation_sum
+            FROM Meteo_Weekly
+            WHERE {" AND ".join(conditions)}
+            ORDER BY geoname_id, week_start_date ASC
+        """
+        rows = MySQLConnection.execute_query(q, tuple(params))
+        return [WeekMeteo.from_dict(r) for r in rows]
+
     @staticmethod
     def get_all(skip: int = 0, limit: int = 100) -> List[WeekMeteo]:
         MySQLConnection.connect()
@@ -63,6 +107,17 @@ class WeekMeteoOrm:
         rows = MySQLConnection.execute_query(q, (limit, skip))
         return [WeekMeteo.from_dict(r) for r in rows]
 
+    @staticmethod
+    def get_all_rows() -> List[dict]:
+        """Toute la table (lignes brutes), pour l'export du cube météo."""
+        MySQLConnection.connect()
+        q = """
+            SELECT geoname_id, week_start_date, week_end_date,
+                   temperature_max_avg, temperature_min_avg, precipitation_sum
+            FROM Meteo_Weekly
+        """
+        return MySQLConnection.execute_query(q)
+
     @staticmethod
     def get_existing_geoname_ids() -> set:
         """
@@ -78,19 +133,78 @@ class WeekMeteoOrm:
         return {row["geoname_id"] for row in rows}
 
     @staticmethod
-    def upsert(item: WeekMeteo) -> WeekMeteo:
+    def get_watermarks() -> Dict[int, date]:
+        """
+        Dernière date couverte par ville (MAX(week_end_date)).
+        Sert de filigrane pour le rafraîchissement incrémental de l'ETL météo.
+
+        Returns:
+            dict: {geoname_id: dernière week_end_date}
+        """
+        MySQLConnection.connect()
+        q = """
+            SELECT geoname_id, MAX(week_end_date) AS last_date
+            FROM Meteo_Weekly
+            GROUP BY geoname_id
+        """
+        rows = MySQLConnection.execute_query(q)
+        return {row["geoname_id"]: row["last_date"] for row in rows}
+
+    @staticmethod
+    def get_signature() -> Tuple[int, Optional[date], Optional[date], Optional[datetime]]:
+        """
+        Empreinte légère de la table (nombre de lignes, dates extrêmes,
+        dernière modification) : permet de savoir si une copie en mémoire est
+        encore à jour. updated_at couvre les mises à jour de valeurs qui ne
+        changent ni le nombre de lignes ni les dates.
+        """
         MySQLConnection.connect()
         q = """
-            INSERT INTO Meteo_Weekly
-            (geoname_id, week_start_date, week_end_date,
-             temperature_max_avg, temperature_min_avg, precipitation_sum)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-              week_end_date = VALUES(week_end_date),
-              temperature_max_avg = VALUES(temperature_max_avg),
-              temperature_min_avg = VALUES(temperature_min_avg),
-              precipitation_sum = VALUES(precipitation_sum)
+            SELECT COUNT(*) AS n, MIN(week_end_date) AS first_date,
+                   MAX(week_end_date) AS last_date, MAX(updated_at) AS updated_at
+            FROM Meteo_Weekly
+        """
+        rows = MySQLConnection.execute_query(q)
+        if not rows:
+            return (0, None, None, None)
+        row = rows[0]
+        return (int(row["n"]), row["first_date"], row["last_date"], row["updated_at"])
+
+    @staticmethod
+    def full_week_condition(alias: str = "") -> str:
         """
+        Prédicat SQL des périodes complètes (14 jours finissant un dimanche) :
+        une ligne par (ville, semaine ISO). Écarte la période incomplète qui
+        clôt un ETL (ex. 18 -> mardi 31/12, rangée sinon en semaine 1 de l'année
+        ISO suivante). Partagé par les normales et la matrice des scores.
+        """
+        p = f"{alias}." if alias else ""
+        return (
+            f"DAYOFWEEK({p}week_end_date) = 1 "
+            f"AND DATEDIFF({p}week_end_date, {p}week_start_date) = 13"
+        )
+
+    @staticmethod
+    def get_week_metrics() -> List[dict]:
+        """
+        Toutes les semaines météo complètes avec la ville (nom, pays) et la
+        semaine ISO de fin de période, pour la construction de la matrice
+        ville x semaine (voir full_week_condition).
+        """
+        MySQLConnection.connect()
+        q = f"""
+            SELECT m.geoname_id, v.name_en, v.country_3166a2,
+                   WEEK(m.week_end_date, 3) AS iso_week,
+                   m.temperature_max_avg, m.temperature_min_avg, m.precipitation_sum
+            FROM Meteo_Weekly m
+            JOIN Villes v ON v.geoname_id = m.geoname_id
+            WHERE {WeekMeteoOrm.full_week_condition("m")}
+        """
+        return MySQLConnection.execute_query(q)
+
+    @staticmethod
+    def upsert(item: WeekMeteo) -> WeekMeteo:
+        MySQLConnection.connect()
         params = (
             item.geoname_id,
             item.week_start_date,
@@ -99,27 +213,12 @@ class WeekMeteoOrm:
             item.temperature_min_avg,
             item.precipitation_sum,
         )
-        MySQLConnection.execute_update(q, params)
+        MySQLConnection.execute_update(WeekMeteoOrm.UPSERT_QUERY, params)
         MySQLConnection.commit()
         return WeekMeteoOrm.get_by_pk(item.geoname_id, item.week_start_date)
 
     @staticmethod
     def bulk_upsert(items: Iterable[WeekMeteo]) -> int:
-        items = list(items)
-        if not items:
-            return 0
-        MySQLConnection.connect()
-        q = """
-            INSERT INTO Meteo_Weekly
-            (geoname_id, week_start_date, week_end_date,
-             temperature_max_avg, temperature_min_avg, precipitation_sum)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-              week_end_date = VALUES(week_end_date),
-              temperature_max_avg = VALUES(temperature_max_avg),
-              temperature_min_avg = VALUES(temperature_min_avg),
-              precipitation_sum = VALUES(precipitation_sum)
-        """
         values = [
             (
                 it.geoname_id,
@@ -131,8 +230,61 @@ class WeekMeteoOrm:
             )
             for it in items
         ]
-        # executemany géré dans MySQLConnection.execute_update(...)
-        rowcount = MySQLConnection.execute_update(q, values)
+        return WeekMeteoOrm.bulk_upsert_rows(values)
+
+    @staticmethod
+    def _upsert_chunks(rows: Sequence[Tuple], chunk_size: int) -> int:
+        rowcount = 0
+        for i in range(0, len(rows), chunk_size):
+            # executemany géré dans MySQLConnection.execute_update(...)
+            rowcount += MySQLConnection.execute_update(
+                WeekMeteoOrm.UPSERT_QUERY, rows[i : i + chunk_size]
+            )
+        return rowcount
+
+    @staticmethod
+    def bulk_upsert_rows(rows: Sequence[Tuple], chunk_size: int = 5000) -> int:
+        """
+        Upsert de tuples déjà prêts (geoname_id, week_start_date, week_end_date,
+        temperature_max_avg, temperature_min_avg, precipitation_sum),
+        par paquets de chunk_size lignes, dans une transaction unique.
+
+        Returns:
+            Somme des rowcount MySQL (1 par insertion, 2 par mise à jour)
+        """
+        if not rows:
+            return 0
+        MySQLConnection.connect()
+        rowcount = WeekMeteoOrm._upsert_chunks(rows, chunk_size)
+        MySQLConnection.commit()
+        return rowcount
+
+    @staticmethod
+    def replace_after(
+        cuts: Sequence[Tuple[int, date]],
+        rows: Sequence[Tuple],
+        chunk_size: int = 5000,
+    ) -> int:
+        """
+        Rafraîchissement incrémental : supprime, pour chaque ville, les semaines
+        terminant après sa date de coupure (semaine partielle recalculée),
+        puis upsert les nouvelles lignes, dans une transaction unique.
+
+        Args:
+            cuts: Tuples (geoname_id, date de coupure)
+            rows: Tuples au format de bulk_upsert_rows
+            chunk_size: Lignes par executemany
+
+        Returns:
+            Somme des rowcount MySQL de l'upsert
+        """
+        if not cuts and not rows:
+            return 0
+        MySQLConnection.connect()
+        if cuts:
+            q = "DELETE FROM Meteo_Weekly WHERE geoname_id = %s AND week_end_date > %s"
+            MySQLConnection.execute_update(q, list(cuts))
+        rowcount = WeekMeteoOrm._upsert_chunks(rows, chunk_size)
         MySQLConnection.commit()
         return rowcount
 
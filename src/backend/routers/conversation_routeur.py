@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
-from typing import List
+from typing import List, Optional
 from bson.errors import InvalidId
+from pymongo.errors import DuplicateKeyError
 from connexion.mongo_connect import MongoDBConnection
 from services.conversation_service import ConversationService
+from services.phrase_search_service import PhraseSearchService
 
 # from connexion.mysql_connect import MySQLConnection
 from orm.conversation_orm import ConversationOrm
@@ -13,6 +15,8 @@ from schemas.conversation_dto import (
     ConversationCreateRequest,
     ConversationUpdateRequest,
     ConversationListResponse,
+    PhraseMatchResponse,
+    PhrasePivotResponse,
 )
 from security.security import Security
 
@@ -23,27 +27,141 @@ router = APIRouter(prefix="/api/conversations", tags=["Conversations"])
     "",
     response_model=ConversationListResponse,
     summary="Liste toutes les conversations",
-    description="Retourne toutes les conversations avec pagination",
+    description=(
+        "Retourne les conversations par pages triées par _id : passer `next_cursor` "
+        "de la réponse en `after` pour la page suivante. `skip` reste accepté "
+        "(sans `after`) mais parcourt les documents ignorés. `total` est lu dans "
+        "les métadonnées de la collection."
+    ),
     responses={
         200: {"description": "Liste des conversations"},
+        400: {"description": "Curseur invalide"},
         500: {"description": "Erreur serveur"},
     },
 )
 def get_all_conversations(
     skip: int = Query(0, ge=0, description="Nombre de conversations à ignorer"),
     limit: int = Query(100, ge=1, le=500, description="Nombre max de conversations"),
+    after: Optional[str] = Query(
+        None, description="Curseur : _id de la dernière conversation reçue"
+    ),
 ):
     try:
         MongoDBConnection.connect()
 
-        conversations = ConversationOrm.find_all(limit=limit, skip=skip)
-        total = ConversationOrm.count_all()
+        if after or not skip:
+            conversations = ConversationOrm.find_page(after=after, limit=limit)
+        else:
+            conversations = ConversationOrm.find_all(limit=limit, skip=skip)
+        total = ConversationOrm.count_estimated()
+
+        next_cursor = None
+        if len(conversations) == limit:
+            next_cursor = str(conversations[-1]["_id"])
 
         return ConversationListResponse(
             total=total,
             conversations=[
                 ConversationResponse.from_mongo(conv) for conv in conversations
             ],
+            next_cursor=next_cursor,
+        )
+    except InvalidId:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Curseur invalide: '{after}'",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erreur serveur: {str(e)}",
+        )
+    finally:
+        MongoDBConnection.close()
+
+
+@router.get(
+    "/search",
+    response_model=List[PhraseMatchResponse],
+    summary="Recherche plein texte dans les phrases",
+    description=(
+        "Recherche `q` dans les phrases de toutes les langues (ou de `langs`, "
+        "ex: `fra,spa`) via un index inversé sur le texte normalisé (sans accents, "
+        "minuscules, sans ponctuation). Retourne les triplets (langue, clé, phrase) "
+        "classés par pertinence (BM25)."
+    ),
+    responses={
+        200: {"description": "Phrases trouvées"},
+        400: {"description": "Requête ou codes langue invalides"},
+        500: {"description": "Erreur serveur"},
+    },
+)
+def search_phrases(
+    q: str = Query(..., min_length=1, max_length=200, description="Texte recherché"),
+    langs: Optional[str] = Query(
+        None, description="Codes ISO 639-2 séparés par des virgules (ex: fra,spa)"
+    ),
+    limit: int = Query(20, ge=1, le=200, description="Nombre max de résultats"),
+):
+    try:
+        lang_codes = PhraseSearchService.parse_langs(langs)
+        MongoDBConnection.connect()
+        return PhraseSearchService.search(q, lang_codes, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erreur serveur: {str(e)}",
+        )
+    finally:
+        MongoDBConnection.close()
+
+
+@router.get(
+    "/phrase/{key}",
+    response_model=PhrasePivotResponse,
+    summary="Une phrase dans plusieurs langues",
+    description=(
+        "Retourne la phrase `key` (ex: THANK_YOU) dans les langues `langs` "
+        "(ex: `fra,spa,deu`, toutes si absent) en une requête MongoDB projetée sur "
+        "`sentences.<key>`. Les langues demandées sans cette phrase sont listées "
+        "dans `missing`."
+    ),
+    responses={
+        200: {"description": "Traductions de la phrase"},
+        400: {"description": "Codes langue invalides"},
+        404: {"description": "Phrase absente de toutes les langues demandées"},
+        500: {"description": "Erreur serveur"},
+    },
+)
+def get_phrase(
+    key: str = Path(
+        ...,
+        pattern=PhraseSearchService.KEY_PATTERN.pattern,
+        description="Clé de la phrase (ex: THANK_YOU)",
+    ),
+    langs: Optional[str] = Query(
+        None, description="Codes ISO 639-2 séparés par des virgules (ex: fra,spa,deu)"
+    ),
+):
+    try:
+        lang_codes = PhraseSearchService.parse_langs(langs)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    try:
+        MongoDBConnection.connect()
+        return PhraseSearchService.get_phrase(key, lang_codes)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
         )
     except Exception as e:
         raise HTTPException(
@@ -136,6 +254,7 @@ def get_conversations_by_lang(
     responses={
         201: {"description": "Conversation créée"},
         400: {"description": "Données invalides"},
+        409: {"description": "Une conversation existe déjà pour cette langue"},
         500: {"description": "Erreur serveur"},
     },
 )
@@ -156,6 +275,14 @@ def create_conversation(
             "id": conversation_id,
             "lang639-2": lang_code,
         }
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                "Une conversation existe déjà pour la langue "
+                f"'{conversation.lang639_2}'"
+            ),
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -192,8 +319,8 @@ def update_conversation(
     try:
         MongoDBConnection.connect()
 
-        # Vérifier que la conversation existe
-        existing = ConversationOrm.find_by_id(conversation_id)
+        # Vérifier que la conversation existe (seul l'_id est relu)
+        existing = ConversationOrm.find_by_id(conversation_id, {"_id": 1})
         if not existing:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -219,7 +346,7 @@ def update_conversation(
             )
 
         # Exécuter la mise à jour
-        modified_count = ConversationOrm.update(conversation_id, update_data)
+        modified_count = ConversationService.update(conversation_id, update_data)
 
         return {
             "message": f"Conversation '{conversation_id}' mise à jour avec succès",
@@ -268,8 +395,8 @@ def replace_conversation(
     try:
         MongoDBConnection.connect()
 
-        # Vérifier que la conversation existe
-        existing = ConversationOrm.find_by_id(conversation_id)
+        # Vérifier que la conversation existe (lang639-2 suffit au verrouillage)
+        existing = ConversationOrm.find_by_id(conversation_id, {"lang639-2": 1})
         if not existing:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -290,7 +417,7 @@ def replace_conversation(
 
         # Remplacer (sans modifier l'_id)
         update_data = {"$set": conversation_data}
-        modified_count = ConversationOrm.update(conversation_id, update_data)
+        modified_count = ConversationService.update(conversation_id, update_data)
 
         return {
             "message": f"Conversation '{conversation_id}' remplacée avec succès",
@@ -337,7 +464,7 @@ def delete_conversation(
         MongoDBConnection.connect()
 
         # Vérifier que la conversation existe et récupérer lang639-2
-        existing = ConversationOrm.find_by_id(conversation_id)
+        existing = ConversationOrm.find_by_id(conversation_id, {"lang639-2": 1})
         if not existing:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1,6 +1,12 @@
-from typing import List
+from datetime import date
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from schemas.country_dto import CountryCreate, CountryUpdate, CountryResponse
+from schemas.country_dto import (
+    CountryCreate,
+    CountryUpdate,
+    CountryResponse,
+    CountryMeteoWeekResponse,
+)
 from services.country_service import CountryService
 
 # from repositories.country_repository import CountryOrm
@@ -38,6 +44,44 @@ def get_country_by_id(alpha2: str):
         raise HTTPException(status_code=status_code, detail=str(e))
 
 
+@router.get(
+    "/{alpha2}/meteo",
+    response_model=List[CountryMeteoWeekResponse],
+    summary="Agrégats météo hebdomadaires d'un pays",
+    description=(
+        "Agrège en SQL les relevés hebdomadaires de toutes les villes du pays : "
+        "moyenne, minimum et maximum par période. `weighted=true` pondère les "
+        "moyennes par la population des villes. Résultat mis en cache 10 minutes."
+    ),
+    responses={
+        200: {"description": "Une ligne par période, dans l'ordre chronologique"},
+        400: {"description": "Code pays invalide"},
+        404: {"description": "Aucune donnée météo pour ce pays"},
+        422: {"description": "Format des données incompatible"},
+    },
+)
+def get_country_meteo(
+    alpha2: str,
+    start_date: Optional[date] = Query(
+        None, description="Date de début (incluse) au format ISO, ex: 2024-01-01."
+    ),
+    end_date: Optional[date] = Query(
+        None, description="Date de fin (incluse) au format ISO, ex: 2024-12-31."
+    ),
+    weighted: bool = Query(
+        False, description="Pondérer les moyennes par la population des villes."
+    ),
+):
+    """
+    Météo d'un pays par période, agrégée sur ses villes (ex: 'fr', 'jp')
+    """
+    try:
+        return CountryService.get_meteo(alpha2, start_date, end_date, weighted)
+    except ValueError as e:
+        status_code = 400 if "2 caractères" in str(e) else 404
+        raise HTTPException(status_code=status_code, detail=str(e))
+
+
 @router.get(
     "/by_name/{name}",
     response_model=List[CountryResponse],
@@ -4,6 +4,7 @@ from services.langue_service import LangueService
 from schemas.langue_dto import (
     LangueResponse,
     LangueCreateRequest,
+    LangueBulkRequest,
     LangueUpdateRequest,
     map_to_response,
 )
@@ -125,6 +126,40 @@ def create_or_replace_langue(
         )
 
 
+@router.put(
+    "/bulk",
+    response_model=dict,
+    status_code=status.HTTP_201_CREATED,
+    summary="Créer ou remplacer des langues en masse",
+    description=(
+        "Insère ou remplace plusieurs langues en une transaction : familles chargées "
+        "une fois, REPLACE INTO multi-lignes par paquets"
+    ),
+    responses={
+        201: {"description": "Langues créées ou remplacées"},
+        500: {"description": "Erreur serveur lors de la création"},
+    },
+)
+def create_or_replace_langues_bulk(
+    payload: LangueBulkRequest, _=Depends(Security.secured_route)
+):
+    """Crée ou remplace plusieurs langues"""
+    try:
+        rows_affected = LangueService.create_or_replace_batch(
+            [langue.model_dump() for langue in payload.items]
+        )
+
+        return {
+            "message": f"{len(payload.items)} langues créées/remplacées avec succès",
+            "rows_affected": rows_affected,
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erreur lors de la création: {str(e)}",
+        )
+
+
 @router.patch(
     "/{iso639_2}",
     response_model=dict,
@@ -0,0 +1,166 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from schemas.travel_score_dto import (
+    WeekScoreResponse,
+    CityScoreResponse,
+    SimilarCityResponse,
+)
+from models.travel_score import ComfortProfile
+from services.travel_score_service import TravelScoreService
+
+router = APIRouter(
+    prefix="/api/meteo/scores",
+    tags=["Météo - Meilleure période"],
+)
+
+
+def comfort_profile(
+    ideal_temp: float = Query(24.0, description="T° max idéale (°C)."),
+    temp_tolerance: float = Query(
+        6.0, gt=0, description="Tolérance autour de la T° idéale (°C)."
+    ),
+    rain_tolerance: float = Query(
+        20.0, gt=0, description="Cumul de pluie toléré (mm sur 14 jours)."
+    ),
+    rain_weight: float = Query(
+        0.3, ge=0, le=1, description="Poids de la pluie dans le score (0 à 1)."
+    ),
+) -> ComfortProfile:
+    """Préférences de confort lues depuis la query string"""
+    return ComfortProfile(
+        ideal_temp=ideal_temp,
+        temp_tolerance=temp_tolerance,
+        rain_tolerance=rain_tolerance,
+        rain_weight=rain_weight,
+    )
+
+
+@router.get(
+    "/city/{geoname_id}",
+    response_model=List[WeekScoreResponse],
+    summary="Meilleures semaines pour une ville",
+    description=(
+        "Note chaque semaine ISO de la ville (score de confort 0-100 selon la T° max "
+        "et les précipitations moyennes de toutes les années chargées) et renvoie "
+        "les `limit` meilleures."
+    ),
+    responses={
+        200: {"description": "Semaines triées par score décroissant."},
+        404: {"description": "Aucune donnée météo pour cette ville."},
+        422: {"description": "Paramètres invalides."},
+    },
+)
+def top_weeks_for_city(
+    geoname_id: int,
+    limit: int = Query(5, ge=1, le=53, description="Nombre de semaines (1 à 53)."),
+    profile: ComfortProfile = Depends(comfort_profile),
+):
+    """
+    Classement des semaines ISO de `geoname_id` selon `profile`.
+    """
+    try:
+        return TravelScoreService.top_weeks_for_city(geoname_id, profile, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get(
+    "/country/{alpha2}",
+    response_model=List[WeekScoreResponse],
+    summary="Meilleures semaines pour un pays",
+    description=(
+        "Score moyen des villes du pays pour chaque semaine ISO ; "
+        "`cities_count` indique le nombre de villes notées."
+    ),
+    responses={
+        200: {"description": "Semaines triées par score moyen décroissant."},
+        404: {"description": "Aucune donnée météo pour ce pays."},
+        422: {"description": "Paramètres invalides."},
+    },
+)
+def top_weeks_for_country(
+    alpha2: str = Path(
+        ..., min_length=2, max_length=2, description="Code ISO 3166-1 alpha-2, ex: FR."
+    ),
+    limit: int = Query(5, ge=1, le=53, description="Nombre de semaines (1 à 53)."),
+    profile: ComfortProfile = Depends(comfort_profile),
+):
+    """
+    Classement des semaines ISO pour le pays `alpha2` selon `profile`.
+    """
+    try:
+        return TravelScoreService.top_weeks_for_country(alpha2, profile, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get(
+    "/week/{iso_week}",
+    response_model=List[CityScoreResponse],
+    summary="Meilleures villes pour une semaine",
+    description=(
+        "Classe toutes les villes pour la semaine ISO demandée, "
+        "éventuellement restreintes à un pays (`country`)."
+    ),
+    responses={
+        200: {"description": "Villes triées par score décroissant."},
+        404: {"description": "Aucune donnée météo pour cette semaine."},
+        422: {"description": "Paramètres invalides."},
+    },
+)
+def top_cities_for_week(
+    iso_week: int = Path(..., ge=1, le=53, description="Semaine ISO (1 à 53)."),
+    limit: int = Query(10, ge=1, le=500, description="Nombre de villes (1 à 500)."),
+    country: Optional[str] = Query(
+        None, min_length=2, max_length=2, description="Filtre pays (alpha-2)."
+    ),
+    profile: ComfortProfile = Depends(comfort_profile),
+):
+    """
+    Classement des villes pour `iso_week` selon `profile`.
+    """
+    try:
+        return TravelScoreService.top_cities_for_week(
+            iso_week, profile, limit, country
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get(
+    "/similar/{geoname_id}",
+    response_model=List[SimilarCityResponse],
+    summary="Villes au climat proche d'une ville",
+    description=(
+        "Compare le profil météo (T° max, T° min, précipitations, centrées-réduites) "
+        "de la ville de référence à celui de toutes les villes, pour une semaine ISO "
+        "(`week`) ou un mois (`month`), et renvoie les `limit` plus proches."
+    ),
+    responses={
+        200: {"description": "Villes triées par distance climatique croissante."},
+        404: {"description": "Aucune donnée météo pour cette ville sur la période."},
+        422: {"description": "Paramètres invalides (préciser `week` ou `month`)."},
+    },
+)
+def similar_cities(
+    geoname_id: int,
+    week: Optional[int] = Query(None, ge=1, le=53, description="Semaine ISO (1 à 53)."),
+    month: Optional[int] = Query(None, ge=1, le=12, description="Mois (1 à 12)."),
+    limit: int = Query(10, ge=1, le=500, description="Nombre de villes (1 à 500)."),
+    country: Optional[str] = Query(
+        None, min_length=2, max_length=2, description="Filtre pays (alpha-2)."
+    ),
+):
+    """
+    Villes dont le climat sur `week` ou `month` ressemble le plus à `geoname_id`.
+    """
+    if (week is None) == (month is None):
+        raise HTTPException(
+            status_code=422, detail="Préciser une semaine ISO ou un mois"
+        )
+    try:
+        return TravelScoreService.similar_cities(
+            geoname_id, week, month, limit, country
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
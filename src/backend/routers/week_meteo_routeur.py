@@ -6,6 +6,9 @@ from schemas.week_meteo_dto import (
     WeekMeteoUpdate,
     WeekMeteoResponse,
     WeekMeteoBulkCreate,
+    WeekMeteoBatchResponse,
+    MeteoAggregateResponse,
+    MeteoNormalResponse,
 )
 from models.week_meteo import WeekMeteo
 from services.meteo_service import MeteoService
@@ -17,6 +20,48 @@ router = APIRouter(
 )
 
 
+@router.get(
+    "/batch",
+    response_model=List[WeekMeteoBatchResponse],
+    summary="Semaines météo de plusieurs villes",
+    description=(
+        "Retourne les relevés hebdomadaires de plusieurs villes en une seule requête, "
+        "groupés par ville dans l'ordre de `ids` (liste de geoname_id séparés par des "
+        "virgules, 100 au maximum). Une ville sans données a une liste `weeks` vide.\n\n"
+        "`start_date` et `end_date` (inclusives) sont optionnelles et indépendantes."
+    ),
+    responses={
+        200: {"description": "Semaines groupées par ville."},
+        422: {"description": "Liste d'IDs ou dates invalides."},
+    },
+)
+def get_weeks_for_cities(
+    ids: str = Query(
+        ...,
+        pattern=r"^\d+(,\d+)*$",
+        description="geoname_id séparés par des virgules, ex: 2988507,2995469.",
+    ),
+    start_date: Optional[date] = Query(
+        None,
+        description="Date de début (incluse) au format ISO, ex: 2025-01-06.",
+    ),
+    end_date: Optional[date] = Query(
+        None,
+        description="Date de fin (incluse) au format ISO, ex: 2025-02-03.",
+    ),
+):
+    """
+    Récupère les semaines météo des villes `ids` avec une seule requête SQL.
+    """
+    try:
+        grouped = MeteoService.get_weeks_for_cities(
+            [int(i) for i in ids.split(",")], start_date, end_date
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return [{"geoname_id": gid, "weeks": weeks} for gid, weeks in grouped.items()]
+
+
 @router.get(
     "/{geoname_id}",
     response_model=List[WeekMeteoResponse],
@@ -52,6 +97,86 @@ def get_weeks_for_city(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.get(
+    "/{geoname_id}/aggregate",
+    response_model=List[MeteoAggregateResponse],
+    summary="Agréger les relevés quotidiens d'une ville",
+    description=(
+        "Calcule à la demande des agrégats (moyennes T° max/min, cumul de précipitations) "
+        "depuis les relevés quotidiens stockés en Parquet.\n\n"
+        "`window` : fenêtres consécutives de *n* jours (`7d`, `14d`, `30d`...) "
+        "à partir de `start_date`, ou `month` pour les mois civils."
+    ),
+    responses={
+        200: {"description": "Agrégats par période, dans l'ordre chronologique."},
+        404: {"description": "Aucun relevé quotidien pour les critères fournis."},
+        422: {"description": "Fenêtre ou dates invalides."},
+    },
+)
+def get_aggregates_for_city(
+    geoname_id: int,
+    window: str = Query(
+        "14d",
+        pattern=r"^(\d{1,3}d|month)$",
+        description="Fenêtre d'agrégation : `<n>d` (1 à 366 jours) ou `month`.",
+    ),
+    start_date: Optional[date] = Query(
+        None,
+        description="Date de début (incluse) au format ISO, ex: 2024-01-01.",
+    ),
+    end_date: Optional[date] = Query(
+        None,
+        description="Date de fin (incluse) au format ISO, ex: 2024-12-31.",
+    ),
+):
+    """
+    Agrège les relevés quotidiens de `geoname_id` par fenêtre `window`.
+    """
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(
+            status_code=422, detail="start_date doit précéder end_date"
+        )
+    try:
+        return MeteoService.get_aggregates(geoname_id, window, start_date, end_date)
+    except ValueError as e:
+        if str(e).startswith("Fenêtre invalide"):
+            raise HTTPException(status_code=422, detail=str(e))
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get(
+    "/{geoname_id}/normals",
+    response_model=List[MeteoNormalResponse],
+    summary="Normales climatiques d'une ville par semaine ISO",
+    description=(
+        "Retourne les normales pluriannuelles (moyenne/min/max des T° max, T° min et "
+        "précipitations sur toutes les années chargées) précalculées par l'ETL météo.\n\n"
+        "`week` restreint la réponse à une semaine ISO (1 à 53)."
+    ),
+    responses={
+        200: {"description": "Normales par semaine ISO, dans l'ordre des semaines."},
+        404: {"description": "Aucune normale pour cette ville (ou cette semaine)."},
+        422: {"description": "Numéro de semaine invalide."},
+    },
+)
+def get_normals_for_city(
+    geoname_id: int,
+    week: Optional[int] = Query(
+        None,
+        ge=1,
+        le=53,
+        description="Semaine ISO (1 à 53), ex: 32.",
+    ),
+):
+    """
+    Lit les normales de `geoname_id` (lecture indexée sur la clé primaire).
+    """
+    try:
+        return MeteoService.get_normals(geoname_id, week)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.get(
     "/",
     response_model=List[WeekMeteoResponse],
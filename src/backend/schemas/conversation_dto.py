@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional, Dict, Any, List
 from bson import ObjectId
+from models.phrase import PhraseMatch, PhrasePivot
 
 
 class PyObjectId(str):
@@ -135,6 +136,10 @@ class ConversationListResponse(BaseModel):
     conversations: list[ConversationResponse] = Field(
         description="Liste des conversations"
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="_id à passer en `after` pour la page suivante (None si dernière)",
+    )
 
 
 class ConversationBulkCreateRequest(BaseModel):
@@ -143,3 +148,19 @@ class ConversationBulkCreateRequest(BaseModel):
     conversations: List[ConversationCreateRequest] = Field(
         ..., description="Liste de conversations à importer"
     )
+
+
+class PhraseMatchResponse(PhraseMatch):
+    """DTO de réponse API (phrase trouvée par la recherche plein texte)"""
+
+    class Config:
+        from_attributes = True
+        populate_by_name = True
+
+
+class PhrasePivotResponse(PhrasePivot):
+    """DTO de réponse API (une phrase dans plusieurs langues)"""
+
+    class Config:
+        from_attributes = True
+        populate_by_name = True
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional
+from models.country_meteo import CountryMeteoWeek
 
 
 class LangueInfo(BaseModel):
@@ -101,3 +102,10 @@ class CountryUpdate(BaseModel):
     electricity_types: Optional[List[str]] = None
     voltage: Optional[str] = None
     frequency: Optional[str] = None
+
+
+class CountryMeteoWeekResponse(CountryMeteoWeek):
+    """Réponse API : agrégat météo d'un pays pour une période"""
+
+    class Config:
+        from_attributes = True
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 
 class FamilleDTO(BaseModel):
@@ -31,6 +31,14 @@ class LangueCreateRequest(BaseModel):
     is_in_mongo: bool = Field(default=False, description="Présence dans MongoDB")
 
 
+class LangueBulkRequest(BaseModel):
+    """DTO pour la création/remplacement de langues en masse"""
+
+    items: List[LangueCreateRequest] = Field(
+        ..., min_length=1, description="Langues à créer ou remplacer"
+    )
+
+
 class LangueUpdateRequest(BaseModel):
     """DTO pour la mise à jour partielle d'une langue"""
 
@@ -0,0 +1,22 @@
+from models.travel_score import WeekScore, CityScore, SimilarCity
+
+
+class WeekScoreResponse(WeekScore):
+    """DTO de réponse API (score d'une semaine ISO)"""
+
+    class Config:
+        from_attributes = True
+
+
+class CityScoreResponse(CityScore):
+    """DTO de réponse API (score d'une ville pour une semaine ISO)"""
+
+    class Config:
+        from_attributes = True
+
+
+class SimilarCityResponse(SimilarCity):
+    """DTO de réponse API (ville au climat proche d'une ville de référence)"""
+
+    class Config:
+        from_attributes = True
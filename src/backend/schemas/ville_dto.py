@@ -17,6 +17,7 @@ class VilleUpdate(BaseModel):
     longitude: Optional[float] = None
     country_3166a2: Optional[str] = Field(None, max_length=2)
     is_capital: Optional[bool] = None
+    population: Optional[int] = Field(None, ge=0)
 
 
 class VilleResponse(Ville):
@@ -1,6 +1,8 @@
 from typing import Optional, List
 from pydantic import BaseModel
 from models.week_meteo import WeekMeteo
+from models.meteo_aggregate import MeteoAggregate
+from models.meteo_normal import MeteoNormal
 
 
 class WeekMeteoCreate(WeekMeteo):
@@ -24,7 +26,28 @@ class WeekMeteoResponse(WeekMeteo):
         from_attributes = True
 
 
+class WeekMeteoBatchResponse(BaseModel):
+    """DTO de réponse API : semaines météo d'une ville (requête multi-villes)"""
+
+    geoname_id: int
+    weeks: List[WeekMeteoResponse]
+
+
 class WeekMeteoBulkCreate(BaseModel):
     """Payload pour insertions en masse"""
 
     items: List[WeekMeteoCreate]
+
+
+class MeteoAggregateResponse(MeteoAggregate):
+    """DTO de réponse API (agrégat calculé depuis les relevés quotidiens)"""
+
+    class Config:
+        from_attributes = True
+
+
+class MeteoNormalResponse(MeteoNormal):
+    """DTO de réponse API (normales pluriannuelles par semaine ISO)"""
+
+    class Config:
+        from_attributes = True
@@ -2,10 +2,14 @@ from typing import Dict, Any, Tuple
 from connexion.mysql_connect import MySQLConnection
 from orm.conversation_orm import ConversationOrm
 from orm.langue_orm import LangueOrm
+from services.phrase_search_service import PhraseSearchService
 
 
 class ConversationService:
-    """Service pour la gestion des conversations avec synchronisation MySQL"""
+    """Service pour la gestion des conversations avec synchronisation MySQL
+
+    Toute écriture invalide l'index de recherche de phrases (PhraseSearchService).
+    """
 
     @staticmethod
     def _sync_langue_status(lang_code: str, is_in_mongo: bool) -> None:
@@ -43,15 +47,35 @@ class ConversationService:
 
         Returns:
             Tuple (conversation_id, lang_code)
+
+        Raises:
+            DuplicateKeyError: Si une conversation existe déjà pour cette langue
+                (index unique sur lang639-2)
         """
         conversation_id = ConversationOrm.create(conversation_data)
 
+        PhraseSearchService.invalidate()
         lang_code = conversation_data.get("lang639-2")
         if lang_code:
             ConversationService._sync_langue_status(lang_code, True)
 
         return conversation_id, lang_code
 
+    @staticmethod
+    def update(conversation_id: str, update_data: Dict[str, Any]) -> int:
+        """Met à jour une conversation
+
+        Args:
+            conversation_id: ID de la conversation
+            update_data: Opération MongoDB ($set)
+
+        Returns:
+            Nombre de documents modifiés
+        """
+        modified_count = ConversationOrm.update(conversation_id, update_data)
+        PhraseSearchService.invalidate()
+        return modified_count
+
     @staticmethod
     def delete(
         conversation_id: str, existing_conversation: Dict[str, Any]
@@ -68,6 +92,7 @@ class ConversationService:
         lang_code = existing_conversation.get("lang639-2")
 
         deleted_count = ConversationOrm.delete(conversation_id)
+        PhraseSearchService.invalidate()
 
         if lang_code:
             ConversationService._sync_langue_status(lang_code, False)
@@ -1,11 +1,19 @@
+import threading
+from datetime import date
 from typing import List, Dict, Any, Optional
+from cachetools import TTLCache
 from connexion.mysql_connect import MySQLConnection
 from orm.country_orm import CountryOrm
+from models.country_meteo import CountryMeteoWeek
 
 
 class CountryService:
     """Service pour la gestion des pays"""
 
+    # Agrégats météo par (pays, plage, pondération), conservés 10 minutes
+    _meteo_cache: TTLCache = TTLCache(maxsize=512, ttl=600)
+    _meteo_lock = threading.Lock()
+
     @staticmethod
     def get_by_alpha2(alpha2: str) -> Dict[str, Any]:
         """Récupère un pays par code ISO alpha-2
@@ -64,6 +72,65 @@ class CountryService:
         finally:
             MySQLConnection.close()
 
+    @staticmethod
+    def get_meteo(
+        alpha2: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        weighted: bool = False,
+    ) -> List[CountryMeteoWeek]:
+        """Agrégats météo hebdomadaires d'un pays (toutes ses villes)
+
+        Args:
+            alpha2: Code ISO 3166-1 alpha-2
+            start_date: Date de début (incluse)
+            end_date: Date de fin (incluse)
+            weighted: Moyennes pondérées par la population des villes
+
+        Returns:
+            Une ligne par période (moyenne, min et max entre villes)
+
+        Raises:
+            ValueError: Si code invalide ou aucune donnée météo
+        """
+        alpha2 = alpha2.lower().strip()
+
+        if len(alpha2) != 2:
+            raise ValueError(
+                "Le code pays doit contenir exactement 2 caractères (ISO 3166-1 alpha-2)"
+            )
+
+        key = (alpha2, start_date, end_date, weighted)
+        with CountryService._meteo_lock:
+            cached = CountryService._meteo_cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            MySQLConnection.connect()
+            rows = CountryOrm.get_meteo_weeks(alpha2, start_date, end_date, weighted)
+        finally:
+            MySQLConnection.close()
+
+        if not rows:
+            raise ValueError(f"Aucune donnée météo pour le pays '{alpha2}'")
+
+        weeks = [
+            CountryMeteoWeek.from_dict(
+                {**row, "country_3166a2": alpha2, "weighted": weighted}
+            )
+            for row in rows
+        ]
+        with CountryService._meteo_lock:
+            CountryService._meteo_cache[key] = weeks
+        return weeks
+
+    @staticmethod
+    def invalidate() -> None:
+        """Vide le cache des agrégats météo (appelé par les écritures MeteoService)"""
+        with CountryService._meteo_lock:
+            CountryService._meteo_cache.clear()
+
     @staticmethod
     def get_countries_by_plug_type(plug_type: str) -> List[Dict[str, Any]]:
         """Liste les pays utilisant un type de prise
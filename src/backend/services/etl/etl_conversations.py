@@ -1,6 +1,7 @@
 import pandas as pd
 import sys
 from pathlib import Path
+from pymongo import DeleteMany, ReplaceOne
 
 sys.path.insert(0, Path(__file__).resolve().parents[3])
 from connexion.mongo_connect import MongoDBConnection
@@ -105,6 +106,24 @@ class ConversationETL:
         print(f"Transformation terminée : {len(df_t)} conversations valides\n")
         return df_t
 
+    @staticmethod
+    def dedupe_documents(documents):
+        """Regroupe les documents par lang639-2 (phrases fusionnées)
+
+        Args:
+            documents (list): Documents {"lang639-2", "sentences"}
+
+        Returns:
+            list: Un document par langue, dans l'ordre de première apparition
+        """
+        merged = {}
+        for doc in documents:
+            target = merged.setdefault(
+                doc["lang639-2"], {"lang639-2": doc["lang639-2"], "sentences": {}}
+            )
+            target["sentences"].update(doc["sentences"])
+        return list(merged.values())
+
     def load(self, df):
         """Sauvegarde du DataFrame dans le fichier CSV et MongoDB
 
@@ -141,23 +160,37 @@ class ConversationETL:
                 }
                 documents.append({"lang639-2": lang_code, "sentences": sentences})
 
-            # Vider la collection avant l'import
-            print(f" Suppression des conversations existantes...")
-            collection = MongoDBConnection.get_collection(
-                ConversationOrm.COLLECTION_NAME
-            )
-            delete_result = collection.delete_many({})
-            print(f"{delete_result.deleted_count} documents supprimés")
+            # Un document par langue (index unique) : phrases fusionnées,
+            # la dernière ligne l'emporte
+            documents = self.dedupe_documents(documents)
 
-            # Insertion en masse
+            # Upsert par langue puis suppression des langues disparues,
+            # sans vider la collection (les _id existants sont conservés)
+            removed = ConversationOrm.remove_duplicate_langs()
+            if removed:
+                print(f"{removed} doublon(s) de langue supprimé(s)")
             if documents:
-                print(f"📤 Insertion de {len(documents)} conversations...")
-                result = MongoDBConnection.insert_many(
-                    ConversationOrm.COLLECTION_NAME, documents
-                )
-                print(f"{len(result.inserted_ids)} conversations insérées avec succès")
+                print(f"📤 Upsert de {len(documents)} conversations...")
             else:
+                # Source vide : la collection est vidée, comme la source
                 print(" Aucune conversation à insérer")
+            operations = [
+                ReplaceOne({"lang639-2": doc["lang639-2"]}, doc, upsert=True)
+                for doc in documents
+            ]
+            operations.append(
+                DeleteMany({"lang639-2": {"$nin": [d["lang639-2"] for d in documents]}})
+            )
+            result = MongoDBConnection.bulk_write(
+                ConversationOrm.COLLECTION_NAME, operations
+            )
+            print(
+                f"{result.upserted_count} créées, {result.modified_count} "
+                f"mises à jour, {result.deleted_count} supprimées"
+            )
+
+            # Index unique posé maintenant si des doublons l'avaient empêché
+            MongoDBConnection.ensure_indexes()
 
         except Exception as e:
             print(f"Erreur lors de l'insertion MongoDB: {e}")
@@ -8,11 +8,15 @@ from connexion.mysql_connect import MySQLConnection
 from connexion.mongo_connect import MongoDBConnection
 from orm.langue_orm import LangueOrm
 from orm.conversation_orm import ConversationOrm
+from utils.utils import ETLUtils
 
 
 class LanguageETL:
     """Classe pour gérer l'ETL des langues ISO 639"""
 
+    # Lignes par INSERT multi-lignes lors du chargement
+    LOAD_CHUNK_SIZE = 500
+
     def __init__(self):
         """Initialisation des chemins de fichiers"""
         self.base_dir = Path(__file__).resolve().parents[4]
@@ -176,20 +180,9 @@ class LanguageETL:
             MongoDBConnection.connect()
             print("Connexion MongoDB établie pour vérification...")
 
-            def check_in_mongo(iso_code):
-                """Vérifie si le code ISO existe dans MongoDB"""
-                try:
-                    count = MongoDBConnection.count_documents(
-                        ConversationOrm.COLLECTION_NAME,
-                        {"lang639-2": str(iso_code).lower()},
-                    )
-                    return count > 0
-                except Exception as e:
-                    print(f"⚠ Erreur vérification {iso_code}: {e}")
-                    return False
-
-            # Appliquer la vérification sur toute la colonne
-            df["is_in_mongo"] = df["639-2"].apply(check_in_mongo)
+            # Un seul distinct côté Mongo, puis comparaison vectorisée
+            present = ConversationOrm.get_lang_codes()
+            df["is_in_mongo"] = df["639-2"].astype(str).str.lower().isin(present)
 
             mongo_count = df["is_in_mongo"].sum()
             print(f"✓ {mongo_count}/{len(df)} langues présentes dans MongoDB")
@@ -249,12 +242,61 @@ class LanguageETL:
 
         return df_final
 
+    def build_rows(self, df, famille_map):
+        """Construit les tuples d'insertion colonne par colonne
+
+        Args:
+            df (pd.DataFrame): DataFrame transformé
+            famille_map (dict): {branche en minuscules: id} (LangueOrm.get_famille_map)
+
+        Returns:
+            list: Tuples (iso639_2, name_en, name_fr, name_local, famille_id,
+                is_in_mongo), un par code ISO (dernière occurrence conservée)
+        """
+        df = df.drop_duplicates(subset="639-2", keep="last")
+        famille_ids = (
+            df["family"].str.lower().map(famille_map).astype("Int64")
+            if "family" in df.columns
+            else pd.Series(pd.NA, index=df.index, dtype="Int64")
+        )
+        return list(
+            zip(
+                ETLUtils.sql_values(df["639-2"]),
+                ETLUtils.sql_values(df["name_en"]),
+                ETLUtils.sql_values(df["name_fr"]),
+                ETLUtils.sql_values(df["name_local"]),
+                ETLUtils.sql_values(famille_ids),
+                df["is_in_mongo"].fillna(False).astype(bool).tolist(),
+            )
+        )
+
+    @staticmethod
+    def diff_rows(rows, existing):
+        """Sépare les nouvelles langues, les modifiées et les inchangées
+
+        Args:
+            rows (list): Tuples issus de build_rows
+            existing (dict): {iso639_2: valeurs} (LangueOrm.get_rows_by_code)
+
+        Returns:
+            tuple: (lignes à écrire, nb insérées, nb mises à jour, nb ignorées)
+        """
+        to_write = [r for r in rows if existing.get(r[0]) != tuple(r[1:])]
+        inserted = sum(1 for r in to_write if r[0] not in existing)
+        updated = len(to_write) - inserted
+        return to_write, inserted, updated, len(rows) - len(to_write)
+
     def load(self, df):
         """Étape 10: Sauvegarde du DataFrame dans le fichier CSV et MySQL
-        Utilise le repository au lieu d'accéder directement à la BDD
+        Utilise le repository au lieu d'accéder directement à la BDD :
+        familles et langues existantes lues une fois, puis upsert multi-lignes
+        des seules langues nouvelles ou modifiées (une transaction).
 
         Args:
             df (pd.DataFrame): DataFrame à sauvegarder
+
+        Returns:
+            dict: Nombre de langues insérées, mises à jour et ignorées (inchangées)
         """
         # 1. Sauvegarde CSV
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -266,32 +308,18 @@ class LanguageETL:
             MySQLConnection.connect()
             print("\n--- INSERTION DANS MYSQL (via Orm) ---")
 
-            inserted_count = 0
-            error_count = 0
-
-            for index, row in df.iterrows():
-                try:
-                    # Utilisation du repository pour l'insertion
-                    rowcount = LangueOrm.insert_ignore(
-                        iso639_2=row["639-2"],
-                        name_en=row["name_en"],
-                        name_fr=row["name_fr"],
-                        name_local=row["name_local"],
-                        branche_en=row["family"] if pd.notna(row["family"]) else None,
-                        is_in_mongo=bool(row["is_in_mongo"]),
-                    )
-
-                    if rowcount > 0:
-                        inserted_count += 1
-
-                except Exception as e:
-                    error_count += 1
-                    print(f"Erreur pour {row['639-2']}: {e}")
+            rows = self.build_rows(df, LangueOrm.get_famille_map())
+            to_write, inserted, updated, skipped = self.diff_rows(
+                rows, LangueOrm.get_rows_by_code()
+            )
+            LangueOrm.bulk_upsert(to_write, self.LOAD_CHUNK_SIZE)
 
             MySQLConnection.commit()
-            print(f"MySQL - {inserted_count} langue(s) insérée(s)")
-            if error_count > 0:
-                print(f" {error_count} erreur(s) rencontrée(s)")
+            print(
+                f"MySQL - {inserted} langue(s) insérée(s), {updated} mise(s) à jour, "
+                f"{skipped} inchangée(s)"
+            )
+            return {"inserted": inserted, "updated": updated, "skipped": skipped}
 
         except Exception as e:
             print(f"Erreur lors de l'insertion MySQL: {e}")
@@ -1,7 +1,8 @@
 import time
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Optional, Tuple, List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple, List
 import openmeteo_requests
 import pandas as pd
 import requests
@@ -13,8 +14,12 @@ import sys
 ROOT = Path(__file__).resolve().parent.parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
-from models.week_meteo import WeekMeteo
 from orm.week_meteo_orm import WeekMeteoOrm
+from orm.meteo_daily_parquet import MeteoDailyStore
+from orm.meteo_normals_orm import MeteoNormalsOrm
+from orm.meteo_cube import MeteoCube
+from services.etl.meteo_journal import MeteoRunJournal
+from utils.rate_limiter import AdaptiveTokenBucket
 from utils.utils import ETLUtils
 
 
@@ -25,29 +30,84 @@ class MeteoETL:
     timezone: str = "UTC"
     use_cache: bool = True
     batch_size: int = 40  # Nombre de villes par batch
-    api_delay: float = 0.35  # Délai entre appels API (secondes)
+    max_workers: int = 8  # Appels API simultanés
+    locations_per_request: int = 1  # Villes par appel API (1 = une requête par ville)
+    # Débit max en lieux/s : un appel multi-lieux compte chaque lieu dans le
+    # quota Open-Meteo (600 lieux/min)
+    requests_per_second: float = 8.0
+    min_requests_per_second: float = 0.5  # Débit plancher après 429/5xx
     max_retries: int = 3  # Tentatives max par ville
+    retry_backoff: float = 1.0  # Attente avant nouvelle tentative (x2 à chaque échec)
+    load_chunk_size: int = 5000  # Lignes par executemany lors du chargement
+    store_daily: bool = True  # Conserve les relevés quotidiens (Parquet)
+    refresh_normals: bool = True  # Recalcule Meteo_Normals des villes chargées
+    export_cube: bool = True  # Réexporte le cube météo lu par l'API (MeteoCube)
+    api_url: str = "https://archive-api.open-meteo.com/v1/archive"
 
     # Internes
     client: Optional[openmeteo_requests.Client] = None
+    rate_limiter: Optional[AdaptiveTokenBucket] = None
     session: Optional[requests.Session] = None
     daily_df: Optional[pd.DataFrame] = None
     weekly_df: Optional[pd.DataFrame] = None
     villes_df: Optional[pd.DataFrame] = None
+    cut_dates: Optional[Dict[int, date]] = None  # Mode incrémental
+    journal: Optional[MeteoRunJournal] = None  # Journal de reprise (optionnel)
+    run_id: Optional[str] = None
+
+    # Champs non repris dans les paramètres d'une exécution journalisée
+    INTERNAL_FIELDS = (
+        "client",
+        "rate_limiter",
+        "session",
+        "daily_df",
+        "weekly_df",
+        "villes_df",
+        "cut_dates",
+        "journal",
+        "run_id",
+    )
 
     def __post_init__(self):
+        # Les codes HTTP (429/5xx) ne sont pas rejoués par la session :
+        # ils pilotent le limiteur de débit partagé entre les threads.
         if self.use_cache:
             cache = requests_cache.CachedSession(".openmeteo_cache", expire_after=3600)
-            self.session = retry(cache, retries=3, backoff_factor=0.2)
+            self.session = retry(
+                cache, retries=3, backoff_factor=0.2, status_to_retry=()
+            )
         else:
             self.session = retry(
-                requests_cache.CachedSession(), retries=3, backoff_factor=0.2
+                requests_cache.CachedSession(),
+                retries=3,
+                backoff_factor=0.2,
+                status_to_retry=(),
             )
+        # Seau assez grand pour l'appel le plus lourd (locations_per_request jetons)
+        self.rate_limiter = AdaptiveTokenBucket(
+            self.requests_per_second,
+            min_rate=self.min_requests_per_second,
+            capacity=max(self.requests_per_second, self.locations_per_request),
+        )
+        self.session.hooks["response"].append(self._observe_response)
         self.client = openmeteo_requests.Client(session=self.session)
 
+    def _observe_response(self, response, *args, **kwargs):
+        """Hook requests : ajuste le débit selon le code HTTP reçu"""
+        # requests_cache redéclenche les hooks : une seule observation par réponse
+        if getattr(response, "from_cache", False) or getattr(
+            response, "rate_observed", False
+        ):
+            return
+        response.rate_observed = True
+        self.rate_limiter.observe(response.status_code)
+
     # ======================= EXTRACT =======================
     def extract_from_csv(
-        self, csv_path: Optional[Path] = None, skip_existing: bool = False
+        self,
+        csv_path: Optional[Path] = None,
+        skip_existing: bool = False,
+        incremental: bool = False,
     ) -> pd.DataFrame:
         """
         Charge les villes depuis un CSV (par défaut: ROOT/src/db/villes.csv).
@@ -56,6 +116,8 @@ class MeteoETL:
         Args:
             csv_path: Chemin vers le CSV des villes
             skip_existing: Si True, exclut les villes déjà présentes dans Meteo_Weekly
+            incremental: Si True, ne récupère pour chaque ville que les jours
+                manquants depuis son filigrane (voir plan_incremental)
         """
         if csv_path is None:
             csv_path = ROOT.parent / "db" / "villes.csv"
@@ -93,10 +155,62 @@ class MeteoETL:
                 skipped = initial_count - len(s)
                 print(f"{skipped} villes déjà en base (ignorées)")
 
+        if incremental:
+            s = self.plan_incremental(
+                s, self._get_watermarks(), self.start_date, self.end_date
+            )
+            planned = s.dropna(subset=["cut_date"])
+            self.cut_dates = dict(zip(planned["geoname_id"], planned["cut_date"]))
+            print(
+                f"Mode incrémental : {initial_count - len(s)} villes à jour, "
+                f"{len(planned)} à compléter, {len(s) - len(planned)} nouvelles"
+            )
+
         self.villes_df = s
         print(f"{len(s)} villes chargées depuis {csv_path}")
         return self.villes_df
 
+    def _get_watermarks(self) -> Dict[int, date]:
+        """Filigranes par ville depuis Meteo_Weekly (vide si indisponible)."""
+        try:
+            return WeekMeteoOrm.get_watermarks()
+        except Exception as e:
+            print(f"Impossible de récupérer les filigranes: {e}")
+            return {}
+
+    @staticmethod
+    def plan_incremental(
+        villes: pd.DataFrame,
+        watermarks: Dict[int, date],
+        start_date: str,
+        end_date: str,
+    ) -> pd.DataFrame:
+        """
+        Calcule la plage à récupérer par ville à partir de son filigrane
+        (dernière week_end_date en base).
+
+        Règles :
+          - ville absente de la base : fetch_start = start_date, cut_date = NaN
+          - ville couvrant déjà end_date : ignorée
+          - sinon : cut_date = dernier dimanche <= filigrane (fin de la dernière
+            semaine ISO complète, la semaine partielle est recalculée) et
+            fetch_start = cut_date - 12 jours (fenêtre glissante de 14 jours
+            complète dès le lundi suivant la coupure)
+
+        Returns:
+            villes filtrées avec colonnes fetch_start (str) et cut_date (date)
+        """
+        out = villes.copy()
+        wm = pd.to_datetime(out["geoname_id"].map(watermarks))
+        out = out[wm.isna() | (wm < pd.Timestamp(end_date))].copy()
+        wm = wm.loc[out.index]
+
+        cut = wm - pd.to_timedelta((wm.dt.weekday + 1) % 7, unit="D")
+        fetch_start = (cut - pd.Timedelta(days=12)).dt.strftime("%Y-%m-%d")
+        out["fetch_start"] = fetch_start.fillna(start_date)
+        out["cut_date"] = cut.dt.date.where(cut.notna(), None)
+        return out.reset_index(drop=True)
+
     def _get_existing_geoname_ids(self) -> set:
         """
         Récupère la liste des geoname_id déjà présents dans Meteo_Weekly.
@@ -110,18 +224,17 @@ class MeteoETL:
             print(f"Impossible de récupérer les villes existantes: {e}")
             return set()
 
-    def fetch_data_for_ville(
-        self, latitude: float, longitude: float, geoname_id: int
-    ) -> Optional[pd.DataFrame]:
-        """
-        Appelle l'Archive API d'Open-Meteo pour une ville avec retry.
-        Renvoie un DataFrame quotidien ou None en cas d'échec définitif.
-        """
-        url = "https://archive-api.open-meteo.com/v1/archive"
-        params = {
-            "latitude": latitude,
-            "longitude": longitude,
-            "start_date": self.start_date,
+    def _daily_params(
+        self,
+        latitudes: List[float],
+        longitudes: List[float],
+        start_date: Optional[str] = None,
+    ) -> dict:
+        """Paramètres de l'Archive API ; plusieurs lieux = listes séparées par virgules."""
+        return {
+            "latitude": ",".join(str(float(x)) for x in latitudes),
+            "longitude": ",".join(str(float(x)) for x in longitudes),
+            "start_date": start_date or self.start_date,
             "end_date": self.end_date,
             "daily": [
                 "temperature_2m_max",
@@ -131,177 +244,452 @@ class MeteoETL:
             "timezone": self.timezone,
         }
 
+    def _request_with_retry(
+        self, params: dict, label: str, locations: int = 1
+    ) -> Optional[list]:
+        """
+        Appelle l'Archive API avec retry (débit borné par le limiteur partagé).
+        Chaque tentative consomme un jeton par lieu demandé (`locations`).
+        Renvoie la liste des réponses FlatBuffers ou None en cas d'échec définitif.
+        """
         for attempt in range(self.max_retries):
+            self.rate_limiter.acquire(locations)
             try:
-                responses = self.client.weather_api(url, params=params)
-                om = responses[0]
-                daily = om.Daily()
-
-                # Variables par ordre de requête
-                tmax = daily.Variables(0).ValuesAsNumpy()
-                tmin = daily.Variables(1).ValuesAsNumpy()
-                prcp = daily.Variables(2).ValuesAsNumpy()
-
-                start = pd.to_datetime(daily.Time(), unit="s")
-                end = pd.to_datetime(daily.TimeEnd(), unit="s")
-                step = pd.Timedelta(seconds=daily.Interval())
-                dates = pd.date_range(start=start, end=end - step, freq=step)
-
-                df = pd.DataFrame(
-                    {
-                        "date": dates,
-                        "tmax": tmax,
-                        "tmin": tmin,
-                        "precip_sum": prcp,
-                    }
-                ).sort_values("date")
-
-                df["geoname_id"] = int(geoname_id)
-                df["lat"] = float(latitude)
-                df["lon"] = float(longitude)
-                df["date"] = pd.to_datetime(df["date"]).dt.date
-
-                print(f"Données météo récupérées pour la ville id {int(geoname_id)}")
-                return df
-
+                return self.client.weather_api(self.api_url, params=params)
             except Exception as e:
-                wait_time = 5**attempt  # Backoff exponentiel: 5s, 10s, 15s
+                wait_time = self.retry_backoff * 2**attempt
                 if attempt < self.max_retries - 1:
                     print(
-                        f"Tentative {attempt+1}/{self.max_retries} échouée pour ville {geoname_id}, "
+                        f"Tentative {attempt+1}/{self.max_retries} échouée pour {label}, "
                         f"retry dans {wait_time}s... ({e})"
                     )
                     time.sleep(wait_time)
                 else:
-                    print(f"Échec définitif pour ville {int(geoname_id)}: {e}")
-                    return None
+                    print(f"Échec définitif pour {label}: {e}")
+        return None
+
+    @staticmethod
+    def _response_to_df(
+        om, latitude: float, longitude: float, geoname_id: int
+    ) -> pd.DataFrame:
+        """Convertit une réponse WeatherApiResponse en DataFrame quotidien."""
+        daily = om.Daily()
+
+        # Variables par ordre de requête
+        tmax = daily.Variables(0).ValuesAsNumpy()
+        tmin = daily.Variables(1).ValuesAsNumpy()
+        prcp = daily.Variables(2).ValuesAsNumpy()
+
+        start = pd.to_datetime(daily.Time(), unit="s")
+        end = pd.to_datetime(daily.TimeEnd(), unit="s")
+        step = pd.Timedelta(seconds=daily.Interval())
+        dates = pd.date_range(start=start, end=end - step, freq=step)
+
+        df = pd.DataFrame(
+            {
+                "date": dates,
+                "tmax": tmax,
+                "tmin": tmin,
+                "precip_sum": prcp,
+            }
+        ).sort_values("date")
+
+        df["geoname_id"] = int(geoname_id)
+        df["lat"] = float(latitude)
+        df["lon"] = float(longitude)
+        df["date"] = pd.to_datetime(df["date"]).dt.date
+        return df
+
+    def fetch_data_for_ville(
+        self,
+        latitude: float,
+        longitude: float,
+        geoname_id: int,
+        start_date: Optional[str] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Appelle l'Archive API d'Open-Meteo pour une ville avec retry.
+        Renvoie un DataFrame quotidien ou None en cas d'échec définitif.
+        start_date remplace self.start_date (mode incrémental).
+        """
+        label = f"ville {int(geoname_id)}"
+        responses = self._request_with_retry(
+            self._daily_params([latitude], [longitude], start_date), label
+        )
+        if not responses:
+            return None
+        try:
+            df = self._response_to_df(responses[0], latitude, longitude, geoname_id)
+        except Exception as e:
+            print(f"Réponse invalide pour {label}: {e}")
+            return None
+
+        print(f"Données météo récupérées pour la ville id {int(geoname_id)}")
+        return df
+
+    def fetch_data_for_villes(self, villes: List) -> List[Optional[pd.DataFrame]]:
+        """
+        Récupère plusieurs villes en un seul appel (latitude/longitude multiples).
+        Les réponses sont démultiplexées par LocationId (ordre de la requête) ;
+        toute ville absente ou illisible est retentée seule (fetch_data_for_ville).
+
+        Args:
+            villes: Tuples nommés (geoname_id, latitude, longitude[, fetch_start]),
+                de même fetch_start (voir request_groups)
+
+        Returns:
+            DataFrames quotidiens dans l'ordre de `villes` (None si échec)
+        """
+        start = getattr(villes[0], "fetch_start", None)
+        if len(villes) == 1:
+            v = villes[0]
+            return [
+                self.fetch_data_for_ville(v.latitude, v.longitude, v.geoname_id, start)
+            ]
+
+        frames: List[Optional[pd.DataFrame]] = [None] * len(villes)
+        label = f"{len(villes)} villes ({int(villes[0].geoname_id)}...)"
+        responses = self._request_with_retry(
+            self._daily_params(
+                [v.latitude for v in villes], [v.longitude for v in villes], start
+            ),
+            label,
+            locations=len(villes),
+        )
+
+        for position, om in enumerate(responses or []):
+            # LocationId = rang du lieu dans la requête (0 si réponse mono-lieu)
+            i = int(om.LocationId()) or position
+            if i >= len(villes) or frames[i] is not None:
+                continue
+            v = villes[i]
+            try:
+                frames[i] = self._response_to_df(
+                    om, v.latitude, v.longitude, v.geoname_id
+                )
+            except Exception as e:
+                print(f"Réponse invalide pour ville {int(v.geoname_id)}: {e}")
+
+        missing = [i for i, df in enumerate(frames) if df is None]
+        if responses and not missing:
+            print(f"Données météo récupérées pour {len(villes)} villes en 1 appel")
+        elif missing:
+            print(f"Repli ville par ville pour {len(missing)}/{len(villes)} villes")
+            for i in missing:
+                v = villes[i]
+                frames[i] = self.fetch_data_for_ville(
+                    v.latitude, v.longitude, v.geoname_id, start
+                )
+        return frames
 
     # ======================= TRANSFORM =======================
-    def transform_weekly_14d(self, df: pd.DataFrame) -> pd.DataFrame:
+    WEEKLY_COLUMNS = [
+        "geoname_id",
+        "week_start_date",
+        "week_end_date",
+        "iso_year",
+        "iso_week",
+        "lat",
+        "lon",
+        "tmax_14d_avg",
+        "tmin_14d_avg",
+        "precip_14d_sum",
+    ]
+
+    def transform_weekly(self, daily_df: pd.DataFrame) -> pd.DataFrame:
         """
-        Produit des agrégats glissants sur 14 jours, puis échantillonne par semaine ISO.
-        Calcule week_start_date et week_end_date (période de 14 jours).
+        Agrégats glissants sur 14 jours pour toutes les villes d'un coup,
+        puis échantillonnage par semaine ISO (une ligne par ville et par semaine).
 
         Règles :
-          - tmax_14d_avg, tmin_14d_avg : moyenne mobile 14j
-          - precip_14d_sum : somme mobile 14j
+          - tmax_14d_avg, tmin_14d_avg : moyenne mobile 14j (7 valeurs min)
+          - precip_14d_sum : somme mobile 14j (7 valeurs min)
           - week_start_date : date - 13 jours (début de la fenêtre)
-          - week_end_date : date (fin de la fenêtre)
+          - week_end_date : dernière date disponible de la semaine ISO
+
+        Args:
+            daily_df: Données quotidiennes concaténées (geoname_id, date, tmax,
+                tmin, precip_sum, lat, lon), plusieurs villes possibles
+
+        Returns:
+            DataFrame hebdomadaire trié par (geoname_id, iso_year, iso_week)
         """
-        s = df.copy()
+        if daily_df.empty:
+            return pd.DataFrame(columns=self.WEEKLY_COLUMNS)
+
+        s = daily_df.copy()
         s["date"] = pd.to_datetime(s["date"])
-        s = s.set_index("date").sort_index()
+        s = s.sort_values(["geoname_id", "date"], kind="stable").reset_index(
+            drop=True
+        )
 
+        # Fenêtres glissantes par ville (les villes sont contiguës après tri)
         win = 14
-        s["tmax_14d_avg"] = s["tmax"].rolling(window=win, min_periods=7).mean()
-        s["tmin_14d_avg"] = s["tmin"].rolling(window=win, min_periods=7).mean()
-        s["precip_14d_sum"] = s["precip_sum"].rolling(window=win, min_periods=7).sum()
+        g = s.groupby("geoname_id", sort=False)
+        means = g[["tmax", "tmin"]].rolling(window=win, min_periods=7).mean()
+        sums = g["precip_sum"].rolling(window=win, min_periods=7).sum()
+        s["tmax_14d_avg"] = means["tmax"].to_numpy()
+        s["tmin_14d_avg"] = means["tmin"].to_numpy()
+        s["precip_14d_sum"] = sums.to_numpy()
 
         # Calculer les dates de début/fin de période
-        s = s.reset_index()
         s["week_end_date"] = s["date"]
         s["week_start_date"] = s["date"] - pd.Timedelta(days=13)
 
-        # Une seule ligne par semaine ISO (on garde la dernière date de chaque semaine)
-        s["iso_year"], s["iso_week"] = zip(*s["date"].apply(ETLUtils.iso_week_key))
-        idx = s.groupby(["geoname_id", "iso_year", "iso_week"])["date"].idxmax()
-        weekly = s.loc[idx].sort_values(["geoname_id", "iso_year", "iso_week"])
-
-        # Colonnes ordonnées
-        weekly = weekly[
-            [
-                "geoname_id",
-                "week_start_date",
-                "week_end_date",
-                "iso_year",
-                "iso_week",
-                "lat",
-                "lon",
-                "tmax_14d_avg",
-                "tmin_14d_avg",
-                "precip_14d_sum",
-            ]
-        ]
+        # Une seule ligne par semaine ISO : la dernière date de chaque (ville, semaine)
+        iso = s["date"].dt.isocalendar()
+        s["iso_year"] = iso["year"].astype("int64")
+        s["iso_week"] = iso["week"].astype("int64")
+        keys = s[["geoname_id", "iso_year", "iso_week"]]
+        is_last = keys.ne(keys.shift(-1)).any(axis=1)
+
+        return s.loc[is_last, self.WEEKLY_COLUMNS]
 
-        return weekly
+    def transform_weekly_14d(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Agrégats hebdomadaires d'une ville (voir transform_weekly)."""
+        return self.transform_weekly(df)
 
     # ======================= LOAD =======================
     def load_weekly(self, weekly_df: pd.DataFrame) -> int:
         """
-        Charge/merge en base via bulk_upsert pour performance.
+        Charge/merge en base via bulk_upsert_rows (paquets de load_chunk_size).
+        Les tuples sont construits colonne par colonne (NaN -> None).
+        Les normales (Meteo_Normals) des villes chargées sont ensuite recalculées.
         Renvoie le nombre de lignes upsert.
         """
         if weekly_df.empty:
             return 0
 
-        repo = WeekMeteoOrm()
-
-        # Conversion en objets WeekMeteo
-        items = []
-        for _, r in weekly_df.iterrows():
-            wm = WeekMeteo(
-                geoname_id=int(r["geoname_id"]),
-                week_start_date=pd.to_datetime(r["week_start_date"]).date(),
-                week_end_date=pd.to_datetime(r["week_end_date"]).date(),
-                temperature_max_avg=(
-                    None if pd.isna(r["tmax_14d_avg"]) else float(r["tmax_14d_avg"])
-                ),
-                temperature_min_avg=(
-                    None if pd.isna(r["tmin_14d_avg"]) else float(r["tmin_14d_avg"])
-                ),
-                precipitation_sum=(
-                    None if pd.isna(r["precip_14d_sum"]) else float(r["precip_14d_sum"])
-                ),
+        cuts = []
+        if self.cut_dates:
+            # Mode incrémental : seules les semaines après la coupure sont chargées
+            cut = pd.to_datetime(weekly_df["geoname_id"].map(self.cut_dates))
+            end = pd.to_datetime(weekly_df["week_end_date"])
+            weekly_df = weekly_df[cut.isna() | (end > cut)]
+            gids = pd.unique(weekly_df["geoname_id"])
+            cuts = [
+                (int(g), self.cut_dates[g]) for g in gids if g in self.cut_dates
+            ]
+
+        rows = list(
+            zip(
+                weekly_df["geoname_id"].astype("int64").tolist(),
+                pd.to_datetime(weekly_df["week_start_date"]).dt.date.tolist(),
+                pd.to_datetime(weekly_df["week_end_date"]).dt.date.tolist(),
+                ETLUtils.sql_values(weekly_df["tmax_14d_avg"]),
+                ETLUtils.sql_values(weekly_df["tmin_14d_avg"]),
+                ETLUtils.sql_values(weekly_df["precip_14d_sum"]),
             )
-            items.append(wm)
+        )
 
         # Insertion bulk (transaction unique)
         try:
-            rows = repo.bulk_upsert(items)
-            print(f"{rows} lignes upsert en base... attente 5s")
-            time.sleep(5)
-            return rows
+            if cuts:
+                count = WeekMeteoOrm.replace_after(cuts, rows, self.load_chunk_size)
+            else:
+                count = WeekMeteoOrm.bulk_upsert_rows(rows, self.load_chunk_size)
+            print(f"{count} lignes upsert en base")
+            if self.refresh_normals and rows:
+                gids = {r[0] for r in rows}
+                normals = MeteoNormalsOrm.refresh_for_cities(gids)
+                print(f"{normals} normales recalculées ({len(gids)} villes)")
+            return count
         except Exception as e:
             print(f"Erreur bulk upsert: {e}")
             raise
 
+    def persist_daily(self, daily_batch: List[pd.DataFrame]) -> int:
+        """
+        Ajoute les relevés quotidiens au dataset Parquet (MeteoDailyStore),
+        source des agrégats à fenêtre libre. Renvoie le nombre de lignes écrites.
+        """
+        if not self.store_daily or not daily_batch:
+            return 0
+        return MeteoDailyStore.write(pd.concat(daily_batch, ignore_index=True))
+
+    def compact_daily(self) -> int:
+        """
+        Regroupe les fichiers Parquet écrits batch par batch (un par partition),
+        une fois en fin d'exécution. Renvoie le nombre de partitions compactées.
+        """
+        if not self.store_daily:
+            return 0
+        count = MeteoDailyStore.compact()
+        if count:
+            print(f"Relevés quotidiens : {count} partitions compactées")
+        return count
+
+    # ======================= JOURNAL =======================
+    def run_params(self) -> dict:
+        """Paramètres de configuration de l'ETL (rejouables par resume())."""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name not in self.INTERNAL_FIELDS
+        }
+
+    def start_journal(self, journal: MeteoRunJournal) -> str:
+        """
+        Ouvre une exécution journalisée pour les villes de villes_df :
+        paramètres et plan par ville (fetch_start, cut_date) sont enregistrés.
+        Renvoie le run_id à passer à --resume en cas d'interruption.
+        """
+        if self.villes_df is None:
+            raise ValueError(
+                "Aucune ville chargée. Exécutez extract_from_csv() avant start_journal()."
+            )
+        self.journal = journal
+        self.run_id = journal.start_run(self.run_params(), self.villes_df)
+        print(f"Exécution journalisée : {self.run_id} ({journal.path})")
+        return self.run_id
+
+    @classmethod
+    def resume(cls, journal: MeteoRunJournal, run_id: str, **overrides) -> "MeteoETL":
+        """
+        Reprend une exécution interrompue : mêmes paramètres, même plan par ville,
+        limitée aux villes non chargées (les villes déjà chargées ne sont
+        pas re-récupérées).
+
+        Seul l'état « loaded » est définitif : les relevés d'une ville
+        « fetched » ou « transformed » ne vivaient qu'en mémoire et ne sont
+        persistés (Meteo_Weekly, Parquet) qu'au chargement, ces villes sont
+        donc de nouveau demandées à Open-Meteo. Au plus un batch (ou le
+        contenu des files du pipeline) est ainsi re-récupéré.
+
+        Args:
+            journal: Journal contenant l'exécution
+            run_id: Identifiant de l'exécution à reprendre
+            overrides: Paramètres à modifier (ex: max_workers)
+        """
+        etl = cls(**{**journal.get_params(run_id), **overrides})
+        villes = journal.remaining(run_id)
+        villes["fetch_start"] = villes["fetch_start"].fillna(etl.start_date)
+        planned = villes.dropna(subset=["cut_date"])
+        etl.cut_dates = dict(zip(planned["geoname_id"], planned["cut_date"])) or None
+        etl.villes_df = villes
+        etl.journal = journal
+        etl.run_id = run_id
+        journal.set_status(run_id, "running")
+        summary = journal.summary(run_id)
+        done = summary.get(MeteoRunJournal.LOADED, 0)
+        refetch = summary.get(MeteoRunJournal.FETCHED, 0) + summary.get(
+            MeteoRunJournal.TRANSFORMED, 0
+        )
+        print(
+            f"Reprise de {run_id} : {done} villes déjà chargées, {len(villes)} "
+            f"restantes (dont {refetch} récupérées mais non chargées, à refaire)"
+        )
+        return etl
+
+    def checkpoint(self, geoname_ids, state: str, error: Optional[str] = None) -> None:
+        """Enregistre l'état de villes dans le journal (sans effet sans journal)."""
+        if self.journal is not None:
+            self.journal.mark(self.run_id, geoname_ids, state, error)
+
+    @staticmethod
+    def frame_ids(frames: List[pd.DataFrame]) -> List[int]:
+        """geoname_id de DataFrames quotidiens (un par ville)"""
+        return [int(df["geoname_id"].iloc[0]) for df in frames]
+
+    def _finish_journal(self, status: str) -> None:
+        if self.journal is not None:
+            self.journal.set_status(self.run_id, status)
+            print(f"Journal {self.run_id} : {self.journal.summary(self.run_id)}")
+
+    def publish_cube(self) -> int:
+        """
+        Réexporte Meteo_Weekly vers le cube mappé en mémoire par l'API.
+        Un échec n'interrompt pas l'ETL : l'API continue de lire MySQL.
+        Renvoie le nombre de villes exportées.
+        """
+        if not self.export_cube:
+            return 0
+        try:
+            count = MeteoCube.build(WeekMeteoOrm.get_all_rows())
+            print(f"Cube météo exporté : {count} villes")
+            return count
+        except Exception as e:
+            print(f"Export du cube météo impossible : {e}")
+            MeteoCube.invalidate()
+            return 0
+
     # ======================= ORCHESTRATION =======================
     def _get_batches(self, batch_size: int):
         """Générateur de batches de villes."""
         for i in range(0, len(self.villes_df), batch_size):
             yield self.villes_df.iloc[i : i + batch_size]
 
+    def request_groups(self, villes: pd.DataFrame) -> List[List]:
+        """
+        Découpe les villes en groupes d'appels API (locations_per_request),
+        chaque groupe partageant la même date de début (fetch_start).
+        """
+        cols = ["geoname_id", "latitude", "longitude"]
+        if "fetch_start" in villes.columns:
+            cols.append("fetch_start")
+            parts = [part for _, part in villes.groupby("fetch_start", sort=True)]
+        else:
+            parts = [villes]
+
+        size = max(1, self.locations_per_request)
+        groups = []
+        for part in parts:
+            rows = list(part[cols].itertuples(index=False))
+            groups.extend(rows[i : i + size] for i in range(0, len(rows), size))
+        return groups
+
+    def _fetch_group(self, villes: List) -> List[pd.DataFrame]:
+        """
+        Extract pour un groupe de villes (un appel API), exécuté dans un thread
+        du pool. Les villes en échec sont omises.
+        """
+        ids = [int(v.geoname_id) for v in villes]
+        try:
+            frames = self.fetch_data_for_villes(villes)
+        except Exception as e:
+            print(f"Erreur villes {ids}: {e}")
+            self.checkpoint(ids, MeteoRunJournal.FAILED, str(e))
+            return []
+        fetched = [daily for daily in frames if daily is not None]
+        self.checkpoint(self.frame_ids(fetched), MeteoRunJournal.FETCHED)
+        self.checkpoint(
+            [g for g, daily in zip(ids, frames) if daily is None],
+            MeteoRunJournal.FAILED,
+            "échec de récupération",
+        )
+        return fetched
+
     def _process_batch(
         self, batch: pd.DataFrame
     ) -> Tuple[List[pd.DataFrame], List[pd.DataFrame]]:
         """
         Traite un batch de villes : Extract + Transform.
-        Renvoie (daily_batch, weekly_batch).
+        Les villes sont groupées par locations_per_request (un appel API par groupe),
+        les groupes répartis sur max_workers threads ; le débit global
+        reste borné par le limiteur partagé (self.rate_limiter).
+        Le Transform est appliqué une seule fois au batch concaténé.
+        Renvoie (daily_batch, weekly_batch) : quotidien par ville dans l'ordre
+        du batch, hebdomadaire en un seul DataFrame.
         """
         daily_batch = []
-        weekly_batch = []
 
-        for idx, row in batch.iterrows():
-            try:
-                daily = self.fetch_data_for_ville(
-                    latitude=row["latitude"],
-                    longitude=row["longitude"],
-                    geoname_id=row["geoname_id"],
-                )
-
-                if daily is not None:
-                    weekly = self.transform_weekly_14d(daily)
-                    daily_batch.append(daily)
-                    weekly_batch.append(weekly)
+        groups = self.request_groups(batch)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for frames in pool.map(self._fetch_group, groups):
+                # Les villes en échec sont ignorées, le batch continue
+                daily_batch.extend(frames)
 
-                # Rate limiting prudent
-                time.sleep(self.api_delay)
-
-            except Exception as e:
-                print(f"Erreur ville {row['geoname_id']}: {e}")
-                # Continue avec les autres villes du batch
+        if not daily_batch:
+            return [], []
 
-        return daily_batch, weekly_batch
+        try:
+            weekly = self.transform_weekly(pd.concat(daily_batch, ignore_index=True))
+        except Exception as e:
+            print(f"Erreur transformation du batch: {e}")
+            self.checkpoint(self.frame_ids(daily_batch), MeteoRunJournal.FAILED, str(e))
+            return daily_batch, []
+        self.checkpoint(self.frame_ids(daily_batch), MeteoRunJournal.TRANSFORMED)
+        return daily_batch, [weekly]
 
     def _load_batch(self, weekly_batch: List[pd.DataFrame]) -> int:
         """Charge un batch complet en base."""
@@ -320,6 +708,8 @@ class MeteoETL:
         - Traite les villes par batch (batch_size)
         - Load immédiat après chaque batch (résilience)
         - Continue même si des villes échouent
+        - Avec un journal (start_journal / resume), l'état de chaque ville
+          est enregistré après chaque étape
         """
         if self.villes_df is None:
             raise ValueError(
@@ -328,25 +718,41 @@ class MeteoETL:
 
         print(f"Démarrage ETL pour {len(self.villes_df)} villes")
         print(f"Batch size: {self.batch_size} villes")
-        print(f"Délai API: {self.api_delay}s entre appels\n")
+        print(
+            f"Workers API: {self.max_workers} "
+            f"(débit max {self.requests_per_second} lieux/s)\n"
+        )
 
         all_daily = []
         all_weekly = []
         total_loaded = 0
         batch_num = 0
 
-        for batch in self._get_batches(self.batch_size):
-            batch_num += 1
-            print(f"\n--- Batch {batch_num} ({len(batch)} villes) ---")
-
-            daily_batch, weekly_batch = self._process_batch(batch)
-            all_daily.extend(daily_batch)
-            all_weekly.extend(weekly_batch)
-
-            # Load immédiat après chaque batch
-            loaded = self._load_batch(weekly_batch)
-            total_loaded += loaded
-            print(f"Batch {batch_num} terminé : {loaded} lignes chargées")
+        try:
+            for batch in self._get_batches(self.batch_size):
+                batch_num += 1
+                print(f"\n--- Batch {batch_num} ({len(batch)} villes) ---")
+
+                daily_batch, weekly_batch = self._process_batch(batch)
+                all_daily.extend(daily_batch)
+                all_weekly.extend(weekly_batch)
+
+                # Load immédiat après chaque batch
+                loaded = self._load_batch(weekly_batch)
+                self.persist_daily(daily_batch)
+                if weekly_batch:
+                    self.checkpoint(self.frame_ids(daily_batch), MeteoRunJournal.LOADED)
+                total_loaded += loaded
+                print(f"Batch {batch_num} terminé : {loaded} lignes chargées")
+        except BaseException:
+            self._finish_journal("failed")
+            # Base partiellement rechargée : l'API repasse par MySQL
+            if self.export_cube:
+                MeteoCube.invalidate()
+            raise
+        self._finish_journal("done")
+        self.compact_daily()
+        self.publish_cube()
 
         # Concaténation finale
         self.daily_df = (
@@ -359,11 +765,44 @@ class MeteoETL:
         print(f"\nETL terminé : {total_loaded} lignes totales en base")
         return self.daily_df, self.weekly_df
 
+    def run_pipeline(
+        self, transform_workers: int = 1, queue_size: int = 8, keep_frames: bool = False
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Variante de run() en étages concurrents (fetch -> transform -> load)
+        reliés par des files bornées : voir services/etl/meteo_pipeline.py.
+        Les DataFrames ne sont renvoyés que si keep_frames (vides sinon).
+        """
+        from services.etl.meteo_pipeline import MeteoPipeline
+
+        pipeline = MeteoPipeline(
+            self,
+            transform_workers=transform_workers,
+            queue_size=queue_size,
+            keep_frames=keep_frames,
+        )
+        try:
+            result = pipeline.run()
+        except BaseException:
+            self._finish_journal("failed")
+            # Base partiellement rechargée : l'API repasse par MySQL
+            if self.export_cube:
+                MeteoCube.invalidate()
+            raise
+        self._finish_journal("done")
+        self.compact_daily()
+        self.publish_cube()
+        return result
+
     def print_summary(self) -> None:
         """Affiche un résumé de l'ETL."""
         if self.daily_df is None or self.weekly_df is None:
             print("Pas de données à résumer. Exécutez run() d'abord.")
             return
+        if self.daily_df.empty:
+            # run_pipeline sans keep_frames : voir les statistiques du pipeline
+            print("Données non conservées en mémoire : pas de résumé détaillé.")
+            return
 
         d0 = ETLUtils.to_date(self.start_date)
         d1 = ETLUtils.to_date(self.end_date)
@@ -380,20 +819,35 @@ class MeteoETL:
 
 
 # ======================= ENTRÉE SCRIPT =======================
-def main():
-    """Fonction principale pour exécuter l'ETL météo"""
-    etl = MeteoETL(
-        start_date="2024-01-01",
-        end_date="2024-12-31",
-        timezone="Europe/Paris",
-        batch_size=40,
-        api_delay=0.35,
-    )
+JOURNAL_PATH = ROOT.parent / "db" / "meteo_runs.sqlite"
+
+
+def main(resume: Optional[str] = None, journal_path: Optional[Path] = None):
+    """
+    Fonction principale pour exécuter l'ETL météo.
+    Chaque exécution est journalisée ; `resume` reprend une exécution
+    interrompue à partir de son run_id.
+    """
+    journal = MeteoRunJournal(journal_path or JOURNAL_PATH)
+
+    if resume:
+        etl = MeteoETL.resume(journal, resume)
+    else:
+        etl = MeteoETL(
+            start_date="2024-01-01",
+            end_date="2024-12-31",
+            timezone="Europe/Paris",
+            batch_size=40,
+            max_workers=8,
+            requests_per_second=8.0,
+            locations_per_request=10,
+        )
+        # Extract
+        etl.extract_from_csv(incremental=True)
+        etl.start_journal(journal)
 
-    # Extract
-    etl.extract_from_csv(skip_existing=True)
-    # Transform + Load (avec batching automatique)
-    daily_df, weekly_df = etl.run()
+    # Fetch -> Transform -> Load en étages concurrents
+    daily_df, weekly_df = etl.run_pipeline()
     # Résumé
     etl.print_summary()
 
@@ -401,4 +855,19 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ETL météo (Open-Meteo -> MySQL)")
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Reprend une exécution interrompue (villes non chargées uniquement)",
+    )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        default=JOURNAL_PATH,
+        help=f"Fichier SQLite du journal (défaut : {JOURNAL_PATH})",
+    )
+    args = parser.parse_args()
+    main(resume=args.resume, journal_path=args.journal)
@@ -1,29 +1,60 @@
+import csv
 import re
 import unicodedata
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 import sys
-import requests
-import time
+from concurrent.futures import ThreadPoolExecutor
+import requests_cache
 
 sys.path.insert(0, Path(__file__).resolve().parents[3])
 from connexion.mysql_connect import MySQLConnection
 from orm.ville_orm import VilleOrm
+from utils.rate_limiter import TokenBucket
 from utils.utils import ETLUtils
 
 
 class ETLVille:
-    """ETL pour charger les villes depuis cities15000.txt vers la BDD"""
-
-    def __init__(self):
+    """ETL pour charger les villes depuis un dump GeoNames (cities15000.txt, cities500.txt...) vers la BDD"""
+
+    def __init__(
+        self,
+        source: str = "cities15000",
+        max_cities_per_country: Optional[int] = 4,
+        chunksize: int = 100_000,
+        capitals_api_url: str = "https://restcountries.com/v3.1/alpha",
+        max_workers: int = 8,
+        requests_per_second: float = 10.0,
+        capitals_cache_ttl: int = 30 * 24 * 3600,
+    ):
+        """
+        Args:
+            source: Nom du dump GeoNames dans raw_sources (sans extension)
+            max_cities_per_country: Nombre max de villes par pays, capitale incluse
+                (None = toutes les villes du dump)
+            chunksize: Nombre de lignes lues par bloc (mémoire bornée)
+            capitals_api_url: Endpoint restcountries "alpha" (surchargeable pour tests)
+            max_workers: Nombre d'appels simultanés pour les capitales
+            requests_per_second: Débit maximal vers l'API des capitales
+            capitals_cache_ttl: Durée de validité du cache disque (secondes)
+        """
+        self.max_cities_per_country = max_cities_per_country
+        self.chunksize = chunksize
         self.base_dir = Path(__file__).resolve().parents[4]
-        self.input_path = self.base_dir / "raw_sources" / "cities15000.txt"
+        self.input_path = self.base_dir / "raw_sources" / f"{source}.txt"
         self.countries_path = self.base_dir / "raw_sources" / "countries_en.csv"
         self.output_path = self.base_dir / "src" / "db" / "villes.csv"
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Colonnes du fichier GeoNames cities15000.txt (19 colonnes)
+        self.capitals_api_url = capitals_api_url
+        self.max_workers = max_workers
+        self.rate_limiter = TokenBucket(requests_per_second)
+        self.capitals_cache_ttl = capitals_cache_ttl
+        self.capitals_cache_path = self.base_dir / "raw_sources" / ".restcountries_cache"
+
+        # Colonnes des fichiers GeoNames citiesXXX.txt (19 colonnes)
         self.columns = [
             "geoname_id",
             "name_en",
@@ -56,132 +87,271 @@ class ETLVille:
             "country_3166a2",
         ]
 
-    def get_country_capitals(self, country_codes: List[str]) -> Dict[str, List[str]]:
-        """Récupère les capitales pour une liste de codes pays"""
+    def _fetch_capitals(
+        self, session: requests_cache.CachedSession, code: str
+    ) -> List[str]:
+        """
+        Capitales d'un pays : réponse en cache si valide, sinon appel API
+        soumis au limiteur de débit partagé.
+        """
+        url = f"{self.capitals_api_url.rstrip('/')}/{code.lower()}"
+        params = {"fields": "capital"}
+        response = session.get(url, params=params, only_if_cached=True)
+        if response.status_code == 504:  # absent du cache ou expiré
+            self.rate_limiter.acquire()
+            response = session.get(url, params=params, timeout=10)
+        if response.status_code != 200:
+            return []
+        capitals = response.json().get("capital", [])
+        return [c.strip() for c in capitals]
 
-        capitals_dict = {}
+    def get_country_capitals(self, country_codes: List[str]) -> Dict[str, List[str]]:
+        """
+        Récupère les capitales pour une liste de codes pays.
+        Appels concurrents (max_workers) limités à requests_per_second,
+        réponses conservées sur disque pendant cache_ttl secondes.
+        """
+        capitals_dict: Dict[str, List[str]] = {}
+        session = requests_cache.CachedSession(
+            str(self.capitals_cache_path),
+            expire_after=self.capitals_cache_ttl,
+            allowable_codes=(200, 404),
+        )
 
-        for code in country_codes:
+        def fetch(code: str) -> List[str]:
             try:
-                url = f"https://restcountries.com/v3.1/alpha/{code}?fields=capital"
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    capitals = data.get("capital", [])
-                    print(f"{code}:{capitals}")
-                    capitals_dict[code.lower()] = [c.strip() for c in capitals]
-                else:
-                    capitals_dict[code.lower()] = []
-
-                time.sleep(0.02)  # politesse API
-
+                return self._fetch_capitals(session, code)
             except Exception as e:
                 print(f" Error {code.upper()}: {e}")
-                capitals_dict[code.lower()] = []
+                return []
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for code, capitals in zip(
+                    country_codes, pool.map(fetch, country_codes)
+                ):
+                    capitals_dict[code.lower()] = capitals
+        finally:
+            session.close()
+
+        found = sum(1 for caps in capitals_dict.values() if caps)
+        print(f"Capitales récupérées : {found}/{len(capitals_dict)} pays")
         return capitals_dict
 
-    def extract(self) -> pd.DataFrame:
-        """Lit le fichier cities15000.txt et retourne un DataFrame"""
+    @staticmethod
+    def _compact_chunk(chunk: pd.DataFrame, valid_alpha2: set) -> pd.DataFrame:
+        """
+        Convertit un bloc lu en texte vers des types compacts (numériques) et
+        écarte les lignes inutilisables : geoname_id invalide, pays inconnu,
+        nom vide.
+        """
+        chunk["geoname_id"] = pd.to_numeric(chunk["geoname_id"], errors="coerce")
+        chunk["latitude"] = pd.to_numeric(chunk["latitude"], errors="coerce")
+        chunk["longitude"] = pd.to_numeric(chunk["longitude"], errors="coerce")
+        chunk["pop"] = (
+            pd.to_numeric(chunk["pop"], errors="coerce").fillna(0).astype("int64")
+        )
+        chunk["country_3166a2"] = (
+            chunk["country_3166a2"].fillna("").str.strip().str.lower()
+        )
+        chunk["name_en"] = chunk["name_en"].fillna("").str.strip()
+
+        keep = (
+            chunk["geoname_id"].notna()
+            & chunk["country_3166a2"].isin(valid_alpha2)
+            & (chunk["name_en"] != "")
+        )
+        return chunk[keep].astype({"geoname_id": "int64"})
+
+    def _top_cities(self, df: pd.DataFrame, candidates: pd.Series) -> pd.DataFrame:
+        """
+        Réduit un ensemble de villes au strict nécessaire pour
+        select_cities_per_country : tous les candidats capitale, plus les
+        max_cities_per_country villes les plus peuplées de chaque pays parmi
+        les autres. Appliqué après chaque bloc, le résultat final est identique
+        à une sélection sur le fichier entier.
+        """
+        others = df[~candidates].sort_values("pop", ascending=False, kind="stable")
+        rank = others.groupby("country_3166a2").cumcount()
+        kept = pd.concat([df[candidates], others[rank < self.max_cities_per_country]])
+        return kept.sort_values(
+            ["country_3166a2", "pop"], ascending=[True, False], kind="stable"
+        ).reset_index(drop=True)
+
+    def extract(self) -> dict:
+        """
+        Lit le dump GeoNames par blocs (colonnes utiles uniquement).
+        Chaque bloc est filtré dès sa lecture ; avec max_cities_per_country,
+        seuls les candidats capitale et les villes les plus peuplées de chaque
+        pays sont conservés d'un bloc à l'autre (mémoire bornée).
+
+        Returns:
+            {"villes": DataFrame, "pays": DataFrame, "capitales": dict ou None}
+        """
         print(f"Lecture de {self.input_path}...")
 
         if not self.input_path.exists():
             raise FileNotFoundError(f"Fichier introuvable: {self.input_path}")
 
-        df = pd.read_csv(
+        df_countries = pd.read_csv(self.countries_path, dtype=str)
+        print(df_countries)
+        valid_alpha2 = set(
+            df_countries["alpha2"].dropna().str.strip().str.lower().tolist()
+        )
+
+        # Capitales nécessaires pour ne pas écarter une capitale peu peuplée
+        capitals_dict = None
+        if self.max_cities_per_country is not None:
+            capitals_dict = self.get_country_capitals(sorted(valid_alpha2))
+
+        reader = pd.read_csv(
             self.input_path,
             sep="\t",
             names=self.columns,
+            usecols=self.keep_columns,
             index_col=False,  # la première colonne est une donnée, pas index
             header=None,
             encoding="utf-8",
-            low_memory=False,
             dtype=str,
             na_values=[""],
             keep_default_na=False,
+            quoting=csv.QUOTE_NONE,  # GeoNames n'utilise pas de guillemets
+            chunksize=self.chunksize,
         )
+        read_count = 0
+        parts: List[pd.DataFrame] = []
+        kept = pd.DataFrame(columns=self.keep_columns)
+        for chunk in reader:
+            read_count += len(chunk)
+            chunk = self._compact_chunk(chunk, valid_alpha2)
+            if capitals_dict is None:
+                parts.append(chunk)
+                continue
+            merged = pd.concat([kept, chunk], ignore_index=True) if len(kept) else chunk
+            candidates = self.flag_capitals(merged, capitals_dict, approx_all=True)
+            kept = self._top_cities(merged, candidates)
+
+        if capitals_dict is None:
+            df = (
+                pd.concat(parts, ignore_index=True)
+                if parts
+                else pd.DataFrame(columns=self.keep_columns)
+            )
+        else:
+            df = kept
+
+        print(f"{read_count} lignes lues, {len(df)} lignes extraites")
+        return {"villes": df, "pays": df_countries, "capitales": capitals_dict}
 
-        print(f"{len(df)} lignes extraites")
+    def transform(self, data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """Détecte les capitales et sélectionne les villes de chaque pays"""
+        print("Transformation des données...")
+        df = data["villes"][self.keep_columns].copy()
 
-        df_countries = pd.read_csv(self.countries_path, dtype=str)
-        print(df_countries)
+        # Enrichissement: déterminer les capitales (déjà récupérées par extract)
+        capitals_dict = data.get("capitales")
+        if capitals_dict is None:
+            unique_countries = df["country_3166a2"].unique().tolist()
+            capitals_dict = self.get_country_capitals(unique_countries)
 
-        return {"villes": df, "pays": df_countries}
+        df["is_capital"] = self.flag_capitals(df, capitals_dict)
 
-    def transform(self, data: dict[str, pd.DataFrame]) -> pd.DataFrame:
-        """Transforme le DataFrame: ne garde que les colonnes nécessaires"""
-        print("Transformation des données...")
-        df = data["villes"]
-        df_countries = data["pays"]
-        # Ne garder que les colonnes utiles
-        df = df[self.keep_columns].copy()
-
-        # Convertir geoname_id en int
-        df["geoname_id"] = pd.to_numeric(df["geoname_id"], errors="coerce")
-
-        # Supprimer les lignes où geoname_id est invalide
-        invalid_ids = df["geoname_id"].isna().sum()
-        if invalid_ids > 0:
-            print(f"{invalid_ids} lignes avec geoname_id invalide supprimées")
-            df = df.dropna(subset=["geoname_id"])
-
-        # filtrage country_3166a2
-        valid_alpha2 = df_countries["alpha2"].dropna().str.strip().str.lower().tolist()
-        df["country_3166a2"] = df["country_3166a2"].fillna("").str.strip().str.lower()
-        df = df[df["country_3166a2"].isin(valid_alpha2)]
-
-        # Nettoyer les valeurs textuelles
-        df["name_en"] = df["name_en"].fillna("").str.strip()
-
-        # Convertir latitude et longitude en float
-        df["latitude"] = pd.to_numeric(df["latitude"], errors="coerce")
-        df["longitude"] = pd.to_numeric(df["longitude"], errors="coerce")
-
-        # Convertir pop en int pour le tri
-        df["pop"] = pd.to_numeric(df["pop"], errors="coerce").fillna(0).astype(int)
-
-        # Supprimer les lignes sans nom
-        initial_count = len(df)
-        df = df[df["name_en"] != ""]
-        removed = initial_count - len(df)
-        if removed > 0:
-            print(f"{removed} lignes sans nom supprimées")
-
-        # Enrichissement: déterminer les capitales
-        unique_countries = df["country_3166a2"].unique().tolist()
-        capitals_dict = self.get_country_capitals(unique_countries)
-
-        # Fonction pour vérifier si une ville est capitale
-        def is_capital(row):
-            country_code = row["country_3166a2"]
-            city_name = row["name_en"]
-            candidates = capitals_dict.get(country_code, [])
-            return any(ETLUtils.similarity(city_name, cap) >= 0.8 for cap in candidates)
-
-        df["is_capital"] = df.apply(is_capital, axis=1)
-
-        # Trier par pays et population, puis ne garder que les 4 plus peuplées par pays
-        # La V2 pourra avoir une base plus importante...
-        df = df.sort_values(["country_3166a2", "pop"], ascending=[True, False])
-
-        # Pour chaque pays : garder la capitale + les 3 villes les plus peuplées (ou 4 si pas de capitale)
-        def select_cities_per_country(group):
-            capitals = group[group["is_capital"] == True]
-            non_capitals = group[group["is_capital"] == False]
-
-            if len(capitals) > 0:
-                return pd.concat([capitals.head(1), non_capitals.head(3)])
-            else:
-                return non_capitals.head(4)
-
-        df = (
-            df.groupby("country_3166a2", group_keys=False)
-            .apply(select_cities_per_country)
-            .reset_index(drop=True)
+        # Trier par pays, capitale en tête, puis population décroissante
+        df = df.sort_values(
+            ["country_3166a2", "is_capital", "pop"], ascending=[True, False, False]
         )
+        df = self.select_cities_per_country(df)
 
         print(f"{len(df)} lignes transformées")
         return df
 
+    @staticmethod
+    def flag_capitals(
+        df: pd.DataFrame,
+        capitals_dict: Dict[str, List[str]],
+        threshold: float = 0.8,
+        approx_all: bool = False,
+    ) -> pd.Series:
+        """
+        Détermine les capitales en deux passes :
+          1. jointure exacte (pays, nom normalisé) entre villes et capitales
+          2. similarité de Levenshtein (>= threshold) uniquement pour les pays
+             encore sans capitale, sur les villes de longueur compatible
+
+        Args:
+            df: Villes (colonnes country_3166a2, name_en)
+            capitals_dict: {code pays: [noms de capitales]}
+            threshold: Score de similarité minimal pour la passe approchée
+            approx_all: Passe approchée pour tous les pays (candidats capitale
+                d'un bloc partiel, voir extract)
+
+        Returns:
+            Série booléenne alignée sur df
+        """
+        is_cap = pd.Series(False, index=df.index)
+        caps = pd.DataFrame(
+            [(code, cap) for code, names in capitals_dict.items() for cap in names],
+            columns=["country_3166a2", "capital"],
+        )
+        if caps.empty or df.empty:
+            return is_cap
+
+        caps["key"] = ETLUtils.normalize_series(caps["capital"])
+        keys = ETLUtils.normalize_series(df["name_en"])
+
+        # 1. Correspondance exacte sur le nom normalisé
+        cap_pairs = pd.MultiIndex.from_frame(caps[["country_3166a2", "key"]])
+        city_pairs = pd.MultiIndex.from_arrays([df["country_3166a2"], keys])
+        is_cap[:] = city_pairs.isin(cap_pairs)
+
+        # 2. Correspondance approchée pour les pays restants
+        found = set() if approx_all else set(df.loc[is_cap, "country_3166a2"])
+        pending = caps[~caps["country_3166a2"].isin(found) & (caps["key"] != "")]
+        if pending.empty:
+            return is_cap
+
+        positions = df.groupby("country_3166a2").indices
+        lengths = keys.str.len().to_numpy()
+        flags = is_cap.to_numpy().copy()
+        for country, cap_key in pending[["country_3166a2", "key"]].itertuples(
+            index=False
+        ):
+            pos = positions.get(country)
+            if pos is None:
+                continue
+            # Au-delà de cet écart de longueur, le score ne peut pas atteindre le seuil
+            max_len = np.maximum(lengths[pos], len(cap_key))
+            pos = pos[np.abs(lengths[pos] - len(cap_key)) <= (1 - threshold) * max_len]
+            if len(pos) == 0:
+                continue
+            scores = ETLUtils.similarity_many(cap_key, keys.iloc[pos].tolist())
+            flags[pos[scores >= threshold]] = True
+
+        return pd.Series(flags, index=df.index)
+
+    def select_cities_per_country(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Pour chaque pays : la capitale + les villes les plus peuplées,
+        dans la limite de max_cities_per_country (ex: 4 -> capitale + 3, ou 4 sans capitale).
+        Sélection vectorisée par rang (cumcount), sans apply par groupe.
+
+        Args:
+            df: Villes triées par pays, is_capital décroissant, pop décroissante
+
+        Returns:
+            DataFrame filtré
+        """
+        if self.max_cities_per_country is None:
+            return df.reset_index(drop=True)
+
+        is_cap = df["is_capital"].astype(bool)
+        rank = df.groupby([df["country_3166a2"], is_cap]).cumcount()
+        has_cap = is_cap.groupby(df["country_3166a2"]).transform("any")
+        quota = self.max_cities_per_country - has_cap.astype(int)
+
+        keep = (is_cap & (rank == 0)) | (~is_cap & (rank < quota))
+        return df[keep].reset_index(drop=True)
+
     def load_csv(self, df: pd.DataFrame) -> Path:
         """Sauvegarde le DataFrame dans villes.csv"""
         print(f"Sauvegarde dans {self.output_path}...")
@@ -0,0 +1,200 @@
+import json
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+
+
+class MeteoRunJournal:
+    """
+    Journal de progression persistant (SQLite) des exécutions de l'ETL météo.
+
+    Chaque exécution (run_id) enregistre ses paramètres et le plan par ville
+    (coordonnées, fetch_start, cut_date) puis l'état de chaque ville :
+    pending -> fetched -> transformed -> loaded (ou failed).
+    Une reprise relit les paramètres et ne retraite que les villes non chargées :
+    fetched / transformed ne sont que des jalons de suivi (données en mémoire),
+    ces villes sont de nouveau récupérées.
+    """
+
+    # États d'une ville dans l'ordre du pipeline
+    PENDING = "pending"
+    FETCHED = "fetched"
+    TRANSFORMED = "transformed"
+    LOADED = "loaded"
+    FAILED = "failed"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id TEXT PRIMARY KEY,
+            params TEXT NOT NULL,
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS run_cities (
+            run_id TEXT NOT NULL REFERENCES runs(run_id),
+            geoname_id INTEGER NOT NULL,
+            latitude REAL NOT NULL,
+            longitude REAL NOT NULL,
+            fetch_start TEXT,
+            cut_date TEXT,
+            state TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            error TEXT,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (run_id, geoname_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_run_cities_state ON run_cities (run_id, state);
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Fichier SQLite du journal (créé si absent)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Connexion partagée entre les threads du pipeline, sérialisée par un verrou
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat(timespec="seconds")
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+    # ======================= EXÉCUTIONS =======================
+    def start_run(
+        self, params: dict, villes: pd.DataFrame, run_id: Optional[str] = None
+    ) -> str:
+        """
+        Enregistre une nouvelle exécution et son plan (toutes villes en pending).
+
+        Args:
+            params: Paramètres de l'ETL (sérialisables en JSON)
+            villes: geoname_id, latitude, longitude[, fetch_start, cut_date]
+
+        Returns:
+            Identifiant de l'exécution
+        """
+        run_id = run_id or datetime.now().strftime("%Y%m%d-%H%M%S-") + uuid.uuid4().hex[:6]
+        now = self._now()
+        fetch_start = (
+            villes["fetch_start"] if "fetch_start" in villes.columns else [None] * len(villes)
+        )
+        cut_date = (
+            villes["cut_date"] if "cut_date" in villes.columns else [None] * len(villes)
+        )
+        rows = [
+            (
+                run_id,
+                int(gid),
+                float(lat),
+                float(lon),
+                start if isinstance(start, str) else None,
+                cut.isoformat() if cut is not None and not pd.isna(cut) else None,
+                self.PENDING,
+                now,
+            )
+            for gid, lat, lon, start, cut in zip(
+                villes["geoname_id"],
+                villes["latitude"],
+                villes["longitude"],
+                fetch_start,
+                cut_date,
+            )
+        ]
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO runs (run_id, params, status, created_at, updated_at) "
+                "VALUES (?, ?, 'running', ?, ?)",
+                (run_id, json.dumps(params, default=str), now, now),
+            )
+            self.conn.executemany(
+                "INSERT INTO run_cities (run_id, geoname_id, latitude, longitude, "
+                "fetch_start, cut_date, state, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return run_id
+
+    def get_params(self, run_id: str) -> dict:
+        """
+        Paramètres d'une exécution.
+
+        Raises:
+            ValueError: Si l'exécution est inconnue
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT params FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        if row is None:
+            raise ValueError(f"Exécution inconnue : {run_id}")
+        return json.loads(row[0])
+
+    def set_status(self, run_id: str, status: str) -> None:
+        """Statut global de l'exécution (running, done, failed)"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE runs SET status = ?, updated_at = ? WHERE run_id = ?",
+                (status, self._now(), run_id),
+            )
+
+    # ======================= VILLES =======================
+    def mark(
+        self,
+        run_id: str,
+        geoname_ids: Iterable[int],
+        state: str,
+        error: Optional[str] = None,
+    ) -> None:
+        """Passe des villes dans l'état `state` (une transaction)"""
+        now = self._now()
+        bump = 1 if state in (self.FETCHED, self.FAILED) else 0
+        rows = [(state, error, bump, now, run_id, int(g)) for g in geoname_ids]
+        if not rows:
+            return
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "UPDATE run_cities SET state = ?, error = ?, attempts = attempts + ?, "
+                "updated_at = ? WHERE run_id = ? AND geoname_id = ?",
+                rows,
+            )
+
+    def remaining(self, run_id: str) -> pd.DataFrame:
+        """
+        Villes non chargées d'une exécution, avec leur plan d'origine.
+
+        Returns:
+            DataFrame geoname_id, latitude, longitude, fetch_start, cut_date
+        """
+        with self.lock:
+            df = pd.read_sql_query(
+                "SELECT geoname_id, latitude, longitude, fetch_start, cut_date "
+                "FROM run_cities WHERE run_id = ? AND state != ? ORDER BY rowid",
+                self.conn,
+                params=(run_id, self.LOADED),
+            )
+        df["cut_date"] = pd.to_datetime(df["cut_date"]).dt.date
+        df["cut_date"] = df["cut_date"].where(df["cut_date"].notna(), None)
+        return df
+
+    def summary(self, run_id: str) -> Dict[str, int]:
+        """Nombre de villes par état"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT state, COUNT(*) FROM run_cities WHERE run_id = ? GROUP BY state",
+                (run_id,),
+            ).fetchall()
+        return dict(rows)
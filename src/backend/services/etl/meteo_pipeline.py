@@ -0,0 +1,277 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from services.etl.meteo_journal import MeteoRunJournal
+
+# Marqueur de fin de flux entre étages
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    """Compteurs d'un étage du pipeline (mis à jour par plusieurs threads)."""
+
+    name: str
+    workers: int
+    items: int = 0  # villes traitées
+    rows: int = 0  # lignes produites / chargées
+    busy_seconds: float = 0.0  # temps cumulé passé à travailler (tous threads)
+    started: Optional[float] = None
+    ended: Optional[float] = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, items: int, rows: int, seconds: float) -> None:
+        with self.lock:
+            self.items += items
+            self.rows += rows
+            self.busy_seconds += seconds
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.ended or time.monotonic()) - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Villes par seconde sur la durée de vie de l'étage"""
+        return self.items / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Part du temps où les threads de l'étage travaillaient (0..1)"""
+        capacity = self.elapsed * self.workers
+        return self.busy_seconds / capacity if capacity > 0 else 0.0
+
+
+class MeteoPipeline:
+    """
+    Exécute l'ETL météo en trois étages concurrents reliés par des files bornées :
+
+      fetch (fetch_workers threads, E/S réseau)
+        -> transform (transform_workers threads, pandas)
+        -> load (1 thread : la connexion MySQL est partagée au niveau classe)
+
+    Une file pleine bloque l'étage amont (backpressure) : la mémoire reste bornée
+    et la durée totale tend vers celle de l'étage le plus lent.
+    """
+
+    def __init__(
+        self,
+        etl,
+        fetch_workers: Optional[int] = None,
+        transform_workers: int = 1,
+        queue_size: int = 8,
+        keep_frames: bool = False,
+    ):
+        """
+        Args:
+            etl: Instance MeteoETL (villes_df chargé)
+            fetch_workers: Threads d'appels API (par défaut : etl.max_workers)
+            transform_workers: Threads de transformation
+            queue_size: Capacité de chaque file inter-étages (en éléments)
+            keep_frames: Conserve les DataFrames pour etl.daily_df / etl.weekly_df
+                (mémoire proportionnelle au nombre de villes : tests uniquement)
+        """
+        self.etl = etl
+        self.fetch_workers = fetch_workers or etl.max_workers
+        self.transform_workers = transform_workers
+        self.keep_frames = keep_frames
+        self.transform_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.load_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.stats = {
+            "fetch": StageStats("fetch", self.fetch_workers),
+            "transform": StageStats("transform", transform_workers),
+            "load": StageStats("load", 1),
+        }
+        self.stop = threading.Event()
+        self.errors: List[BaseException] = []
+        self.daily_frames: List[pd.DataFrame] = []
+        self.weekly_frames: List[pd.DataFrame] = []
+
+    # ======================= OUTILS =======================
+    def _put(self, q: queue.Queue, item) -> bool:
+        """put bloquant (backpressure) mais interruptible si le pipeline s'arrête."""
+        while not self.stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q: queue.Queue):
+        """get bloquant, interruptible si le pipeline s'arrête."""
+        while not self.stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _fail(self, stage: str, e: BaseException) -> None:
+        print(f"Erreur étage {stage}: {e}")
+        self.errors.append(e)
+        self.stop.set()
+
+    # ======================= ÉTAGES =======================
+    def _fetch_worker(self, groups: queue.Queue) -> None:
+        stats = self.stats["fetch"]
+        try:
+            while not self.stop.is_set():
+                try:
+                    group = groups.get_nowait()
+                except queue.Empty:
+                    return
+                t0 = time.monotonic()
+                # Les villes en échec sont omises par _fetch_group
+                frames = self.etl._fetch_group(group)
+                rows = sum(len(f) for f in frames)
+                stats.record(len(frames), rows, time.monotonic() - t0)
+                if frames and not self._put(self.transform_queue, frames):
+                    return
+        except Exception as e:
+            self._fail("fetch", e)
+
+    def _transform_worker(self) -> None:
+        """Regroupe les villes reçues jusqu'à batch_size avant de transformer."""
+        stats = self.stats["transform"]
+        pending: List[pd.DataFrame] = []
+
+        def flush() -> bool:
+            t0 = time.monotonic()
+            weekly = self.etl.transform_weekly(pd.concat(pending, ignore_index=True))
+            stats.record(len(pending), len(weekly), time.monotonic() - t0)
+            self.etl.checkpoint(
+                self.etl.frame_ids(pending), MeteoRunJournal.TRANSFORMED
+            )
+            ok = self._put(self.load_queue, (list(pending), weekly))
+            pending.clear()
+            return ok
+
+        try:
+            while True:
+                frames = self._get(self.transform_queue)
+                if frames is _DONE:
+                    break
+                pending.extend(frames)
+                if len(pending) >= self.etl.batch_size and not flush():
+                    return
+            if pending and not self.stop.is_set():
+                flush()
+        except Exception as e:
+            self._fail("transform", e)
+
+    def _load_worker(self) -> None:
+        stats = self.stats["load"]
+        remaining = self.transform_workers
+        try:
+            while remaining:
+                item = self._get(self.load_queue)
+                if item is _DONE:
+                    if self.stop.is_set():
+                        return
+                    remaining -= 1
+                    continue
+                daily, weekly = item
+                t0 = time.monotonic()
+                loaded = self.etl.load_weekly(weekly)
+                self.etl.persist_daily(daily)
+                self.etl.checkpoint(self.etl.frame_ids(daily), MeteoRunJournal.LOADED)
+                stats.record(len(daily), loaded, time.monotonic() - t0)
+                if self.keep_frames:
+                    self.daily_frames.extend(daily)
+                    self.weekly_frames.append(weekly)
+        except Exception as e:
+            self._fail("load", e)
+
+    # ======================= ORCHESTRATION =======================
+    def _run_stage(self, name: str, threads: List[threading.Thread]) -> None:
+        self.stats[name].started = time.monotonic()
+        for t in threads:
+            t.start()
+
+    def _join_stage(self, name: str, threads: List[threading.Thread]) -> None:
+        for t in threads:
+            t.join()
+        self.stats[name].ended = time.monotonic()
+
+    def run(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Exécute le pipeline pour toutes les villes de etl.villes_df.
+        Renvoie (daily, weekly) concaténés (vides si keep_frames=False).
+        Une erreur de transformation ou de chargement arrête le pipeline
+        et est relancée une fois les threads terminés.
+        """
+        etl = self.etl
+        if etl.villes_df is None:
+            raise ValueError(
+                "Aucune ville chargée. Exécutez extract_from_csv() avant run()."
+            )
+
+        groups: queue.Queue = queue.Queue()
+        for group in etl.request_groups(etl.villes_df):
+            groups.put(group)
+
+        print(
+            f"Pipeline météo : {len(etl.villes_df)} villes, fetch x{self.fetch_workers}, "
+            f"transform x{self.transform_workers}, load x1"
+        )
+
+        fetchers = [
+            threading.Thread(target=self._fetch_worker, args=(groups,), daemon=True)
+            for _ in range(self.fetch_workers)
+        ]
+        transformers = [
+            threading.Thread(target=self._transform_worker, daemon=True)
+            for _ in range(self.transform_workers)
+        ]
+        loader = [threading.Thread(target=self._load_worker, daemon=True)]
+
+        self._run_stage("load", loader)
+        self._run_stage("transform", transformers)
+        self._run_stage("fetch", fetchers)
+
+        self._join_stage("fetch", fetchers)
+        for _ in transformers:
+            self._put(self.transform_queue, _DONE)
+        self._join_stage("transform", transformers)
+        for _ in transformers:
+            self._put(self.load_queue, _DONE)
+        self._join_stage("load", loader)
+
+        self.print_stats()
+        if self.errors:
+            raise self.errors[0]
+
+        etl.daily_df = (
+            pd.concat(self.daily_frames, ignore_index=True)
+            if self.daily_frames
+            else pd.DataFrame()
+        )
+        etl.weekly_df = (
+            pd.concat(self.weekly_frames, ignore_index=True)
+            if self.weekly_frames
+            else pd.DataFrame()
+        )
+        print(f"\nETL terminé : {self.stats['load'].rows} lignes totales en base")
+        return etl.daily_df, etl.weekly_df
+
+    def print_stats(self) -> None:
+        """Affiche les compteurs par étage."""
+        print("\n" + "-" * 60)
+        print(
+            f"{'Étage':<10} {'Villes':>7} {'Lignes':>8} {'Durée':>8} "
+            f"{'Villes/s':>9} {'Occup.':>7}"
+        )
+        for s in self.stats.values():
+            print(
+                f"{s.name:<10} {s.items:>7} {s.rows:>8} {s.elapsed:>7.1f}s "
+                f"{s.throughput:>9.2f} {s.utilization:>6.0%}"
+            )
+        print("-" * 60)
@@ -92,6 +92,27 @@ class LangueService:
         finally:
             MySQLConnection.close()
 
+    @staticmethod
+    def create_or_replace_batch(langues: List[Dict[str, Any]]) -> int:
+        """Crée ou remplace des langues en masse (une transaction)
+
+        Args:
+            langues: Liste des données de langues
+
+        Returns:
+            Nombre de lignes affectées
+        """
+        try:
+            MySQLConnection.connect()
+            rows_affected = LangueOrm.create_or_replace_batch(langues)
+            MySQLConnection.commit()
+            return rows_affected
+        except Exception as e:
+            MySQLConnection.rollback()
+            raise
+        finally:
+            MySQLConnection.close()
+
     @staticmethod
     def update_partial(iso639_2: str, updates: Dict[str, Any]) -> int:
         """Mise à jour partielle d'une langue
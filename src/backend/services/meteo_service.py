@@ -1,11 +1,32 @@
+import re
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional
+import pandas as pd
 from orm.week_meteo_orm import WeekMeteoOrm
+from orm.meteo_daily_parquet import MeteoDailyStore
+from orm.meteo_cube import MeteoCube
+from orm.meteo_normals_orm import MeteoNormalsOrm
+from services.country_service import CountryService
+from services.travel_score_service import TravelScoreService
 from models.week_meteo import WeekMeteo
+from models.meteo_aggregate import MeteoAggregate
+from models.meteo_normal import MeteoNormal
 
 
 class MeteoService:
-    """Service pour la gestion de la météo hebdomadaire"""
+    """Service pour la gestion de la météo hebdomadaire
+
+    Les lectures passent d'abord par le cube exporté par l'ETL (MeteoCube) ;
+    toute écriture l'invalide jusqu'au prochain export, ainsi que la matrice
+    des scores de voyage (TravelScoreService) et le cache des agrégats par
+    pays (CountryService).
+    """
+
+    # Nombre maximal de villes par requête multi-villes
+    MAX_BATCH_IDS = 100
+
+    # Fenêtres acceptées : "<n>d" (1 à 366 jours consécutifs) ou "month" (mois civil)
+    WINDOW_PATTERN = re.compile(r"^(?:(\d{1,3})d|month)$")
 
     @staticmethod
     def get_weeks_for_city(
@@ -26,11 +47,156 @@ class MeteoService:
         Raises:
             ValueError: Si aucune donnée trouvée
         """
-        data = WeekMeteoOrm.get_range(geoname_id, start_date, end_date)
+        # Cube mappé en mémoire d'abord (même sémantique de bornes que get_range :
+        # filtrage seulement si les deux dates sont fournies), MySQL sinon
+        bounds = (start_date, end_date) if start_date and end_date else (None, None)
+        data = MeteoCube.get_range(geoname_id, *bounds)
+        if data is None:
+            data = WeekMeteoOrm.get_range(geoname_id, start_date, end_date)
         if not data:
             raise ValueError("Aucune donnée hebdomadaire")
         return data
 
+    @staticmethod
+    def get_weeks_for_cities(
+        geoname_ids: List[int],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[int, List[WeekMeteo]]:
+        """Récupère les semaines météo de plusieurs villes en une requête
+
+        Args:
+            geoname_ids: IDs GeoNames des villes (doublons ignorés)
+            start_date: Date de début (incluse)
+            end_date: Date de fin (incluse)
+
+        Returns:
+            {geoname_id: semaines}, dans l'ordre des IDs demandés
+            (liste vide pour une ville sans données)
+
+        Raises:
+            ValueError: Si la liste d'IDs est vide ou trop longue
+        """
+        ids = list(dict.fromkeys(geoname_ids))
+        if not ids:
+            raise ValueError("Aucun geoname_id fourni")
+        if len(ids) > MeteoService.MAX_BATCH_IDS:
+            raise ValueError(
+                f"Trop de villes demandées (max {MeteoService.MAX_BATCH_IDS})"
+            )
+
+        grouped: Dict[int, List[WeekMeteo]] = {gid: [] for gid in ids}
+        grouped.update(MeteoCube.get_range_many(ids, start_date, end_date))
+        # Villes absentes du cube : une seule requête IN (...)
+        missing = [gid for gid in ids if not grouped[gid]]
+        for week in WeekMeteoOrm.get_range_many(missing, start_date, end_date):
+            grouped[week.geoname_id].append(week)
+        return grouped
+
+    @staticmethod
+    def get_aggregates(
+        geoname_id: int,
+        window: str = "14d",
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[MeteoAggregate]:
+        """Agrège les relevés quotidiens (Parquet) par fenêtres consécutives
+
+        Les fenêtres "<n>d" partent de start_date (ou du premier jour disponible),
+        "month" suit les mois civils. Les périodes sont bornées à la plage demandée.
+
+        Args:
+            geoname_id: ID GeoNames de la ville
+            window: "7d", "14d", "30d"... ou "month"
+            start_date: Date de début (incluse)
+            end_date: Date de fin (incluse)
+
+        Returns:
+            Liste des agrégats par période
+
+        Raises:
+            ValueError: Si la fenêtre est invalide ou si aucune donnée trouvée
+        """
+        match = MeteoService.WINDOW_PATTERN.match(window or "")
+        if not match or (match.group(1) and not 1 <= int(match.group(1)) <= 366):
+            raise ValueError(f"Fenêtre invalide : {window}")
+        if start_date and end_date and start_date > end_date:
+            raise ValueError("start_date doit précéder end_date")
+
+        daily = MeteoDailyStore.read(geoname_id, start_date, end_date)
+        if daily.empty:
+            raise ValueError("Aucune donnée quotidienne")
+
+        s = daily.assign(date=pd.to_datetime(daily["date"])).set_index("date")
+        if match.group(1):
+            origin = pd.Timestamp(start_date) if start_date else s.index.min()
+            grouper = pd.Grouper(
+                freq=f"{int(match.group(1))}D", origin=origin, label="left"
+            )
+            span = pd.Timedelta(days=int(match.group(1)) - 1)
+        else:
+            grouper = pd.Grouper(freq="MS")
+            span = None
+
+        agg = s.groupby(grouper).agg(
+            days=("tmax", "size"),
+            temperature_max_avg=("tmax", "mean"),
+            temperature_min_avg=("tmin", "mean"),
+            precipitation_sum=("precip_sum", lambda x: x.sum(min_count=1)),
+        )
+        agg = agg[agg["days"] > 0]
+
+        first, last = s.index.min(), s.index.max()
+        result = []
+        for period, row in agg.iterrows():
+            period_end = (
+                period + span if span is not None else period + pd.offsets.MonthEnd(0)
+            )
+            result.append(
+                MeteoAggregate(
+                    geoname_id=geoname_id,
+                    window=window,
+                    period_start=max(period, first).date(),
+                    period_end=min(period_end, last).date(),
+                    days=int(row["days"]),
+                    temperature_max_avg=(
+                        None
+                        if pd.isna(row["temperature_max_avg"])
+                        else round(float(row["temperature_max_avg"]), 2)
+                    ),
+                    temperature_min_avg=(
+                        None
+                        if pd.isna(row["temperature_min_avg"])
+                        else round(float(row["temperature_min_avg"]), 2)
+                    ),
+                    precipitation_sum=(
+                        None
+                        if pd.isna(row["precipitation_sum"])
+                        else round(float(row["precipitation_sum"]), 2)
+                    ),
+                )
+            )
+        return result
+
+    @staticmethod
+    def get_normals(geoname_id: int, week: Optional[int] = None) -> List[MeteoNormal]:
+        """Récupère les normales pluriannuelles d'une ville (précalculées par l'ETL)
+
+        Args:
+            geoname_id: ID GeoNames de la ville
+            week: Semaine ISO (1 à 53), toutes les semaines si None
+
+        Returns:
+            Liste des normales par semaine ISO
+
+        Raises:
+            ValueError: Si aucune normale trouvée
+        """
+        data = MeteoNormalsOrm.get_for_city(geoname_id, week)
+        if not data:
+            raise ValueError("Aucune normale climatique")
+        return data
+
     @staticmethod
     def get_all(skip: int = 0, limit: int = 100) -> List[WeekMeteo]:
         """Liste toutes les semaines météo avec pagination
@@ -54,6 +220,9 @@ class MeteoService:
         Returns:
             Semaine créée/mise à jour
         """
+        MeteoCube.invalidate()
+        TravelScoreService.invalidate()
+        CountryService.invalidate()
         return WeekMeteoOrm.upsert(week_data)
 
     @staticmethod
@@ -66,6 +235,9 @@ class MeteoService:
         Returns:
             Nombre de lignes upsertées
         """
+        MeteoCube.invalidate()
+        TravelScoreService.invalidate()
+        CountryService.invalidate()
         return WeekMeteoOrm.bulk_upsert(items)
 
     @staticmethod
@@ -93,6 +265,9 @@ class MeteoService:
         for k, v in changes.items():
             data[k] = v
 
+        MeteoCube.invalidate()
+        TravelScoreService.invalidate()
+        CountryService.invalidate()
         return WeekMeteoOrm.upsert(WeekMeteo(**data))
 
     @staticmethod
@@ -106,4 +281,7 @@ class MeteoService:
         Returns:
             True si supprimée, False si non trouvée
         """
+        MeteoCube.invalidate()
+        TravelScoreService.invalidate()
+        CountryService.invalidate()
         return WeekMeteoOrm.delete(geoname_id, week_start_date)
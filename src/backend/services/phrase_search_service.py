@@ -0,0 +1,247 @@
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from orm.conversation_orm import ConversationOrm
+from models.phrase import PhraseMatch, PhrasePivot, PhraseTranslation
+from utils.utils import ETLUtils
+
+
+class PhraseIndex:
+    """
+    Index inversé en mémoire sur le texte normalisé des phrases (ETLUtils :
+    sans accents, minuscules, sans ponctuation) de toutes les conversations.
+    Une entrée = un triplet (langue, clé, phrase) ; chaque jeton pointe vers les
+    entrées qui le contiennent et sa fréquence dans chacune.
+    Les langues sans espaces entre les mots (chinois, japonais...) ne sont
+    trouvées que sur la phrase entière.
+
+    Sert aussi de catalogue des clés : matrice de couverture langue x clé
+    (True si la langue a une phrase non vide pour cette clé).
+    """
+
+    # Paramètres BM25 usuels (saturation de la fréquence, normalisation de longueur)
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, documents: List[dict]):
+        langs, keys, sentences = [], [], []
+        for doc in documents:
+            lang = str(doc.get("lang639-2") or "").lower()
+            for key, sentence in (doc.get("sentences") or {}).items():
+                if lang and isinstance(sentence, str) and sentence.strip():
+                    langs.append(lang)
+                    keys.append(key)
+                    sentences.append(sentence)
+
+        self.langs = np.array(langs, dtype=object)
+        self.keys = keys
+        self.sentences = sentences
+
+        self.coverage_langs, lang_slots = np.unique(self.langs, return_inverse=True)
+        self.coverage_keys, key_slots = np.unique(
+            np.array(keys, dtype=object), return_inverse=True
+        )
+        self.coverage = np.zeros(
+            (len(self.coverage_langs), len(self.coverage_keys)), dtype=bool
+        )
+        self.coverage[lang_slots, key_slots] = True
+        self._key_slots = {str(k): i for i, k in enumerate(self.coverage_keys)}
+
+        tokens = [t.split() for t in ETLUtils.normalize_series(pd.Series(sentences))]
+        self.lengths = np.array([len(t) for t in tokens], dtype=np.float64)
+        self.avg_length = float(self.lengths.mean()) if len(tokens) else 0.0
+
+        postings: Dict[str, Dict[int, int]] = {}
+        for entry, entry_tokens in enumerate(tokens):
+            for token in entry_tokens:
+                tf = postings.setdefault(token, {})
+                tf[entry] = tf.get(entry, 0) + 1
+        # jeton -> (indices des entrées, fréquences), idf précalculé
+        self.postings = {
+            token: (
+                np.fromiter(tf.keys(), dtype=np.int64, count=len(tf)),
+                np.fromiter(tf.values(), dtype=np.float64, count=len(tf)),
+            )
+            for token, tf in postings.items()
+        }
+        n = len(tokens)
+        self.idf = {
+            token: float(np.log1p((n - len(tf) + 0.5) / (len(tf) + 0.5)))
+            for token, tf in postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+    def langs_with_key(self, key: str, langs: Optional[List[str]] = None) -> List[str]:
+        """
+        Langues possédant la clé, d'après la matrice de couverture
+
+        Args:
+            key: Clé de la phrase
+            langs: Langues candidates, ordre conservé (toutes si None)
+
+        Returns:
+            Codes ISO 639-2 couverts
+        """
+        slot = self._key_slots.get(key)
+        if slot is None:
+            return []
+        covered = set(self.coverage_langs[self.coverage[:, slot]])
+        if langs is None:
+            return sorted(covered)
+        return [lang for lang in langs if lang in covered]
+
+    def search(
+        self, query: str, langs: Optional[List[str]] = None, limit: int = 20
+    ) -> List[PhraseMatch]:
+        """
+        Entrées contenant au moins un jeton de la requête, classées par score BM25
+        (somme sur les jetons, les plus rares pèsent le plus).
+
+        Args:
+            query: Texte recherché (normalisé comme les phrases)
+            langs: Codes ISO 639-2 à conserver (toutes les langues si None)
+            limit: Nombre max de résultats
+
+        Returns:
+            Triplets (langue, clé, phrase) par pertinence décroissante
+        """
+        scores = np.zeros(len(self))
+        for token in set(ETLUtils.normalize(query).split()):
+            if token not in self.postings:
+                continue
+            entries, tf = self.postings[token]
+            norm = self.K1 * (
+                1 - self.B + self.B * self.lengths[entries] / self.avg_length
+            )
+            scores[entries] += self.idf[token] * tf * (self.K1 + 1) / (tf + norm)
+
+        if langs:
+            scores[~np.isin(self.langs, list(langs))] = 0.0
+        idx = np.flatnonzero(scores > 0)
+        if limit < len(idx):
+            idx = idx[np.argpartition(-scores[idx], limit - 1)[:limit]]
+        idx = idx[np.argsort(-scores[idx], kind="stable")]
+
+        return [
+            PhraseMatch(
+                lang639_2=self.langs[i],
+                key=self.keys[i],
+                sentence=self.sentences[i],
+                score=round(float(scores[i]), 4),
+            )
+            for i in idx
+        ]
+
+
+class PhraseSearchService:
+    """Service de recherche plein texte dans les phrases des conversations
+    et de lecture d'une phrase dans plusieurs langues"""
+
+    # Durée (s) pendant laquelle l'index est servi sans relire MongoDB
+    # (les écritures passant par l'API l'invalident immédiatement)
+    CACHE_TTL = 300.0
+
+    # Clés de phrases : lettres, chiffres et _ (utilisées dans une projection)
+    KEY_PATTERN = re.compile(r"^[A-Za-z0-9_]{1,64}$")
+
+    _index: Optional[PhraseIndex] = None
+    _built_at: float = 0.0
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_index(cls) -> PhraseIndex:
+        """Index courant, reconstruit depuis MongoDB s'il est absent ou expiré"""
+        with cls._lock:
+            now = time.monotonic()
+            if cls._index is None or now - cls._built_at >= cls.CACHE_TTL:
+                cls._index = PhraseIndex(ConversationOrm.find_all_sentences())
+                cls._built_at = now
+            return cls._index
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Force la reconstruction de l'index au prochain appel"""
+        with cls._lock:
+            cls._index = None
+
+    @staticmethod
+    def parse_langs(langs: Optional[str]) -> Optional[List[str]]:
+        """Liste "fra,spa,deu" -> ["fra", "spa", "deu"] (None si vide)
+
+        Raises:
+            ValueError: Si un code n'est pas un code ISO 639-2 (3 lettres)
+        """
+        codes = [c.strip().lower() for c in (langs or "").split(",") if c.strip()]
+        invalid = [c for c in codes if len(c) != 3 or not c.isalpha()]
+        if invalid:
+            raise ValueError(f"Codes langue invalides : {', '.join(invalid)}")
+        return list(dict.fromkeys(codes)) or None
+
+    @classmethod
+    def search(
+        cls, query: str, langs: Optional[List[str]] = None, limit: int = 20
+    ) -> List[PhraseMatch]:
+        """Recherche une phrase dans toutes les langues (ou celles demandées)
+
+        Args:
+            query: Texte recherché
+            langs: Codes ISO 639-2 à conserver
+            limit: Nombre max de résultats
+
+        Returns:
+            Triplets (langue, clé, phrase) classés par pertinence
+
+        Raises:
+            ValueError: Si la requête ne contient aucun mot exploitable
+        """
+        if not ETLUtils.normalize(query):
+            raise ValueError("Requête vide après normalisation")
+        return cls.get_index().search(query, langs, limit)
+
+    @classmethod
+    def get_phrase(cls, key: str, langs: Optional[List[str]] = None) -> PhrasePivot:
+        """Une phrase dans plusieurs langues
+
+        Le catalogue des clés (matrice de couverture de l'index) restreint le $in
+        aux langues qui possèdent la clé : une seule requête MongoDB, projetée
+        sur sentences.<key>, et aucune si aucune langue ne l'a.
+
+        Args:
+            key: Clé de la phrase (ex: 'THANK_YOU')
+            langs: Codes ISO 639-2, ordre conservé (toutes les langues si None)
+
+        Returns:
+            Traductions disponibles et langues demandées sans cette phrase
+
+        Raises:
+            ValueError: Si la clé est invalide ou absente de toutes les langues
+        """
+        if not cls.KEY_PATTERN.match(key or ""):
+            raise ValueError(f"Clé de phrase invalide : '{key}'")
+
+        covered = cls.get_index().langs_with_key(key, langs)
+        if not covered:
+            raise ValueError(f"Phrase '{key}' introuvable")
+
+        found = {}
+        for doc in ConversationOrm.find_sentence(key, covered):
+            sentence = (doc.get("sentences") or {}).get(key)
+            if isinstance(sentence, str) and sentence.strip():
+                found[str(doc.get("lang639-2")).lower()] = sentence
+
+        return PhrasePivot(
+            key=key,
+            translations=[
+                PhraseTranslation(lang639_2=lang, sentence=found[lang])
+                for lang in covered
+                if lang in found
+            ],
+            missing=[lang for lang in (langs or []) if lang not in found],
+        )
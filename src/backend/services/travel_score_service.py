@@ -0,0 +1,346 @@
+import threading
+import warnings
+import time
+from datetime import date
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from orm.week_meteo_orm import WeekMeteoOrm
+from models.travel_score import ComfortProfile, WeekScore, CityScore, SimilarCity
+
+# Semaines ISO 1..53 -> index 0..52
+WEEKS = 53
+METRICS = ("temperature_max_avg", "temperature_min_avg", "precipitation_sum")
+# Mois de chaque semaine ISO (celui de son jeudi ; année de référence à 52 semaines)
+WEEK_MONTHS = np.array([date.fromisocalendar(2021, w, 4).month for w in range(1, 53)] + [12])
+
+
+class ClimateMatrix:
+    """
+    Copie en mémoire de Meteo_Weekly : tableau dense ville x semaine ISO x métrique
+    (T° max, T° min, précipitations), moyenné sur les années chargées.
+    Une cellule sans donnée vaut NaN.
+    """
+
+    def __init__(self, rows: List[dict], signature: tuple = ()):
+        self.signature = signature
+        df = pd.DataFrame(
+            rows,
+            columns=["geoname_id", "name_en", "country_3166a2", "iso_week", *METRICS],
+        )
+        self.geoname_ids, first, inverse = np.unique(
+            df["geoname_id"].to_numpy(dtype=np.int64),
+            return_index=True,
+            return_inverse=True,
+        )
+        self.names = df["name_en"].to_numpy(dtype=object)[first]
+        self.countries = (
+            df["country_3166a2"].fillna("").str.lower().to_numpy(dtype=object)[first]
+        )
+        self.index = {int(g): i for i, g in enumerate(self.geoname_ids)}
+
+        # Moyenne interannuelle par (ville, semaine) : sommes et effectifs accumulés
+        values = df[list(METRICS)].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(values)
+        weeks = df["iso_week"].to_numpy(dtype=np.int64) - 1
+        shape = (len(self.geoname_ids), WEEKS, len(METRICS))
+        sums = np.zeros(shape)
+        counts = np.zeros(shape)
+        np.add.at(sums, (inverse, weeks), np.where(valid, values, 0.0))
+        np.add.at(counts, (inverse, weeks), valid)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.values = (sums / counts).astype(np.float32)
+        self._normalized: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.geoname_ids)
+
+    def normalized(self) -> np.ndarray:
+        """
+        Valeurs centrées-réduites par métrique (moyenne et écart-type sur toutes
+        les cellules renseignées), calculées une fois par matrice : les distances
+        ne dépendent pas des unités (°C, mm).
+        """
+        if self._normalized is None:
+            flat = self.values.reshape(-1, len(METRICS)).astype(np.float64)
+            with np.errstate(invalid="ignore"), warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                mean = np.nanmean(flat, axis=0)
+                std = np.nanstd(flat, axis=0)
+            std = np.where(np.isfinite(std) & (std > 0), std, 1.0)
+            self._normalized = ((self.values - mean) / std).astype(np.float32)
+        return self._normalized
+
+
+def comfort_scores(values: np.ndarray, profile: ComfortProfile) -> np.ndarray:
+    """
+    Score de confort 0-100 sur le dernier axe (T° max, T° min, précipitations)
+    de `values`, pour n'importe quelle forme (ville x semaine x 3, ville x 3...).
+    T° : gaussienne centrée sur ideal_temp ; pluie : décroissance exponentielle.
+    NaN si la T° max ou la pluie manque.
+    """
+    tmax = values[..., 0]
+    precip = values[..., 2]
+    temp_score = np.exp(-0.5 * ((tmax - profile.ideal_temp) / profile.temp_tolerance) ** 2)
+    rain_score = np.exp(-np.maximum(precip, 0) / profile.rain_tolerance)
+    w = profile.rain_weight
+    return 100.0 * ((1 - w) * temp_score + w * rain_score)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices des k meilleurs scores (NaN ignorés), par score décroissant"""
+    idx = np.flatnonzero(np.isfinite(scores))
+    if k < len(idx):
+        idx = idx[np.argpartition(-scores[idx], k - 1)[:k]]
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+def period_mean(values: np.ndarray, weeks: np.ndarray) -> np.ndarray:
+    """Moyenne ville x métrique sur les semaines `weeks` (NaN ignorés)"""
+    block = values[:, weeks, :]
+    valid = np.isfinite(block)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(valid, block, 0).sum(axis=1) / valid.sum(axis=1)
+
+
+def _num(value, digits: int = 2) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+class TravelScoreService:
+    """Service « meilleure période pour voyager » (scores de confort météo,
+    villes au climat similaire)"""
+
+    # Durée (s) pendant laquelle la matrice est servie sans vérifier la base
+    CACHE_TTL = 300.0
+
+    _matrix: Optional[ClimateMatrix] = None
+    _checked_at: float = 0.0
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_matrix(cls) -> ClimateMatrix:
+        """Matrice ville x semaine, reconstruite si Meteo_Weekly a changé
+
+        Après CACHE_TTL secondes, l'empreinte de la table (nombre de lignes,
+        dates extrêmes, MAX(updated_at)) est relue ; la matrice n'est rechargée
+        que si elle diffère. Les écritures de l'API appellent invalidate().
+        """
+        with cls._lock:
+            now = time.monotonic()
+            if cls._matrix is not None and now - cls._checked_at < cls.CACHE_TTL:
+                return cls._matrix
+            signature = WeekMeteoOrm.get_signature()
+            if cls._matrix is None or cls._matrix.signature != signature:
+                cls._matrix = ClimateMatrix(WeekMeteoOrm.get_week_metrics(), signature)
+            cls._checked_at = now
+            return cls._matrix
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Force le rechargement de la matrice au prochain appel"""
+        with cls._lock:
+            cls._matrix = None
+
+    @classmethod
+    def top_weeks_for_city(
+        cls, geoname_id: int, profile: ComfortProfile, limit: int = 5
+    ) -> List[WeekScore]:
+        """Meilleures semaines ISO pour une ville
+
+        Args:
+            geoname_id: ID GeoNames de la ville
+            profile: Préférences de confort
+            limit: Nombre de semaines renvoyées
+
+        Returns:
+            Semaines triées par score décroissant
+
+        Raises:
+            ValueError: Si aucune donnée météo pour la ville
+        """
+        matrix = cls.get_matrix()
+        row = matrix.index.get(int(geoname_id))
+        if row is None:
+            raise ValueError("Aucune donnée météo pour cette ville")
+
+        values = matrix.values[row]
+        scores = comfort_scores(values, profile)
+        return [
+            WeekScore(
+                iso_week=int(w) + 1,
+                score=_num(scores[w], 1),
+                temperature_max_avg=_num(values[w, 0]),
+                temperature_min_avg=_num(values[w, 1]),
+                precipitation_sum=_num(values[w, 2]),
+            )
+            for w in top_k(scores, limit)
+        ]
+
+    @classmethod
+    def top_weeks_for_country(
+        cls, alpha2: str, profile: ComfortProfile, limit: int = 5
+    ) -> List[WeekScore]:
+        """Meilleures semaines ISO pour un pays (score moyen de ses villes)
+
+        Args:
+            alpha2: Code ISO 3166-1 alpha-2
+            profile: Préférences de confort
+            limit: Nombre de semaines renvoyées
+
+        Returns:
+            Semaines triées par score moyen décroissant
+
+        Raises:
+            ValueError: Si aucune ville du pays n'a de données météo
+        """
+        matrix = cls.get_matrix()
+        mask = matrix.countries == alpha2.lower().strip()
+        if not mask.any():
+            raise ValueError(f"Aucune donnée météo pour le pays '{alpha2}'")
+
+        values = matrix.values[mask]
+        scores = comfort_scores(values, profile)
+        scored = np.isfinite(scores)
+        counts = scored.sum(axis=0)
+        # Moyennes par semaine sur les seules villes notées (NaN si aucune)
+        selected = np.where(scored[..., None], values, np.nan)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_scores = np.where(scored, scores, 0).sum(axis=0) / counts
+            mean_values = np.nansum(selected, axis=0) / np.isfinite(selected).sum(
+                axis=0
+            )
+        return [
+            WeekScore(
+                iso_week=int(w) + 1,
+                score=_num(mean_scores[w], 1),
+                temperature_max_avg=_num(mean_values[w, 0]),
+                temperature_min_avg=_num(mean_values[w, 1]),
+                precipitation_sum=_num(mean_values[w, 2]),
+                cities_count=int(counts[w]),
+            )
+            for w in top_k(mean_scores, limit)
+        ]
+
+    @classmethod
+    def top_cities_for_week(
+        cls,
+        iso_week: int,
+        profile: ComfortProfile,
+        limit: int = 10,
+        country: Optional[str] = None,
+    ) -> List[CityScore]:
+        """Meilleures villes pour une semaine ISO
+
+        Args:
+            iso_week: Semaine ISO (1 à 53)
+            profile: Préférences de confort
+            limit: Nombre de villes renvoyées
+            country: Restreint aux villes d'un pays (alpha-2)
+
+        Returns:
+            Villes triées par score décroissant
+
+        Raises:
+            ValueError: Si la semaine est invalide ou sans donnée
+        """
+        if not 1 <= iso_week <= WEEKS:
+            raise ValueError(f"Semaine ISO invalide : {iso_week}")
+        matrix = cls.get_matrix()
+        values = matrix.values[:, iso_week - 1, :]
+        scores = comfort_scores(values, profile)
+        if country:
+            scores = np.where(matrix.countries == country.lower().strip(), scores, np.nan)
+
+        best = top_k(scores, limit)
+        if len(best) == 0:
+            raise ValueError("Aucune donnée météo pour cette semaine")
+        return [
+            CityScore(
+                geoname_id=int(matrix.geoname_ids[i]),
+                name_en=matrix.names[i],
+                country_3166a2=matrix.countries[i] or None,
+                iso_week=iso_week,
+                score=_num(scores[i], 1),
+                temperature_max_avg=_num(values[i, 0]),
+                temperature_min_avg=_num(values[i, 1]),
+                precipitation_sum=_num(values[i, 2]),
+            )
+            for i in best
+        ]
+
+    @classmethod
+    def similar_cities(
+        cls,
+        geoname_id: int,
+        iso_week: Optional[int] = None,
+        month: Optional[int] = None,
+        limit: int = 10,
+        country: Optional[str] = None,
+    ) -> List[SimilarCity]:
+        """Villes au climat le plus proche de celui d'une ville de référence
+
+        Distance euclidienne sur (T° max, T° min, précipitations) centrées-réduites,
+        pour une semaine ISO ou un mois (moyenne de ses semaines ISO).
+
+        Args:
+            geoname_id: ID GeoNames de la ville de référence
+            iso_week: Semaine ISO (1 à 53)
+            month: Mois (1 à 12), exclusif avec iso_week
+            limit: Nombre de villes renvoyées
+            country: Restreint aux villes d'un pays (alpha-2)
+
+        Returns:
+            Villes triées par distance croissante (référence exclue)
+
+        Raises:
+            ValueError: Si la période est invalide, ou si la ville n'a pas
+                de données sur la période
+        """
+        if (iso_week is None) == (month is None):
+            raise ValueError("Préciser une semaine ISO ou un mois")
+        if iso_week is not None and not 1 <= iso_week <= WEEKS:
+            raise ValueError(f"Semaine ISO invalide : {iso_week}")
+        if month is not None and not 1 <= month <= 12:
+            raise ValueError(f"Mois invalide : {month}")
+
+        matrix = cls.get_matrix()
+        row = matrix.index.get(int(geoname_id))
+        if row is None:
+            raise ValueError("Aucune donnée météo pour cette ville")
+
+        if iso_week is not None:
+            features = matrix.normalized()[:, iso_week - 1, :]
+            values = matrix.values[:, iso_week - 1, :]
+        else:
+            weeks = np.flatnonzero(WEEK_MONTHS == month)
+            features = period_mean(matrix.normalized(), weeks)
+            values = period_mean(matrix.values, weeks)
+
+        reference = features[row]
+        if not np.isfinite(reference).all():
+            raise ValueError("Aucune donnée météo pour cette ville sur cette période")
+        # Villes incomplètes sur la période : distance NaN, donc écartées par top_k
+        distances = np.sqrt(((features - reference) ** 2).sum(axis=1))
+        distances[row] = np.nan
+        if country:
+            distances = np.where(
+                matrix.countries == country.lower().strip(), distances, np.nan
+            )
+
+        return [
+            SimilarCity(
+                geoname_id=int(matrix.geoname_ids[i]),
+                name_en=matrix.names[i],
+                country_3166a2=matrix.countries[i] or None,
+                iso_week=iso_week,
+                month=month,
+                distance=_num(distances[i], 3),
+                temperature_max_avg=_num(values[i, 0]),
+                temperature_min_avg=_num(values[i, 1]),
+                precipitation_sum=_num(values[i, 2]),
+            )
+            for i in top_k(-distances, limit)
+        ]
@@ -0,0 +1,65 @@
+import pytest
+from pymongo.errors import OperationFailure
+
+import connexion.mongo_connect as mongo
+
+MongoDBConnection = mongo.MongoDBConnection
+
+
+class FakeCollection:
+    def __init__(self, name, created, fail_on=()):
+        self.name = name
+        self.created = created
+        self.fail_on = fail_on
+
+    def create_index(self, keys, **options):
+        field = keys[0][0]
+        if field in self.fail_on:
+            raise OperationFailure("E11000 duplicate key")
+        self.created.append((self.name, field, options))
+        return f"{field}_1"
+
+
+class FakeDb:
+    def __init__(self, fail_on=()):
+        self.created = []
+        self.fail_on = fail_on
+
+    def __getitem__(self, name):
+        return FakeCollection(name, self.created, self.fail_on)
+
+
+@pytest.fixture(autouse=True)
+def reset_state(monkeypatch):
+    monkeypatch.setattr(MongoDBConnection, "indexes_ready", False)
+    monkeypatch.delenv("MONGO_INDEXES", raising=False)
+
+
+def test_index_declares_et_configures(monkeypatch):
+    monkeypatch.setenv(
+        "MONGO_INDEXES", "conversations.sentences.hello, conversations.lang639-2,bad"
+    )
+    db = FakeDb()
+    monkeypatch.setattr(MongoDBConnection, "db", db)
+
+    MongoDBConnection.ensure_indexes()
+    MongoDBConnection.ensure_indexes()
+
+    assert db.created == [
+        ("conversations", "lang639-2", {"unique": True}),
+        ("conversations", "sentences.hello", {}),
+    ]
+    assert MongoDBConnection.indexes_ready
+
+
+def test_index_en_echec_retente(monkeypatch):
+    db = FakeDb(fail_on=("lang639-2",))
+    monkeypatch.setattr(MongoDBConnection, "db", db)
+
+    MongoDBConnection.ensure_indexes()
+    assert not MongoDBConnection.indexes_ready
+
+    db.fail_on = ()
+    MongoDBConnection.ensure_indexes()
+    assert db.created == [("conversations", "lang639-2", {"unique": True})]
+    assert MongoDBConnection.indexes_ready
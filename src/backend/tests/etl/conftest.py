@@ -0,0 +1,135 @@
+import threading
+from datetime import date, datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import flatbuffers
+import numpy as np
+import pytest
+
+
+def build_daily_message(lat, lon, start_date, end_date, location_id=0, seed=0.0):
+    """
+    Construit une réponse WeatherApiResponse (flatbuffers, préfixée par sa taille)
+    avec 3 variables quotidiennes : tmax, tmin, précipitations.
+    Les valeurs ne dépendent que de la date (pas de la plage demandée) :
+    tmax = seed + nombre de jours depuis le 2024-01-01, tmin = tmax - 10, prcp = 1.
+    """
+    d0 = datetime.combine(date.fromisoformat(start_date), datetime.min.time())
+    d1 = datetime.combine(date.fromisoformat(end_date), datetime.min.time())
+    t0 = int(d0.replace(tzinfo=timezone.utc).timestamp())
+    n_days = (d1 - d0).days + 1
+    offset = (d0 - datetime(2024, 1, 1)).days
+    tmax = seed + offset + np.arange(n_days, dtype=np.float32)
+    series = [tmax, tmax - 10, np.ones(n_days, dtype=np.float32)]
+
+    b = flatbuffers.Builder(1024)
+    variables = []
+    for values in series:
+        vec = b.CreateNumpyVector(values.astype(np.float32))
+        b.StartObject(12)
+        b.PrependUOffsetTRelativeSlot(3, vec, 0)
+        variables.append(b.EndObject())
+
+    b.StartVector(4, len(variables), 4)
+    for v in reversed(variables):
+        b.PrependUOffsetTRelative(v)
+    var_vec = b.EndVector()
+
+    b.StartObject(4)
+    b.PrependInt64Slot(0, t0, 0)
+    b.PrependInt64Slot(1, t0 + n_days * 86400, 0)
+    b.PrependInt32Slot(2, 86400, 0)
+    b.PrependUOffsetTRelativeSlot(3, var_vec, 0)
+    daily = b.EndObject()
+
+    b.StartObject(14)
+    b.PrependFloat32Slot(0, lat, 0.0)
+    b.PrependFloat32Slot(1, lon, 0.0)
+    b.PrependInt64Slot(4, location_id, 0)
+    b.PrependUOffsetTRelativeSlot(10, daily, 0)
+    b.FinishSizePrefixed(b.EndObject())
+    return bytes(b.Output())
+
+
+class OpenMeteoStub:
+    """
+    Serveur local imitant l'Archive API d'Open-Meteo.
+    Les `fail_first` premières requêtes reçoivent `fail_status`.
+    Les latitudes de `omit_in_batch` sont absentes des réponses multi-lieux.
+    """
+
+    def __init__(self, fail_first=0, fail_status=429, delay=0.0, omit_in_batch=()):
+        self.fail_first = fail_first
+        self.omit_in_batch = set(omit_in_batch)
+        self.fail_status = fail_status
+        self.delay = delay
+        self.requests = []
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+                with stub.lock:
+                    stub.requests.append(params)
+                    failing = len(stub.requests) <= stub.fail_first
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                try:
+                    if stub.delay:
+                        threading.Event().wait(stub.delay)
+                    if failing:
+                        body = b'{"error": true, "reason": "Too many requests"}'
+                        self.send_response(stub.fail_status)
+                    else:
+                        body = stub.respond(params)
+                        self.send_response(200)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with stub.lock:
+                        stub.in_flight -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/v1/archive"
+
+    def respond(self, params):
+        lats = [float(x) for x in params["latitude"].split(",")]
+        lons = [float(x) for x in params["longitude"].split(",")]
+        return b"".join(
+            build_daily_message(
+                lat, lon, params["start_date"], params["end_date"], i, seed=lat
+            )
+            for i, (lat, lon) in enumerate(zip(lats, lons))
+            if len(lats) == 1 or lat not in self.omit_in_batch
+        )
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def openmeteo_stub():
+    """Fabrique de serveurs Open-Meteo locaux, arrêtés en fin de test"""
+    stubs = []
+
+    def make(**kwargs):
+        stub = OpenMeteoStub(**kwargs).__enter__()
+        stubs.append(stub)
+        return stub
+
+    yield make
+    for stub in stubs:
+        stub.__exit__(None, None, None)
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+import services.etl.etl_conversations as etl_conversations
+
+ConversationETL = etl_conversations.ConversationETL
+Mongo = etl_conversations.MongoDBConnection
+
+
+def test_dedupe_documents_fusion_par_langue():
+    docs = ConversationETL.dedupe_documents(
+        [
+            {"lang639-2": "fra", "sentences": {"hello": "bonjour", "yes": "oui"}},
+            {"lang639-2": "deu", "sentences": {"hello": "hallo"}},
+            {"lang639-2": "fra", "sentences": {"hello": "salut"}},
+        ]
+    )
+
+    assert docs == [
+        {"lang639-2": "fra", "sentences": {"hello": "salut", "yes": "oui"}},
+        {"lang639-2": "deu", "sentences": {"hello": "hallo"}},
+    ]
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Fakes MongoDBConnection : enregistre les opérations de chaque bulk_write"""
+    writes = []
+    for name in ("connect", "close", "ensure_indexes"):
+        monkeypatch.setattr(Mongo, name, classmethod(lambda cls: None))
+    monkeypatch.setattr(
+        Mongo,
+        "bulk_write",
+        classmethod(
+            lambda cls, collection, ops, ordered=False: writes.append(ops)
+            or SimpleNamespace(upserted_count=1, modified_count=1, deleted_count=0)
+        ),
+    )
+    monkeypatch.setattr(
+        etl_conversations.ConversationOrm,
+        "remove_duplicate_langs",
+        staticmethod(lambda: 0),
+    )
+    return writes
+
+
+def test_load_upsert_sans_vider_la_collection(tmp_path, writes):
+    df = pd.DataFrame(
+        {
+            "lang639-2": ["fra", "deu", "fra"],
+            "hello": ["bonjour", "hallo", "salut"],
+            "yes": ["oui", None, None],
+        }
+    )
+    etl = ConversationETL()
+    etl.output_path = tmp_path / "conversation.csv"
+
+    etl.load(df)
+
+    (ops,) = writes
+    replaces, delete = ops[:-1], ops[-1]
+    assert [op._filter for op in replaces] == [{"lang639-2": "fra"}, {"lang639-2": "deu"}]
+    assert replaces[0]._doc["sentences"] == {"hello": "salut", "yes": "oui"}
+    assert all(op._upsert for op in replaces)
+    assert delete._filter == {"lang639-2": {"$nin": ["fra", "deu"]}}
+
+
+def test_load_source_vide_vide_la_collection(tmp_path, writes):
+    etl = ConversationETL()
+    etl.output_path = tmp_path / "conversation.csv"
+
+    etl.load(pd.DataFrame(columns=["lang639-2", "hello"]))
+
+    ((delete,),) = writes
+    assert delete._filter == {"lang639-2": {"$nin": []}}
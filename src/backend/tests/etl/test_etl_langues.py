@@ -0,0 +1,94 @@
+import pandas as pd
+
+import services.etl.etl_langues as etl_langues
+
+LanguageETL = etl_langues.LanguageETL
+Mongo = etl_langues.MongoDBConnection
+
+
+def langues_df():
+    return pd.DataFrame(
+        {
+            "639-2": ["fra", "ENG", "deu", "eus"],
+            "name_en": ["French", "English", "German", "Basque"],
+        }
+    )
+
+
+def test_check_mongo_existence_un_seul_appel(monkeypatch):
+    calls = []
+    monkeypatch.setattr(Mongo, "connect", classmethod(lambda cls: None))
+    monkeypatch.setattr(Mongo, "close", classmethod(lambda cls: None))
+    monkeypatch.setattr(
+        etl_langues.ConversationOrm,
+        "get_lang_codes",
+        staticmethod(lambda: calls.append(1) or {"fra", "eng"}),
+    )
+
+    df = LanguageETL().check_mongo_existence(langues_df())
+
+    assert calls == [1]
+    assert df["is_in_mongo"].tolist() == [True, True, False, False]
+
+
+def test_check_mongo_existence_mongo_indisponible(monkeypatch):
+    def fail(cls):
+        raise ConnectionError("mongo down")
+
+    monkeypatch.setattr(Mongo, "connect", classmethod(fail))
+    monkeypatch.setattr(Mongo, "close", classmethod(lambda cls: None))
+
+    df = LanguageETL().check_mongo_existence(langues_df())
+
+    assert not df["is_in_mongo"].any()
+
+
+def test_load_bulk_insertees_mises_a_jour_ignorees(tmp_path, monkeypatch):
+    writes = []
+    Mysql = etl_langues.MySQLConnection
+    for name in ("connect", "commit", "rollback", "close"):
+        monkeypatch.setattr(Mysql, name, classmethod(lambda cls: None))
+    monkeypatch.setattr(
+        etl_langues.LangueOrm,
+        "get_famille_map",
+        staticmethod(lambda: {"indo-european": 1, "isolate": 7}),
+    )
+    monkeypatch.setattr(
+        etl_langues.LangueOrm,
+        "get_rows_by_code",
+        staticmethod(
+            lambda: {
+                "fra": ("French", "français", "français", 1, True),
+                "deu": ("German", "allemand", "deutsch", None, False),
+            }
+        ),
+    )
+    monkeypatch.setattr(
+        etl_langues.LangueOrm,
+        "bulk_upsert",
+        staticmethod(lambda rows, chunk_size=500: writes.append(rows) or len(rows)),
+    )
+    df = pd.DataFrame(
+        {
+            "639-2": ["fra", "deu", "eus", "xxx"],
+            "name_en": ["French", "German", "Basque", "Unknown"],
+            "name_fr": ["français", "allemand", "basque", "inconnu"],
+            "name_local": ["français", "deutsch", "euskara", None],
+            "family": ["Indo-European", "Indo-European", "Isolate", None],
+            "is_in_mongo": [True, False, False, False],
+        }
+    )
+    etl = LanguageETL()
+    etl.output_path = tmp_path / "iso_languages.csv"
+
+    counts = etl.load(df)
+
+    assert counts == {"inserted": 2, "updated": 1, "skipped": 1}
+    assert writes == [
+        [
+            ("deu", "German", "allemand", "deutsch", 1, False),
+            ("eus", "Basque", "basque", "euskara", 7, False),
+            ("xxx", "Unknown", "inconnu", None, None, False),
+        ]
+    ]
+    assert etl.output_path.exists()
@@ -0,0 +1,290 @@
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import services.etl.etl_meteo as etl_meteo
+
+MeteoETL = etl_meteo.MeteoETL
+
+
+@pytest.fixture(autouse=True)
+def isolate_cache(tmp_path, monkeypatch):
+    """
+    Caches requests_cache (sqlite) et dataset Parquet dans un dossier temporaire ;
+    le recalcul des normales (MySQL) est remplacé par un enregistreur d'appels,
+    le cube météo est exporté dans le dossier temporaire.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(etl_meteo.MeteoDailyStore, "root", tmp_path / "meteo_daily")
+    refreshed = []
+    monkeypatch.setattr(
+        etl_meteo.MeteoNormalsOrm,
+        "refresh_for_cities",
+        staticmethod(lambda gids: refreshed.append(set(gids)) or 0),
+    )
+    monkeypatch.setattr(etl_meteo.MeteoCube, "root", tmp_path / "meteo_cube")
+    monkeypatch.setattr(etl_meteo.WeekMeteoOrm, "get_all_rows", staticmethod(lambda: []))
+    return refreshed
+
+
+def villes(n):
+    return pd.DataFrame(
+        {
+            "geoname_id": range(1, n + 1),
+            "latitude": [float(i) for i in range(1, n + 1)],
+            "longitude": [2.5] * n,
+        }
+    )
+
+
+def make_etl(url, **kwargs):
+    params = dict(
+        start_date="2024-01-01",
+        end_date="2024-01-31",
+        use_cache=False,
+        api_url=url,
+        retry_backoff=0.01,
+    )
+    params.update(kwargs)
+    return MeteoETL(**params)
+
+
+def test_process_batch_concurrent(openmeteo_stub):
+    stub = openmeteo_stub(delay=0.5)
+    etl = make_etl(stub.url, max_workers=8, requests_per_second=100)
+
+    t0 = time.monotonic()
+    daily, weekly = etl._process_batch(villes(8))
+    elapsed = time.monotonic() - t0
+
+    assert [int(d["geoname_id"].iloc[0]) for d in daily] == list(range(1, 9))
+    assert all(len(d) == 31 for d in daily)
+    # tmax = latitude + jour (valeurs du serveur local)
+    assert daily[2]["tmax"].iloc[0] == pytest.approx(3.0)
+    assert len(weekly) == 1
+    assert weekly[0]["geoname_id"].unique().tolist() == list(range(1, 9))
+    assert stub.max_in_flight > 1
+    # 8 appels de 0.5s en parallèle : bien moins que 4s en séquentiel
+    assert elapsed < 2.0
+
+
+def test_rate_limiter_ralentit_sur_429(openmeteo_stub):
+    stub = openmeteo_stub(fail_first=2, fail_status=429)
+    etl = make_etl(stub.url, max_workers=1, requests_per_second=50)
+
+    daily, _ = etl._process_batch(villes(2))
+
+    assert len(daily) == 2
+    assert len(stub.requests) == 4
+    # deux pénalités (50 -> 12.5) puis deux succès (+0.1 chacun)
+    assert etl.rate_limiter.rate == pytest.approx(12.7)
+
+
+def test_rate_limiter_ralentit_sur_5xx(openmeteo_stub):
+    stub = openmeteo_stub(fail_first=1, fail_status=503)
+    etl = make_etl(stub.url, max_workers=1, requests_per_second=10)
+
+    daily, _ = etl._process_batch(villes(1))
+
+    assert len(daily) == 1
+    assert etl.rate_limiter.rate == pytest.approx(5.1)
+
+
+def test_process_batch_multi_lieux(openmeteo_stub):
+    stub = openmeteo_stub()
+    etl = make_etl(stub.url, max_workers=2, locations_per_request=5)
+
+    daily, weekly = etl._process_batch(villes(12))
+
+    # 12 villes en 3 appels (5 + 5 + 2)
+    assert len(stub.requests) == 3
+    assert sorted(len(r["latitude"].split(",")) for r in stub.requests) == [2, 5, 5]
+    assert [int(d["geoname_id"].iloc[0]) for d in daily] == list(range(1, 13))
+    # chaque ville reçoit ses propres valeurs (tmax = latitude + jour)
+    assert [d["tmax"].iloc[0] for d in daily] == [float(i) for i in range(1, 13)]
+    assert weekly[0]["geoname_id"].nunique() == 12
+
+
+def test_appel_multi_lieux_consomme_un_jeton_par_lieu(openmeteo_stub):
+    stub = openmeteo_stub()
+    etl = make_etl(stub.url, requests_per_second=2, locations_per_request=6)
+    # Le seau accueille l'appel le plus lourd
+    assert etl.rate_limiter.capacity == 6
+
+    etl.fetch_data_for_villes(list(villes(6).itertuples()))
+
+    assert len(stub.requests) == 1
+    assert etl.rate_limiter.tokens < 1
+
+
+def test_fetch_multi_lieux_repli_ville_par_ville(openmeteo_stub):
+    stub = openmeteo_stub(omit_in_batch={2.0})
+    etl = make_etl(stub.url)
+
+    frames = etl.fetch_data_for_villes(list(villes(3).itertuples()))
+
+    assert [int(f["geoname_id"].iloc[0]) for f in frames] == [1, 2, 3]
+    assert frames[1]["tmax"].iloc[0] == 2.0
+    # 1 appel groupé + 1 appel individuel pour la ville manquante
+    assert [r["latitude"] for r in stub.requests] == ["1.0,2.0,3.0", "2.0"]
+
+
+def test_fetch_multi_lieux_echec_total(openmeteo_stub):
+    stub = openmeteo_stub(fail_first=3, fail_status=503)
+    etl = make_etl(stub.url, max_retries=3, requests_per_second=100)
+
+    frames = etl.fetch_data_for_villes(list(villes(2).itertuples()))
+
+    assert all(f is not None for f in frames)
+    assert [r["latitude"] for r in stub.requests[3:]] == ["1.0", "2.0"]
+
+
+def daily_frame(geoname_id, start, n_days, tmax0=0.0):
+    dates = pd.date_range(start, periods=n_days, freq="D")
+    return pd.DataFrame(
+        {
+            "date": dates.date,
+            "tmax": tmax0 + np.arange(n_days, dtype=float),
+            "tmin": np.zeros(n_days),
+            "precip_sum": np.ones(n_days),
+            "geoname_id": geoname_id,
+            "lat": 1.0,
+            "lon": 2.0,
+        }
+    )
+
+
+def test_transform_weekly_multi_villes():
+    etl = make_etl("http://unused")
+    # 2024-01-01 est un lundi : 21 jours = 3 semaines ISO complètes
+    a = daily_frame(1, "2024-01-01", 21)
+    b = daily_frame(2, "2024-01-01", 21, tmax0=100.0)
+    daily = pd.concat([b, a], ignore_index=True).sample(frac=1, random_state=0)
+
+    weekly = etl.transform_weekly(daily)
+
+    assert weekly.columns.tolist() == MeteoETL.WEEKLY_COLUMNS
+    assert weekly["geoname_id"].tolist() == [1, 1, 1, 2, 2, 2]
+    assert weekly["iso_week"].tolist() == [1, 2, 3] * 2
+    assert weekly["week_end_date"].dt.day.tolist() == [7, 14, 21] * 2
+    assert weekly["week_start_date"].dt.strftime("%Y-%m-%d").tolist()[:3] == [
+        "2023-12-25",
+        "2024-01-01",
+        "2024-01-08",
+    ]
+    city_a = weekly[weekly["geoname_id"] == 1]
+    # Jour 7 : moyenne de 0..6 ; jour 14 : moyenne de 0..13 ; jour 21 : 7..20
+    assert city_a["tmax_14d_avg"].tolist() == [3.0, 6.5, 13.5]
+    assert city_a["precip_14d_sum"].tolist() == [7.0, 14.0, 14.0]
+    # Pas de fenêtre partagée entre villes
+    city_b = weekly[weekly["geoname_id"] == 2]
+    assert city_b["tmax_14d_avg"].tolist() == [103.0, 106.5, 113.5]
+
+
+def test_transform_weekly_min_periods_et_vide():
+    etl = make_etl("http://unused")
+    weekly = etl.transform_weekly(daily_frame(1, "2024-01-01", 3))
+    assert len(weekly) == 1
+    assert weekly["tmax_14d_avg"].isna().all()
+
+    assert etl.transform_weekly(pd.DataFrame()).empty
+
+
+def test_load_weekly_tuples_sans_nan(monkeypatch, isolate_cache):
+    captured = {}
+
+    def fake_bulk_upsert_rows(rows, chunk_size=5000):
+        captured["rows"], captured["chunk_size"] = rows, chunk_size
+        return len(rows)
+
+    monkeypatch.setattr(
+        etl_meteo.WeekMeteoOrm, "bulk_upsert_rows", staticmethod(fake_bulk_upsert_rows)
+    )
+    etl = make_etl("http://unused", load_chunk_size=500)
+    weekly = etl.transform_weekly(daily_frame(7, "2024-01-01", 14))
+    weekly.loc[weekly.index[0], "tmax_14d_avg"] = np.nan
+
+    assert etl.load_weekly(weekly) == 2
+    assert captured["chunk_size"] == 500
+    first, second = captured["rows"]
+    assert first[:3] == (7, date(2023, 12, 25), date(2024, 1, 7))
+    assert first[3] is None
+    assert second == (7, date(2024, 1, 1), date(2024, 1, 14), 6.5, 0.0, 14.0)
+    # types natifs uniquement (pas de numpy.float64 / int64)
+    assert [type(v) for v in second] == [int, date, date, float, float, float]
+    # normales recalculées pour les villes chargées uniquement
+    assert isolate_cache == [{7}]
+
+
+def test_plan_incremental_filigranes():
+    watermarks = {
+        1: date(2024, 6, 30),  # dimanche : semaine complète
+        2: date(2024, 7, 3),  # mercredi : semaine partielle recalculée
+        3: date(2024, 12, 31),  # déjà à jour
+    }
+    plan = MeteoETL.plan_incremental(villes(4), watermarks, "2024-01-01", "2024-12-31")
+
+    assert plan["geoname_id"].tolist() == [1, 2, 4]
+    assert plan["cut_date"].tolist() == [date(2024, 6, 30), date(2024, 6, 30), None]
+    assert plan["fetch_start"].tolist() == ["2024-06-18", "2024-06-18", "2024-01-01"]
+
+
+def test_incremental_equivalent_au_rechargement_complet(
+    tmp_path, monkeypatch, openmeteo_stub
+):
+    stub = openmeteo_stub()
+    csv_path = tmp_path / "villes.csv"
+    villes(2).to_csv(csv_path, index=False)
+
+    # Référence : chargement complet janvier -> février
+    full = make_etl(stub.url, end_date="2024-02-29", locations_per_request=2)
+    full.villes_df = villes(2)
+    _, weekly_full = full._process_batch(full.villes_df)
+    expected = weekly_full[0]
+
+    # Base couvrant jusqu'au mercredi 2024-01-31 (ville 1) ; ville 2 absente
+    monkeypatch.setattr(
+        etl_meteo.WeekMeteoOrm,
+        "get_watermarks",
+        staticmethod(lambda: {1: date(2024, 1, 31)}),
+    )
+    calls = {}
+
+    def fake_replace_after(cuts, rows, chunk_size=5000):
+        calls["cuts"], calls["rows"] = cuts, rows
+        return len(rows)
+
+    monkeypatch.setattr(
+        etl_meteo.WeekMeteoOrm, "replace_after", staticmethod(fake_replace_after)
+    )
+
+    etl = make_etl(stub.url, end_date="2024-02-29", locations_per_request=2)
+    etl.extract_from_csv(csv_path, incremental=True)
+    stub.requests.clear()
+    _, weekly = etl._process_batch(etl.villes_df)
+    etl.load_weekly(weekly[0])
+
+    # un appel par date de début : reprise au 2024-01-16 (dimanche 28 - 12 j)
+    assert sorted(r["start_date"] for r in stub.requests) == [
+        "2024-01-01",
+        "2024-01-16",
+    ]
+    assert calls["cuts"] == [(1, date(2024, 1, 28))]
+
+    loaded = pd.DataFrame(
+        calls["rows"],
+        columns=["geoname_id", "start", "end", "tmax", "tmin", "precip"],
+    )
+    city1 = loaded[loaded["geoname_id"] == 1]
+    assert city1["end"].min() == date(2024, 2, 4)
+
+    ref = expected[expected["week_end_date"] > pd.Timestamp("2024-01-28")]
+    ref = ref[ref["geoname_id"] == 1]
+    assert city1["end"].tolist() == ref["week_end_date"].dt.date.tolist()
+    assert city1["tmax"].tolist() == pytest.approx(ref["tmax_14d_avg"].tolist())
+    assert city1["precip"].tolist() == pytest.approx(ref["precip_14d_sum"].tolist())
+    # ville 2 (nouvelle) : chargée intégralement
+    assert (loaded["geoname_id"] == 2).sum() == (expected["geoname_id"] == 2).sum()
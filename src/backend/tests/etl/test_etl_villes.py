@@ -0,0 +1,209 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+import services.etl.etl_villes as etl_villes
+
+ETLVille = etl_villes.ETLVille
+
+
+def geonames_line(gid, name, country, pop, lat="1.5", lng="2.5"):
+    cols = [""] * 19
+    cols[0], cols[1], cols[2], cols[3] = str(gid), name, name, f'"{name}",alt'
+    cols[4], cols[5], cols[8], cols[14] = lat, lng, country, str(pop)
+    return "\t".join(cols)
+
+
+@pytest.fixture
+def cities_df():
+    rows = [
+        # fr : capitale + 4 autres villes
+        (1, "Paris", "fr", 2_000_000, True),
+        (2, "Lyon", "fr", 500_000, False),
+        (3, "Marseille", "fr", 800_000, False),
+        (4, "Nice", "fr", 300_000, False),
+        (5, "Brest", "fr", 140_000, False),
+        # us : pas de capitale détectée
+        (6, "New York", "us", 8_000_000, False),
+        (7, "Los Angeles", "us", 4_000_000, False),
+        (8, "Chicago", "us", 2_700_000, False),
+        (9, "Houston", "us", 2_300_000, False),
+        (10, "Phoenix", "us", 1_600_000, False),
+        # za : plusieurs capitales, une seule conservée
+        (11, "Pretoria", "za", 700_000, True),
+        (12, "Cape Town", "za", 3_400_000, True),
+        (13, "Johannesburg", "za", 4_400_000, False),
+    ]
+    df = pd.DataFrame(
+        rows, columns=["geoname_id", "name_en", "country_3166a2", "pop", "is_capital"]
+    )
+    return df.sort_values(
+        ["country_3166a2", "is_capital", "pop"], ascending=[True, False, False]
+    )
+
+
+def test_select_cities_capitale_plus_plus_peuplees(cities_df):
+    out = ETLVille(max_cities_per_country=4).select_cities_per_country(cities_df)
+
+    fr = out[out["country_3166a2"] == "fr"]["name_en"].tolist()
+    assert fr == ["Paris", "Marseille", "Lyon", "Nice"]
+
+    us = out[out["country_3166a2"] == "us"]["name_en"].tolist()
+    assert us == ["New York", "Los Angeles", "Chicago", "Houston"]
+
+    za = out[out["country_3166a2"] == "za"]["name_en"].tolist()
+    assert za == ["Cape Town", "Johannesburg"]
+
+
+def test_select_cities_sans_limite(cities_df):
+    out = ETLVille(max_cities_per_country=None).select_cities_per_country(cities_df)
+    assert len(out) == len(cities_df)
+
+
+def test_extract_par_blocs_colonnes_utiles(tmp_path, monkeypatch):
+    monkeypatch.setattr(ETLVille, "get_country_capitals", lambda self, codes: {})
+    src = tmp_path / "cities500.txt"
+    lines = [
+        geonames_line(1, "Paris", "FR", 2000000),
+        geonames_line(2, "Brest", "FR", 140000),
+        geonames_line(3, 'Quote"town', "US", 500),
+    ]
+    src.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    countries = tmp_path / "countries_en.csv"
+    countries.write_text("alpha2\nfr\nus\n", encoding="utf-8")
+
+    etl = ETLVille(source="cities500", chunksize=2)
+    etl.input_path = src
+    etl.countries_path = countries
+    data = etl.extract()
+
+    df = data["villes"]
+    assert set(df.columns) == set(etl.keep_columns)
+    assert len(df) == 3
+    assert df["geoname_id"].tolist() == [1, 2, 3]
+    assert df["pop"].dtype == "int64"
+    assert df.loc[2, "name_en"] == 'Quote"town'
+    assert data["capitales"] == {}
+
+
+def test_extract_garde_top_n_et_capitales_par_bloc(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        ETLVille, "get_country_capitals", lambda self, codes: {"au": ["Canberra"]}
+    )
+    src = tmp_path / "cities500.txt"
+    lines = [
+        geonames_line(1, "Sydney", "AU", 5_000_000),
+        geonames_line(2, "Canberra", "AU", 400_000),
+        geonames_line(3, "Melbourne", "AU", 4_900_000),
+        geonames_line(4, "", "AU", 9_000_000),
+        geonames_line(5, "Brisbane", "AU", 2_500_000),
+        geonames_line(6, "Nowhere", "XX", 1_000_000),
+        geonames_line(7, "Perth", "AU", 2_100_000),
+        geonames_line(8, "Adelaide", "AU", 1_300_000),
+    ]
+    src.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    countries = tmp_path / "countries_en.csv"
+    countries.write_text("alpha2\nau\n", encoding="utf-8")
+
+    etl = ETLVille(source="cities500", chunksize=3, max_cities_per_country=3)
+    etl.input_path = src
+    etl.countries_path = countries
+    data = etl.extract()
+
+    # Filtres par bloc (nom vide, pays inconnu) puis top 3 + candidat capitale
+    assert data["villes"]["name_en"].tolist() == [
+        "Sydney",
+        "Melbourne",
+        "Brisbane",
+        "Canberra",
+    ]
+    out = etl.transform(data)
+    assert out["name_en"].tolist() == ["Canberra", "Sydney", "Melbourne"]
+    assert out["is_capital"].tolist() == [True, False, False]
+
+
+def test_flag_capitals_exact_puis_approche():
+    df = pd.DataFrame(
+        {
+            "country_3166a2": ["fr", "fr", "mx", "mx", "us", "us"],
+            "name_en": [
+                "Paris",
+                "Lyon",
+                "Mexico City",
+                "Ciudad de México",
+                "Washington, D.C.",
+                "Seattle",
+            ],
+        },
+        index=[10, 11, 12, 13, 14, 15],
+    )
+    capitals = {
+        "fr": ["PARIS"],
+        "mx": ["Ciudad de Mexico"],
+        "us": ["Washington DC"],
+        "de": ["Berlin"],
+    }
+    out = ETLVille.flag_capitals(df, capitals)
+
+    assert out.index.tolist() == df.index.tolist()
+    assert out.tolist() == [True, False, False, True, True, False]
+
+
+def test_flag_capitals_seuil_similarite():
+    df = pd.DataFrame({"country_3166a2": ["it", "it"], "name_en": ["Rome", "Roma"]})
+    # "roma" vs "rome" : similarité 0.75, sous le seuil par défaut
+    assert ETLVille.flag_capitals(df, {"it": ["Rome"]}).tolist() == [True, False]
+    assert ETLVille.flag_capitals(df, {"it": ["Romx"]}).tolist() == [False, False]
+    assert ETLVille.flag_capitals(df, {"it": ["Romx"]}, threshold=0.7).tolist() == [
+        True,
+        True,
+    ]
+
+
+@pytest.fixture
+def capitals_server():
+    """Stub local de l'API restcountries (/alpha/<code>?fields=capital)"""
+    capitals = {"fr": ["Paris"], "za": ["Pretoria", "Cape Town "]}
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            code = self.path.split("?")[0].rstrip("/").split("/")[-1]
+            hits.append(code)
+            if code not in capitals:
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = json.dumps({"capital": capitals[code]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/alpha", hits
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_country_capitals_concurrent_et_cache(tmp_path, capitals_server):
+    url, hits = capitals_server
+    etl = ETLVille(capitals_api_url=url, max_workers=4, requests_per_second=100)
+    etl.capitals_cache_path = tmp_path / "capitals_cache"
+
+    out = etl.get_country_capitals(["FR", "za", "xx"])
+    assert out == {"fr": ["Paris"], "za": ["Pretoria", "Cape Town"], "xx": []}
+    assert sorted(hits) == ["fr", "xx", "za"]
+
+    # Deuxième exécution : tout est servi depuis le cache disque
+    assert etl.get_country_capitals(["fr", "za", "xx"]) == out
+    assert len(hits) == 3
@@ -0,0 +1,119 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+import services.etl.etl_meteo as etl_meteo
+from services.etl.meteo_journal import MeteoRunJournal
+
+MeteoETL = etl_meteo.MeteoETL
+
+
+@pytest.fixture(autouse=True)
+def isolate(tmp_path, monkeypatch):
+    """Dataset Parquet et cube météo temporaires, pas d'accès MySQL"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(etl_meteo.MeteoDailyStore, "root", tmp_path / "meteo_daily")
+    monkeypatch.setattr(
+        etl_meteo.MeteoNormalsOrm,
+        "refresh_for_cities",
+        staticmethod(lambda gids: 0),
+    )
+    monkeypatch.setattr(etl_meteo.MeteoCube, "root", tmp_path / "meteo_cube")
+    monkeypatch.setattr(etl_meteo.WeekMeteoOrm, "get_all_rows", staticmethod(lambda: []))
+
+
+@pytest.fixture
+def journal(tmp_path):
+    j = MeteoRunJournal(tmp_path / "runs.sqlite")
+    yield j
+    j.close()
+
+
+def villes(n):
+    return pd.DataFrame(
+        {
+            "geoname_id": range(1, n + 1),
+            "latitude": [float(i) for i in range(1, n + 1)],
+            "longitude": [2.5] * n,
+        }
+    )
+
+
+def test_journal_plan_et_etats(journal):
+    plan = villes(3).assign(
+        fetch_start=["2024-06-18", None, None],
+        cut_date=[date(2024, 6, 30), None, None],
+    )
+    run_id = journal.start_run({"start_date": "2024-01-01"}, plan)
+
+    journal.mark(run_id, [1, 2], MeteoRunJournal.FETCHED)
+    journal.mark(run_id, [2], MeteoRunJournal.LOADED)
+    journal.mark(run_id, [3], MeteoRunJournal.FAILED, "timeout")
+
+    assert journal.get_params(run_id) == {"start_date": "2024-01-01"}
+    assert journal.summary(run_id) == {"fetched": 1, "loaded": 1, "failed": 1}
+    remaining = journal.remaining(run_id)
+    assert remaining["geoname_id"].tolist() == [1, 3]
+    assert remaining["cut_date"].tolist() == [date(2024, 6, 30), None]
+    assert remaining["fetch_start"].tolist() == ["2024-06-18", None]
+    with pytest.raises(ValueError, match="inconnue"):
+        journal.get_params("absent")
+
+
+def test_reprise_sans_refaire_les_villes_chargees(
+    tmp_path, monkeypatch, journal, openmeteo_stub
+):
+    stub = openmeteo_stub()
+    loaded = []
+    calls = {"n": 0}
+
+    def flaky_bulk_upsert_rows(rows, chunk_size=5000):
+        # Le 2e chargement échoue : arrêt brutal au milieu de l'exécution
+        calls["n"] += 1
+        if calls["n"] == 2:
+            raise RuntimeError("connexion MySQL perdue")
+        loaded.extend(sorted({r[0] for r in rows}))
+        return len(rows)
+
+    monkeypatch.setattr(
+        etl_meteo.WeekMeteoOrm,
+        "bulk_upsert_rows",
+        staticmethod(flaky_bulk_upsert_rows),
+    )
+    etl = MeteoETL(
+        start_date="2024-01-01",
+        end_date="2024-01-31",
+        use_cache=False,
+        api_url=stub.url,
+        retry_backoff=0.01,
+        batch_size=2,
+        max_workers=2,
+        requests_per_second=100,
+    )
+    etl.villes_df = villes(5)
+    run_id = etl.start_journal(journal)
+
+    with pytest.raises(RuntimeError):
+        etl.run()
+
+    assert loaded == [1, 2]
+    assert journal.summary(run_id) == {"loaded": 2, "transformed": 2, "pending": 1}
+
+    # Reprise : mêmes paramètres, seules les villes 3 à 5 sont récupérées
+    fetched = []
+    fetch = MeteoETL.fetch_data_for_villes
+
+    def spy_fetch(self, group):
+        fetched.extend(int(v.geoname_id) for v in group)
+        return fetch(self, group)
+
+    monkeypatch.setattr(MeteoETL, "fetch_data_for_villes", spy_fetch)
+    resumed = MeteoETL.resume(journal, run_id)
+    assert resumed.api_url == stub.url and resumed.batch_size == 2
+    resumed.run()
+
+    assert sorted(fetched) == [3, 4, 5]
+    assert loaded == [1, 2, 3, 4, 5]
+    assert journal.summary(run_id) == {"loaded": 5}
+    assert journal.remaining(run_id).empty
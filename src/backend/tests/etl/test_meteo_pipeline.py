@@ -0,0 +1,133 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+import services.etl.meteo_pipeline as meteo_pipeline
+
+MeteoPipeline = meteo_pipeline.MeteoPipeline
+
+
+class FakeETL(SimpleNamespace):
+    """
+    Stand-in de MeteoETL : chaque étage attend `delay` secondes par appel.
+    Le chargement vérifie qu'il n'est jamais exécuté en parallèle.
+    """
+
+    def __init__(self, n_villes, delay=0.0, fail_load=False, **kwargs):
+        super().__init__(
+            villes_df=pd.DataFrame(
+                {
+                    "geoname_id": range(1, n_villes + 1),
+                    "latitude": 1.0,
+                    "longitude": 2.0,
+                }
+            ),
+            max_workers=4,
+            batch_size=4,
+            locations_per_request=2,
+            daily_df=None,
+            weekly_df=None,
+            **kwargs,
+        )
+        self.delay = delay
+        self.fail_load = fail_load
+        self.loading = threading.Lock()
+        self.loaded_ids = []
+        self.persisted = 0
+        self.states = {}
+
+    def request_groups(self, villes):
+        rows = list(villes.itertuples(index=False))
+        size = self.locations_per_request
+        return [rows[i : i + size] for i in range(0, len(rows), size)]
+
+    def _fetch_group(self, villes):
+        time.sleep(self.delay)
+        return [
+            pd.DataFrame({"geoname_id": [v.geoname_id] * 3, "day": [1, 2, 3]})
+            for v in villes
+        ]
+
+    def transform_weekly(self, daily):
+        time.sleep(self.delay)
+        return daily.groupby("geoname_id", as_index=False)["day"].max()
+
+    def checkpoint(self, geoname_ids, state, error=None):
+        for gid in geoname_ids:
+            self.states[gid] = state
+
+    @staticmethod
+    def frame_ids(frames):
+        return [int(df["geoname_id"].iloc[0]) for df in frames]
+
+    def persist_daily(self, daily):
+        self.persisted += len(daily)
+        return sum(len(d) for d in daily)
+
+    def load_weekly(self, weekly):
+        if self.fail_load:
+            raise RuntimeError("base indisponible")
+        assert self.loading.acquire(blocking=False), "chargements concurrents"
+        try:
+            time.sleep(self.delay)
+            self.loaded_ids.extend(weekly["geoname_id"].tolist())
+            return len(weekly)
+        finally:
+            self.loading.release()
+
+
+def test_pipeline_charge_toutes_les_villes():
+    etl = FakeETL(n_villes=9)
+    pipeline = MeteoPipeline(etl, transform_workers=2, queue_size=1, keep_frames=True)
+
+    daily, weekly = pipeline.run()
+
+    assert sorted(etl.loaded_ids) == list(range(1, 10))
+    assert len(daily) == 27
+    assert etl.states == {gid: "loaded" for gid in range(1, 10)}
+    assert sorted(weekly["geoname_id"]) == list(range(1, 10))
+    assert etl.daily_df is daily
+    assert etl.persisted == 9
+    stats = pipeline.stats
+    assert stats["fetch"].items == 9
+    assert stats["fetch"].rows == 27
+    assert stats["transform"].items == 9
+    assert stats["load"].rows == 9
+    assert all(s.ended is not None for s in stats.values())
+
+
+def test_pipeline_ne_conserve_pas_les_frames_par_defaut():
+    etl = FakeETL(n_villes=6)
+    pipeline = MeteoPipeline(etl)
+
+    daily, weekly = pipeline.run()
+
+    assert sorted(etl.loaded_ids) == list(range(1, 7))
+    assert daily.empty and weekly.empty
+    assert pipeline.daily_frames == [] and pipeline.weekly_frames == []
+
+
+def test_pipeline_recouvre_les_etages():
+    # 8 groupes de fetch (0.1s, 4 threads), transform et load par 4 villes (0.1s)
+    etl = FakeETL(n_villes=16, delay=0.1)
+    pipeline = MeteoPipeline(etl, fetch_workers=4)
+
+    t0 = time.monotonic()
+    pipeline.run()
+    elapsed = time.monotonic() - t0
+
+    # séquentiel : fetch 0.2s + transform 0.4s + load 0.4s = 1.0s
+    assert elapsed < 0.9
+    assert pipeline.stats["load"].utilization > 0.3
+
+
+def test_pipeline_relance_erreur_de_chargement():
+    etl = FakeETL(n_villes=20, fail_load=True)
+    pipeline = MeteoPipeline(etl, queue_size=1)
+
+    with pytest.raises(RuntimeError, match="base indisponible"):
+        pipeline.run()
+    assert pipeline.stop.is_set()
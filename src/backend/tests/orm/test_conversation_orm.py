@@ -17,20 +17,25 @@ def patch_mongo(monkeypatch):
     calls = {}
 
     # fake for find_one
-    def fake_find_one(collection, query):
-        calls.setdefault("find_one", []).append((collection, query))
+    def fake_find_one(collection, query, projection=None):
+        calls.setdefault("find_one", []).append((collection, query, projection))
         # return a sample doc if _id present
         if "_id" in query:
             return {"_id": query["_id"], "title": "hello", "lang639-2": "en"}
         return None
 
-    # fake collection + cursor for find().skip().limit()
+    # fake collection + cursor for find().sort().skip().limit()
     class FakeCursor:
         def __init__(self, docs):
             self._docs = docs
             self._skip = 0
             self._limit = None
 
+        def sort(self, key, direction=1):
+            calls.setdefault("cursor_sort", []).append((key, direction))
+            self._docs.sort(key=lambda d: d[key], reverse=direction < 0)
+            return self
+
         def skip(self, n):
             self._skip = n
             return self
@@ -61,8 +66,12 @@ def patch_mongo(monkeypatch):
         ]
         return FakeCollection(docs)
 
-    def fake_find(collection, query, limit=100):
-        calls.setdefault("find", []).append((collection, query, limit))
+    def fake_find(collection, query, projection=None, limit=100, sort=None):
+        calls.setdefault("find", []).append((collection, query, projection, limit))
+        if sort is not None:
+            calls.setdefault("sort", []).append(sort)
+        if not query or "_id" in query:
+            return [{"_id": ObjectId(), "lang639-2": "en"}][:limit]
         # return docs filtered by query
         key, value = next(iter(query.items()))
         return [
@@ -110,11 +119,26 @@ def patch_mongo(monkeypatch):
             return 42 if value == "en" else 1
         return 0
 
+    def fake_estimated_document_count(collection):
+        calls.setdefault("estimated_document_count", []).append(collection)
+        return 120
+
+    def fake_distinct(collection, key, query=None):
+        calls.setdefault("distinct", []).append((collection, key, query))
+        return ["en", "FR", None, "en"]
+
     def fake_aggregate(collection, pipeline):
         calls.setdefault("aggregate", []).append((collection, tuple(pipeline)))
+        if "$push" in str(pipeline):
+            # doublons par langue (ids triés)
+            return [{"_id": "en", "ids": ["id1", "id2", "id3"]}]
         # return a fake aggregation result
         return [{"lang_code": "en", "count": 10}, {"lang_code": "fr", "count": 3}]
 
+    def fake_delete_many(collection, filter_q):
+        calls.setdefault("delete_many", []).append((collection, filter_q))
+        return DeleteResult(len(filter_q["_id"]["$in"]))
+
     # apply monkeypatches
     monkeypatch.setattr(
         repo,
@@ -128,6 +152,9 @@ def patch_mongo(monkeypatch):
             delete_one=fake_delete_one,
             count_documents=fake_count_documents,
             aggregate=fake_aggregate,
+            distinct=fake_distinct,
+            estimated_document_count=fake_estimated_document_count,
+            delete_many=fake_delete_many,
         ),
     )
 
@@ -152,6 +179,8 @@ def test_find_all_uses_get_collection_and_pagination(patch_mongo):
     out = repo.ConversationOrm.find_all(limit=2, skip=1)
     assert isinstance(out, list)
     assert len(out) == 2 or len(out) <= 2  # ensure limit honored at most 2
+    # ordre _id stable : next_cursor reste valable après une page skip
+    assert patch_mongo["cursor_sort"] == [("_id", 1)]
 
 
 def test_find_by_lang_lowercases(patch_mongo):
@@ -210,3 +239,54 @@ def test_aggregate_by_lang(patch_mongo):
     agg = repo.ConversationOrm.aggregate_by_lang()
     assert isinstance(agg, list)
     assert agg and "lang_code" in agg[0] and "count" in agg[0]
+
+
+def test_get_lang_codes_un_seul_distinct(patch_mongo):
+    codes = repo.ConversationOrm.get_lang_codes()
+    assert codes == {"en", "fr"}
+    assert patch_mongo["distinct"] == [(COL, "lang639-2", None)]
+
+
+def test_projection_transmise(patch_mongo):
+    oid = str(ObjectId())
+    repo.ConversationOrm.find_by_id(oid, {"lang639-2": 1})
+    repo.ConversationOrm.find_by_lang("EN", limit=1, projection={"sentences": 1})
+
+    assert patch_mongo["find_one"][0][2] == {"lang639-2": 1}
+    assert patch_mongo["find"][0] == (COL, {"lang639-2": "en"}, {"sentences": 1}, 1)
+
+
+def test_remove_duplicate_langs_garde_le_plus_ancien(patch_mongo):
+    assert repo.ConversationOrm.remove_duplicate_langs() == 2
+    assert patch_mongo["delete_many"] == [(COL, {"_id": {"$in": ["id2", "id3"]}})]
+
+
+def test_find_page_par_plage_d_id(patch_mongo):
+    after = ObjectId()
+    repo.ConversationOrm.find_page(limit=2)
+    repo.ConversationOrm.find_page(after=str(after), limit=2)
+
+    assert [q for _, q, _, _ in patch_mongo["find"]] == [{}, {"_id": {"$gt": after}}]
+    assert patch_mongo["sort"] == [[("_id", 1)], [("_id", 1)]]
+    with pytest.raises(InvalidId):
+        repo.ConversationOrm.find_page(after="pas-un-id")
+
+
+def test_count_estimated_sans_parcours(patch_mongo):
+    assert repo.ConversationOrm.count_estimated() == 120
+    assert patch_mongo["estimated_document_count"] == [COL]
+    assert "count_documents" not in patch_mongo
+
+
+def test_find_sentence_projection_sur_une_cle(patch_mongo):
+    repo.ConversationOrm.find_sentence("THANK_YOU", ["fra", "spa"])
+    repo.ConversationOrm.find_all_sentences()
+
+    assert [call[:3] for call in patch_mongo["find"]] == [
+        (
+            COL,
+            {"lang639-2": {"$in": ["fra", "spa"]}},
+            {"_id": 0, "lang639-2": 1, "sentences.THANK_YOU": 1},
+        ),
+        (COL, {}, {"_id": 0, "lang639-2": 1, "sentences": 1}),
+    ]
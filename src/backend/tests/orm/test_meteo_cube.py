@@ -0,0 +1,154 @@
+from datetime import date
+
+import pytest
+
+import orm.meteo_cube as repo
+
+MeteoCube = repo.MeteoCube
+
+
+def week(gid, start, end, tmax=20.0, tmin=10.0, precip=5.0):
+    return {
+        "geoname_id": gid,
+        "week_start_date": start,
+        "week_end_date": end,
+        "temperature_max_avg": tmax,
+        "temperature_min_avg": tmin,
+        "precipitation_sum": precip,
+    }
+
+
+@pytest.fixture(autouse=True)
+def cube_dir(tmp_path, monkeypatch):
+    """Cube écrit dans un dossier temporaire, relu à chaque appel"""
+    monkeypatch.setattr(MeteoCube, "root", tmp_path / "meteo_cube")
+    monkeypatch.setattr(MeteoCube, "CHECK_INTERVAL", 0.0)
+    MeteoCube.reset()
+    yield tmp_path / "meteo_cube"
+    MeteoCube.reset()
+
+
+@pytest.fixture
+def rows():
+    # Semaines de 14 jours démarrant chaque lundi ; ville 20 avec un trou
+    return [
+        week(10, date(2024, 1, 1), date(2024, 1, 14), 12.345, None, 3.0),
+        week(10, date(2024, 1, 8), date(2024, 1, 21)),
+        week(10, date(2024, 1, 15), date(2024, 1, 28)),
+        week(20, date(2024, 1, 8), date(2024, 1, 21)),
+        week(20, date(2024, 1, 22), date(2024, 2, 4)),
+        # Ville hors grille (début un mercredi) : gardée à part dans extra.npy
+        week(30, date(2024, 1, 3), date(2024, 1, 16), 7.0),
+    ]
+
+
+def test_build_et_lecture_complete(rows, cube_dir):
+    assert MeteoCube.build(rows) == 3
+    assert (cube_dir / "meta.json").exists()
+
+    weeks = MeteoCube.get_range(10)
+    assert [w.week_start_date for w in weeks] == [
+        date(2024, 1, 1),
+        date(2024, 1, 8),
+        date(2024, 1, 15),
+    ]
+    assert weeks[0].week_end_date == date(2024, 1, 14)
+    assert weeks[0].temperature_max_avg == 12.35
+    assert weeks[0].temperature_min_avg is None
+    assert [w.week_start_date for w in MeteoCube.get_range(20)] == [
+        date(2024, 1, 8),
+        date(2024, 1, 22),
+    ]
+    (off_grid,) = MeteoCube.get_range(30)
+    assert off_grid.week_start_date == date(2024, 1, 3)
+    assert off_grid.week_end_date == date(2024, 1, 16)
+    assert off_grid.temperature_max_avg == 7.0
+    assert MeteoCube.get_range(30, date(2024, 1, 4), date(2024, 2, 1)) == []
+    assert MeteoCube.get_range(99) is None
+
+
+def test_bornes_inclusives(rows):
+    MeteoCube.build(rows)
+
+    weeks = MeteoCube.get_range(10, date(2024, 1, 2), date(2024, 1, 28))
+    assert [w.week_start_date for w in weeks] == [date(2024, 1, 8), date(2024, 1, 15)]
+    # La semaine du 15 finit le 28 : exclue si end_date la coupe
+    weeks = MeteoCube.get_range(10, date(2024, 1, 1), date(2024, 1, 27))
+    assert [w.week_start_date for w in weeks] == [date(2024, 1, 1), date(2024, 1, 8)]
+    assert MeteoCube.get_range(10, date(2025, 1, 1), date(2025, 2, 1)) == []
+    assert MeteoCube.get_range(10, date(2023, 1, 1), date(2023, 2, 1)) == []
+
+
+def test_get_range_many_et_invalidation(rows):
+    MeteoCube.build(rows)
+
+    found = MeteoCube.get_range_many([20, 30, 10, 99])
+    assert list(found) == [20, 30, 10]
+
+    MeteoCube.invalidate()
+    assert MeteoCube.get_range(10) is None
+    assert MeteoCube.get_range_many([10, 20]) == {}
+
+
+def test_reconstruction_relue_par_les_lecteurs(rows):
+    MeteoCube.build(rows)
+    assert len(MeteoCube.get_range(10)) == 3
+
+    MeteoCube.build(rows[:1])
+    assert len(MeteoCube.get_range(10)) == 1
+    assert MeteoCube.get_range(20) is None
+    assert MeteoCube.build([]) == 0
+    assert MeteoCube.get_range(10) is None
+
+
+def test_build_depuis_transform_weekly_periode_non_alignee(tmp_path, monkeypatch):
+    # Sortie réelle de l'ETL : la période finit un mercredi, la dernière
+    # semaine ISO (incomplète) démarre hors grille mais reste servie
+    import numpy as np
+    import pandas as pd
+
+    from services.etl.etl_meteo import MeteoETL
+
+    monkeypatch.chdir(tmp_path)
+    etl = MeteoETL(start_date="2024-01-01", end_date="2024-01-31", use_cache=False)
+    dates = pd.date_range("2024-01-01", "2024-01-31", freq="D")
+    daily = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "date": dates.date,
+                    "tmax": np.arange(len(dates), dtype=float),
+                    "tmin": np.zeros(len(dates)),
+                    "precip_sum": np.ones(len(dates)),
+                    "geoname_id": gid,
+                    "lat": 1.0,
+                    "lon": 2.0,
+                }
+            )
+            for gid in (1, 2)
+        ],
+        ignore_index=True,
+    )
+    weekly = etl.transform_weekly(daily).rename(
+        columns={
+            "tmax_14d_avg": "temperature_max_avg",
+            "tmin_14d_avg": "temperature_min_avg",
+            "precip_14d_sum": "precipitation_sum",
+        }
+    )
+    assert weekly["week_end_date"].max() == pd.Timestamp("2024-01-31")
+
+    assert MeteoCube.build(weekly.to_dict("records")) == 2
+
+    weeks = MeteoCube.get_range(1, date(2024, 1, 1), date(2024, 12, 31))
+    assert [w.week_start_date for w in weeks] == [
+        date(2024, 1, 1),
+        date(2024, 1, 8),
+        date(2024, 1, 15),
+        date(2024, 1, 18),
+    ]
+    assert weeks[2].week_end_date == date(2024, 1, 28)
+    assert weeks[2].temperature_max_avg == 20.5
+    assert weeks[-1].week_end_date == date(2024, 1, 31)
+    assert weeks[-1].temperature_max_avg == 23.5
+    assert len(MeteoCube.get_range(2)) == 5
@@ -0,0 +1,82 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+import orm.meteo_daily_parquet as store_module
+
+MeteoDailyStore = store_module.MeteoDailyStore
+
+
+@pytest.fixture(autouse=True)
+def tmp_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(MeteoDailyStore, "root", tmp_path / "meteo_daily")
+    return tmp_path / "meteo_daily"
+
+
+def daily(geoname_id, start, n_days, tmax0=0.0):
+    dates = pd.date_range(start, periods=n_days, freq="D")
+    return pd.DataFrame(
+        {
+            "date": dates.date,
+            "tmax": [tmax0 + i for i in range(n_days)],
+            "tmin": 0.0,
+            "precip_sum": 1.0,
+            "geoname_id": geoname_id,
+            "lat": 1.0,
+            "lon": 2.0,
+        }
+    )
+
+
+def test_write_partitionne_par_annee_et_seau(tmp_store):
+    written = MeteoDailyStore.write(
+        pd.concat([daily(1, "2023-12-30", 4), daily(65, "2024-01-01", 2)])
+    )
+
+    assert written == 6
+    parts = sorted(
+        str(p.parent.relative_to(tmp_store)) for p in tmp_store.rglob("*.parquet")
+    )
+    # 1 et 65 partagent le seau 1 (65 % 64)
+    assert parts == ["year=2023/city_bucket=1", "year=2024/city_bucket=1"]
+
+
+def test_read_filtre_ville_et_plage():
+    MeteoDailyStore.write(pd.concat([daily(1, "2023-12-30", 10), daily(65, "2024-01-01", 5)]))
+
+    out = MeteoDailyStore.read(1, date(2024, 1, 1), date(2024, 1, 3))
+    assert out["geoname_id"].unique().tolist() == [1]
+    assert out["date"].tolist() == [date(2024, 1, d) for d in (1, 2, 3)]
+    assert out["tmax"].tolist() == [2.0, 3.0, 4.0]
+
+    assert len(MeteoDailyStore.read(1)) == 10
+    assert MeteoDailyStore.read(2).empty
+
+
+def test_write_remplace_les_jours_existants(tmp_store):
+    MeteoDailyStore.write(daily(1, "2024-01-01", 5))
+    MeteoDailyStore.write(daily(1, "2024-01-04", 4, tmax0=100.0))
+
+    # Ajout sans réécriture : un fichier par écriture
+    assert len(list(tmp_store.rglob("*.parquet"))) == 2
+    out = MeteoDailyStore.read(1)
+    assert len(out) == 7
+    assert out["tmax"].tolist() == [0.0, 1.0, 2.0, 100.0, 101.0, 102.0, 103.0]
+
+
+def test_compact_un_fichier_par_partition(tmp_store):
+    MeteoDailyStore.write(daily(1, "2024-01-01", 5))
+    MeteoDailyStore.write(daily(1, "2024-01-04", 4, tmax0=100.0))
+    MeteoDailyStore.write(daily(2, "2024-01-01", 3))
+    before = MeteoDailyStore.read(1)
+
+    assert MeteoDailyStore.compact() == 1
+    assert len(list(tmp_store.rglob("*.parquet"))) == 2
+    pd.testing.assert_frame_equal(MeteoDailyStore.read(1), before)
+    # Partitions déjà compactes : rien à faire
+    assert MeteoDailyStore.compact() == 0
+
+
+def test_read_sans_dataset():
+    assert MeteoDailyStore.read(1).empty
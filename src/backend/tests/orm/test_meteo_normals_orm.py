@@ -0,0 +1,119 @@
+import pytest
+
+import orm.meteo_normals_orm as repo
+from models.meteo_normal import MeteoNormal
+
+MeteoNormalsOrm = repo.MeteoNormalsOrm
+
+
+@pytest.fixture
+def call_log():
+    return {"execute_query": [], "execute_update": [], "commit": 0}
+
+
+@pytest.fixture(autouse=True)
+def patch_mysql(monkeypatch, call_log):
+    """Fakes MySQLConnection : enregistre requêtes, paramètres et commits"""
+
+    def fake_execute_update(query, params=()):
+        q = " ".join(query.split())
+        call_log["execute_update"].append((q, params))
+        return 52 if q.startswith("INSERT") else 0
+
+    def fake_execute_query(query, params=()):
+        q = " ".join(query.split())
+        call_log["execute_query"].append((q, params))
+        return [
+            {
+                "geoname_id": params[0],
+                "iso_week": 32,
+                "years_count": 3,
+                "first_year": 2022,
+                "last_year": 2024,
+                "temperature_max_mean": 27.5,
+                "temperature_max_min": 25.1,
+                "temperature_max_max": 30.2,
+                "temperature_min_mean": 17.0,
+                "temperature_min_min": 15.4,
+                "temperature_min_max": 18.9,
+                "precipitation_mean": 12.3,
+                "precipitation_min": 0.0,
+                "precipitation_max": 40.0,
+            }
+        ]
+
+    def fake_commit():
+        call_log["commit"] += 1
+
+    monkeypatch.setattr(repo.MySQLConnection, "connect", staticmethod(lambda: None))
+    monkeypatch.setattr(
+        repo.MySQLConnection, "execute_update", staticmethod(fake_execute_update)
+    )
+    monkeypatch.setattr(
+        repo.MySQLConnection, "execute_query", staticmethod(fake_execute_query)
+    )
+    monkeypatch.setattr(repo.MySQLConnection, "commit", staticmethod(fake_commit))
+
+
+def test_refresh_for_cities_par_paquets(call_log):
+    count = MeteoNormalsOrm.refresh_for_cities([3, 1, 2, 3, 4, 5], chunk_size=2)
+
+    assert count == 52 * 3
+    queries = call_log["execute_update"]
+    # DELETE puis INSERT ... SELECT pour chaque paquet de villes
+    assert [q.split()[0] for q, _ in queries] == ["DELETE", "INSERT"] * 3
+    assert [params for _, params in queries] == [
+        (1, 2),
+        (1, 2),
+        (3, 4),
+        (3, 4),
+        (5,),
+        (5,),
+    ]
+    insert = queries[1][0]
+    assert (
+        "DATEDIFF(week_end_date, week_start_date) = 13 AND geoname_id IN (%s, %s)"
+        in insert
+    )
+    assert insert.endswith("GROUP BY geoname_id, iso_week")
+    assert call_log["commit"] == 1
+
+
+def test_refresh_for_cities_backfill_complet(call_log):
+    MeteoNormalsOrm.refresh_for_cities()
+
+    (delete, _), (insert, params) = call_log["execute_update"]
+    assert delete == "DELETE FROM Meteo_Normals"
+    assert "geoname_id IN" not in insert
+    assert params == ()
+    assert call_log["commit"] == 1
+
+
+def test_refresh_periodes_completes_uniquement(call_log):
+    # ETL arrêté un mardi : la période du 18 au mardi 31/12/2024 tombe en
+    # semaine ISO 1 de 2025 ; elle ne doit ni compter une 2e année pour la
+    # semaine 1 ni se mélanger aux moyennes de janvier
+    MeteoNormalsOrm.refresh_for_cities([1])
+
+    (_, _), (insert, _) = call_log["execute_update"]
+    assert (
+        "WHERE DAYOFWEEK(week_end_date) = 1 "
+        "AND DATEDIFF(week_end_date, week_start_date) = 13" in insert
+    )
+    assert "COUNT(DISTINCT YEARWEEK(week_end_date, 3) DIV 100) AS years_count" in insert
+    assert "COUNT(*)" not in insert
+
+
+def test_get_for_city_semaine(call_log):
+    normals = MeteoNormalsOrm.get_for_city(2988507, 32)
+
+    assert len(normals) == 1 and isinstance(normals[0], MeteoNormal)
+    assert (normals[0].iso_week, normals[0].years_count) == (32, 3)
+    q, params = call_log["execute_query"][0]
+    assert "WHERE geoname_id = %s AND iso_week = %s" in q
+    assert params == (2988507, 32)
+
+    MeteoNormalsOrm.get_for_city(2988507)
+    q, params = call_log["execute_query"][1]
+    assert q.endswith("ORDER BY iso_week ASC")
+    assert params == (2988507,)
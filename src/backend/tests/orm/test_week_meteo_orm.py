@@ -0,0 +1,132 @@
+from datetime import date
+
+import pytest
+
+import orm.week_meteo_orm as repo
+from models.week_meteo import WeekMeteo
+
+WeekMeteoOrm = repo.WeekMeteoOrm
+
+
+@pytest.fixture
+def call_log():
+    return {"execute_query": [], "execute_update": [], "commit": 0}
+
+
+@pytest.fixture(autouse=True)
+def patch_mysql(monkeypatch, call_log):
+    """Fakes MySQLConnection : enregistre les executemany et les commits"""
+
+    def fake_execute_update(query, params=()):
+        q = " ".join(query.split())
+        call_log["execute_update"].append((q, params))
+        return len(params) if isinstance(params, list) else 1
+
+    def fake_execute_query(query, params=()):
+        q = " ".join(query.split())
+        call_log["execute_query"].append((q, params))
+        if "MAX(week_end_date)" in q:
+            return [
+                {"geoname_id": 1, "last_date": date(2024, 6, 30)},
+                {"geoname_id": 2, "last_date": date(2024, 7, 3)},
+            ]
+        return []
+
+    def fake_commit():
+        call_log["commit"] += 1
+
+    monkeypatch.setattr(repo.MySQLConnection, "connect", staticmethod(lambda: None))
+    monkeypatch.setattr(
+        repo.MySQLConnection, "execute_update", staticmethod(fake_execute_update)
+    )
+    monkeypatch.setattr(
+        repo.MySQLConnection, "execute_query", staticmethod(fake_execute_query)
+    )
+    monkeypatch.setattr(repo.MySQLConnection, "commit", staticmethod(fake_commit))
+
+
+def row(gid, day):
+    return (gid, date(2024, 1, day), date(2024, 1, day + 13), 10.0, 2.0, None)
+
+
+def test_bulk_upsert_rows_par_paquets(call_log):
+    rows = [row(1, d) for d in range(1, 8)]
+
+    count = WeekMeteoOrm.bulk_upsert_rows(rows, chunk_size=3)
+
+    assert count == 7
+    sizes = [len(params) for _, params in call_log["execute_update"]]
+    assert sizes == [3, 3, 1]
+    assert all(
+        q.startswith("INSERT INTO Meteo_Weekly") and "ON DUPLICATE KEY UPDATE" in q
+        for q, _ in call_log["execute_update"]
+    )
+    # transaction unique
+    assert call_log["commit"] == 1
+
+
+def test_bulk_upsert_rows_vide(call_log):
+    assert WeekMeteoOrm.bulk_upsert_rows([]) == 0
+    assert call_log["execute_update"] == []
+    assert call_log["commit"] == 0
+
+
+def test_bulk_upsert_delegue_aux_tuples(call_log):
+    item = WeekMeteo(
+        geoname_id=1,
+        week_start_date=date(2024, 1, 1),
+        week_end_date=date(2024, 1, 14),
+        temperature_max_avg=10.0,
+        temperature_min_avg=2.0,
+        precipitation_sum=None,
+    )
+    assert WeekMeteoOrm.bulk_upsert([item]) == 1
+    assert call_log["execute_update"][0][1] == [row(1, 1)]
+
+
+def test_get_watermarks(call_log):
+    assert WeekMeteoOrm.get_watermarks() == {
+        1: date(2024, 6, 30),
+        2: date(2024, 7, 3),
+    }
+    q, _ = call_log["execute_query"][0]
+    assert "GROUP BY geoname_id" in q
+
+
+def test_replace_after_supprime_puis_upsert(call_log):
+    cuts = [(1, date(2024, 6, 30))]
+    rows = [row(1, d) for d in range(1, 4)]
+
+    assert WeekMeteoOrm.replace_after(cuts, rows, chunk_size=2) == 3
+
+    (q_del, p_del), *upserts = call_log["execute_update"]
+    assert q_del.startswith("DELETE FROM Meteo_Weekly")
+    assert "week_end_date > %s" in q_del
+    assert p_del == cuts
+    assert [len(p) for _, p in upserts] == [2, 1]
+    assert call_log["commit"] == 1
+
+
+def test_get_range_many_une_requete(call_log):
+    WeekMeteoOrm.get_range_many([1, 2, 3], date(2024, 1, 1), None)
+
+    (q, params), = call_log["execute_query"]
+    assert "WHERE geoname_id IN (%s, %s, %s) AND week_start_date >= %s" in q
+    assert "week_end_date <=" not in q
+    assert params == (1, 2, 3, date(2024, 1, 1))
+    assert q.endswith("ORDER BY geoname_id, week_start_date ASC")
+
+    assert WeekMeteoOrm.get_range_many([]) == []
+    assert len(call_log["execute_query"]) == 1
+
+
+def test_get_week_metrics_periodes_completes(call_log):
+    # Même prédicat que les normales : la période incomplète du 18 au mardi
+    # 31/12 n'est pas comptée en semaine ISO 1
+    WeekMeteoOrm.get_week_metrics()
+
+    (q, _), = call_log["execute_query"]
+    assert q.endswith(
+        "WHERE DAYOFWEEK(m.week_end_date) = 1 "
+        "AND DATEDIFF(m.week_end_date, m.week_start_date) = 13"
+    )
@@ -17,20 +17,25 @@ def patch_mongo(monkeypatch):
     calls = {}
 
     # fake for find_one
-    def fake_find_one(collection, query):
-        calls.setdefault("find_one", []).append((collection, query))
+    def fake_find_one(collection, query, projection=None):
+        calls.setdefault("find_one", []).append((collection, query, projection))
         # return a sample doc if _id present
         if "_id" in query:
             return {"_id": query["_id"], "title": "hello", "lang639-2": "en"}
         return None
 
-    # fake collection + cursor for find().skip().limit()
+    # fake collection + cursor for find().sort().skip().limit()
     class FakeCursor:
         def __init__(self, docs):
             self._docs = docs
             self._skip = 0
             self._limit = None
 
+        def sort(self, key, direction=1):
+            calls.setdefault("cursor_sort", []).append((key, direction))
+            self._docs.sort(key=lambda d: d[key], reverse=direction < 0)
+            return self
+
         def skip(self, n):
             self._skip = n
             return self
@@ -61,8 +66,8 @@ def patch_mongo(monkeypatch):
         ]
         return FakeCollection(docs)
 
-    def fake_find(collection, query, limit=100):
-        calls.setdefault("find", []).append((collection, query, limit))
+    def fake_find(collection, query, projection=None, limit=100):
+        calls.setdefault("find", []).append((collection, query, projection, limit))
         # return docs filtered by query
         key, value = next(iter(query.items()))
         return [
@@ -152,6 +157,8 @@ def test_find_all_uses_get_collection_and_pagination(patch_mongo):
     out = repo.ConversationOrm.find_all(limit=2, skip=1)
     assert isinstance(out, list)
     assert len(out) == 2 or len(out) <= 2  # ensure limit honored at most 2
+    # ordre _id stable : next_cursor reste valable après une page skip
+    assert patch_mongo["cursor_sort"] == [("_id", 1)]
 
 
 def test_find_by_lang_lowercases(patch_mongo):
@@ -330,3 +330,25 @@ def test_insert_electricite_ignores_vides_et_compte_lignes():
 def test_get_countries_by_plug_type():
     res = CountryOrm.get_countries_by_plug_type("C")
     assert isinstance(res, list) and len(res) >= 1
+
+
+def test_get_meteo_weeks_group_by_semaine(call_log):
+    CountryOrm.get_meteo_weeks("FR", "2024-01-01", None)
+
+    q, params = call_log["execute_query"][-1]
+    assert "FROM Villes v INNER JOIN Meteo_Weekly m ON m.geoname_id = v.geoname_id" in q
+    assert "WHERE v.country_3166a2 = %s AND m.week_start_date >= %s" in q
+    assert q.endswith("GROUP BY m.week_start_date ORDER BY m.week_start_date")
+    assert "AVG(m.temperature_max_avg) AS temperature_max_mean" in q
+    assert "population" not in q
+    assert params == ("fr", "2024-01-01")
+
+
+def test_get_meteo_weeks_pondere_par_population(call_log):
+    CountryOrm.get_meteo_weeks("fr", weighted=True)
+
+    q, params = call_log["execute_query"][-1]
+    assert "SUM(m.precipitation_sum * COALESCE(v.population, 0))" in q
+    # repli sur la moyenne simple si aucune population renseignée
+    assert "AVG(m.precipitation_sum)) AS precipitation_mean" in q
+    assert params == ("fr",)
@@ -0,0 +1,108 @@
+import pytest
+import orm.langue_orm as repo
+
+LangueOrm = repo.LangueOrm
+
+
+@pytest.fixture
+def call_log():
+    return {"execute_query": [], "execute_update": []}
+
+
+@pytest.fixture(autouse=True)
+def patch_mysql(monkeypatch, call_log):
+    """Fakes MySQLConnection : table Familles en mémoire, écritures enregistrées"""
+
+    familles = [
+        {"id": 1, "branche_en": "Indo-European", "branche_fr": "Indo-européenne"},
+        {"id": 2, "branche_en": "Uralic", "branche_fr": "Ouralienne"},
+        {"id": 3, "branche_en": "uralic", "branche_fr": None},
+    ]
+
+    def fake_execute_query(query, params=()):
+        q = " ".join(query.split())
+        call_log["execute_query"].append((q, params))
+        if q.startswith("SELECT id, branche_en, branche_fr FROM Familles"):
+            return familles
+        if q.startswith("SELECT id FROM Familles"):
+            return [
+                {"id": f["id"]}
+                for f in familles
+                if params[0].lower()
+                in ((f["branche_en"] or "").lower(), (f["branche_fr"] or "").lower())
+            ]
+        return []
+
+    def fake_execute_update(query, params=()):
+        q = " ".join(query.split())
+        call_log["execute_update"].append((q, params))
+        return len(params) if isinstance(params, list) else 1
+
+    monkeypatch.setattr(
+        repo.MySQLConnection, "execute_query", staticmethod(fake_execute_query)
+    )
+    monkeypatch.setattr(
+        repo.MySQLConnection, "execute_update", staticmethod(fake_execute_update)
+    )
+
+
+def langue(code, branche=None, **extra):
+    return {
+        "iso639_2": code,
+        "name_en": code.upper(),
+        "name_fr": code,
+        "name_local": code,
+        "branche_en": branche,
+        **extra,
+    }
+
+
+def test_get_famille_map_en_fr_minuscules():
+    famille_map = LangueOrm.get_famille_map()
+
+    assert famille_map["indo-european"] == 1
+    assert famille_map["indo-européenne"] == 1
+    # Doublon insensible à la casse : le plus petit id, comme la requête LIKE
+    assert famille_map["uralic"] == 2
+
+
+def test_create_or_replace_batch_une_requete_familles(call_log):
+    langues = [
+        langue("fra", "Indo-European"),
+        langue("fin", "OURALIENNE", is_in_mongo=True),
+        langue("eus"),
+        langue("xxx", "Inconnue"),
+        langue("deu", "indo-european"),
+    ]
+
+    total = LangueOrm.create_or_replace_batch(langues, chunk_size=2)
+
+    assert total == 5
+    assert len(call_log["execute_query"]) == 1
+    writes = call_log["execute_update"]
+    assert [len(params) for _, params in writes] == [2, 2, 1]
+    assert all(q.startswith("REPLACE INTO Langues") for q, _ in writes)
+    rows = [row for _, params in writes for row in params]
+    assert [(r[0], r[4], r[5]) for r in rows] == [
+        ("fra", 1, False),
+        ("fin", 2, True),
+        ("eus", None, False),
+        ("xxx", None, False),
+        ("deu", 1, False),
+    ]
+
+
+def test_create_or_replace_batch_meme_famille_que_unitaire(call_log):
+    LangueOrm.create_or_replace(**langue("fin", "Ouralienne"))
+    LangueOrm.create_or_replace_batch([langue("fin", "Ouralienne")])
+
+    single, batch = call_log["execute_update"]
+    assert single[1] == batch[1][0]
+
+
+def test_create_or_replace_batch_vide_ou_sans_famille(call_log):
+    assert LangueOrm.create_or_replace_batch([]) == 0
+    LangueOrm.create_or_replace_batch([langue("eus")])
+
+    assert call_log["execute_query"] == []
+    assert len(call_log["execute_update"]) == 1
@@ -0,0 +1,80 @@
+from datetime import date
+
+import pytest
+
+import services.country_service as country_service
+
+CountryService = country_service.CountryService
+
+
+@pytest.fixture(autouse=True)
+def fake_orm(monkeypatch):
+    """Fakes MySQLConnection / CountryOrm.get_meteo_weeks, cache vidé à chaque test"""
+    calls = []
+
+    def fake_get_meteo_weeks(iso2, start_date=None, end_date=None, weighted=False):
+        calls.append((iso2, start_date, end_date, weighted))
+        if iso2 != "fr":
+            return []
+        return [
+            {
+                "week_start_date": date(2024, 1, 1),
+                "week_end_date": date(2024, 1, 14),
+                "cities_count": 3,
+                "temperature_max_mean": 9.5,
+                "temperature_max_min": 7.0,
+                "temperature_max_max": 13.0,
+                "temperature_min_mean": 2.0,
+                "temperature_min_min": -1.0,
+                "temperature_min_max": 6.0,
+                "precipitation_mean": 30.0,
+                "precipitation_min": 12.0,
+                "precipitation_max": 55.0,
+            }
+        ]
+
+    monkeypatch.setattr(
+        country_service.MySQLConnection, "connect", staticmethod(lambda: None)
+    )
+    monkeypatch.setattr(
+        country_service.MySQLConnection, "close", staticmethod(lambda: None)
+    )
+    monkeypatch.setattr(
+        country_service.CountryOrm,
+        "get_meteo_weeks",
+        staticmethod(fake_get_meteo_weeks),
+    )
+    CountryService._meteo_cache.clear()
+    yield calls
+    CountryService._meteo_cache.clear()
+
+
+def test_get_meteo_en_cache_par_pays(fake_orm):
+    weeks = CountryService.get_meteo(" FR ", weighted=True)
+    again = CountryService.get_meteo("fr", weighted=True)
+
+    assert again is weeks
+    assert fake_orm == [("fr", None, None, True)]
+    assert weeks[0].country_3166a2 == "fr"
+    assert weeks[0].weighted is True
+    assert weeks[0].cities_count == 3
+
+    # autre pondération : autre entrée de cache
+    CountryService.get_meteo("fr")
+    assert len(fake_orm) == 2
+
+
+def test_invalidate_vide_le_cache(fake_orm):
+    CountryService.get_meteo("fr")
+    CountryService.invalidate()
+    CountryService.get_meteo("fr")
+
+    assert len(fake_orm) == 2
+
+
+def test_get_meteo_erreurs(fake_orm):
+    with pytest.raises(ValueError, match="2 caractères"):
+        CountryService.get_meteo("fra")
+    with pytest.raises(ValueError, match="Aucune donnée météo"):
+        CountryService.get_meteo("zz")
+    assert len(CountryService._meteo_cache) == 0
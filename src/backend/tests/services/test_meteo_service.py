@@ -0,0 +1,276 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+import services.meteo_service as meteo_service
+from models.week_meteo import WeekMeteo
+
+MeteoService = meteo_service.MeteoService
+
+
+@pytest.fixture(autouse=True)
+def cube_dir(tmp_path, monkeypatch):
+    """Cube météo vide dans un dossier temporaire : lectures servies par l'ORM"""
+    monkeypatch.setattr(meteo_service.MeteoCube, "root", tmp_path / "meteo_cube")
+    meteo_service.MeteoCube.reset()
+    yield tmp_path / "meteo_cube"
+    meteo_service.MeteoCube.reset()
+
+
+@pytest.fixture
+def daily_store(monkeypatch):
+    """Relevés quotidiens simulés : janvier-février 2024, tmax = jour du mois"""
+    dates = pd.date_range("2024-01-01", "2024-02-29", freq="D")
+    data = pd.DataFrame(
+        {
+            "geoname_id": 1,
+            "date": dates.date,
+            "tmax": dates.day.astype(float),
+            "tmin": 0.0,
+            "precip_sum": 1.0,
+        }
+    )
+    calls = []
+
+    def fake_read(geoname_id, start_date=None, end_date=None):
+        calls.append((geoname_id, start_date, end_date))
+        out = data[data["geoname_id"] == geoname_id]
+        if start_date:
+            out = out[out["date"] >= start_date]
+        if end_date:
+            out = out[out["date"] <= end_date]
+        return out.reset_index(drop=True)
+
+    monkeypatch.setattr(
+        meteo_service.MeteoDailyStore, "read", staticmethod(fake_read)
+    )
+    return calls
+
+
+def test_aggregates_fenetre_en_jours(daily_store):
+    out = MeteoService.get_aggregates(1, "7d", date(2024, 1, 1), date(2024, 1, 17))
+
+    assert daily_store == [(1, date(2024, 1, 1), date(2024, 1, 17))]
+    assert [(a.period_start, a.period_end, a.days) for a in out] == [
+        (date(2024, 1, 1), date(2024, 1, 7), 7),
+        (date(2024, 1, 8), date(2024, 1, 14), 7),
+        (date(2024, 1, 15), date(2024, 1, 17), 3),
+    ]
+    assert [a.temperature_max_avg for a in out] == [4.0, 11.0, 16.0]
+    assert [a.precipitation_sum for a in out] == [7.0, 7.0, 3.0]
+
+
+def test_aggregates_mensuels(daily_store):
+    out = MeteoService.get_aggregates(1, "month", date(2024, 1, 20), None)
+
+    assert [(a.period_start, a.period_end, a.days) for a in out] == [
+        (date(2024, 1, 20), date(2024, 1, 31), 12),
+        (date(2024, 2, 1), date(2024, 2, 29), 29),
+    ]
+    assert out[1].temperature_max_avg == 15.0
+    assert out[0].window == "month"
+
+
+@pytest.mark.parametrize("window", ["0d", "400d", "week", ""])
+def test_aggregates_fenetre_invalide(daily_store, window):
+    with pytest.raises(ValueError, match="Fenêtre invalide"):
+        MeteoService.get_aggregates(1, window)
+
+
+def test_aggregates_sans_donnees(daily_store):
+    with pytest.raises(ValueError, match="Aucune donnée"):
+        MeteoService.get_aggregates(2, "7d")
+
+
+def test_normals_semaine(monkeypatch):
+    calls = []
+
+    def fake_get_for_city(geoname_id, iso_week=None):
+        calls.append((geoname_id, iso_week))
+        return [] if geoname_id == 2 else ["normale"]
+
+    monkeypatch.setattr(
+        meteo_service.MeteoNormalsOrm, "get_for_city", staticmethod(fake_get_for_city)
+    )
+
+    assert MeteoService.get_normals(1, 32) == ["normale"]
+    assert calls == [(1, 32)]
+    with pytest.raises(ValueError, match="Aucune normale"):
+        MeteoService.get_normals(2)
+
+
+def test_weeks_for_cities_groupees(monkeypatch):
+    calls = []
+
+    def fake_get_range_many(geoname_ids, start_date=None, end_date=None):
+        calls.append(list(geoname_ids))
+        return [
+            WeekMeteo(
+                geoname_id=gid,
+                week_start_date=date(2024, 1, day),
+                week_end_date=date(2024, 1, day + 13),
+            )
+            for gid in (1, 3)
+            for day in (1, 8)
+        ]
+
+    monkeypatch.setattr(
+        meteo_service.WeekMeteoOrm, "get_range_many", staticmethod(fake_get_range_many)
+    )
+
+    grouped = MeteoService.get_weeks_for_cities([3, 2, 1, 3])
+
+    assert calls == [[3, 2, 1]]
+    assert list(grouped) == [3, 2, 1]
+    assert [len(w) for w in grouped.values()] == [2, 0, 2]
+    with pytest.raises(ValueError, match="Aucun geoname_id"):
+        MeteoService.get_weeks_for_cities([])
+    with pytest.raises(ValueError, match="Trop de villes"):
+        MeteoService.get_weeks_for_cities(range(MeteoService.MAX_BATCH_IDS + 1))
+
+
+def test_weeks_depuis_le_cube_repli_mysql(monkeypatch, cube_dir):
+    meteo_service.MeteoCube.build(
+        [
+            {
+                "geoname_id": 1,
+                "week_start_date": date(2024, 1, 1),
+                "week_end_date": date(2024, 1, 14),
+                "temperature_max_avg": 9.5,
+                "temperature_min_avg": 2.25,
+                "precipitation_sum": 31.0,
+            }
+        ]
+    )
+    calls = []
+
+    def fake_get_range_many(geoname_ids, start_date=None, end_date=None):
+        calls.append(list(geoname_ids))
+        return [
+            WeekMeteo(
+                geoname_id=2,
+                week_start_date=date(2024, 1, 1),
+                week_end_date=date(2024, 1, 14),
+            )
+        ]
+
+    monkeypatch.setattr(
+        meteo_service.WeekMeteoOrm, "get_range_many", staticmethod(fake_get_range_many)
+    )
+
+    single = MeteoService.get_weeks_for_city(1)
+    grouped = MeteoService.get_weeks_for_cities([1, 2])
+
+    assert single[0].temperature_min_avg == 2.25
+    assert single[0].week_end_date == date(2024, 1, 14)
+    assert calls == [[2]]
+    assert [len(w) for w in grouped.values()] == [1, 1]
+
+    # Une écriture invalide le cube : retour à MySQL
+    monkeypatch.setattr(
+        meteo_service.WeekMeteoOrm, "delete", staticmethod(lambda gid, d: True)
+    )
+    MeteoService.delete(1, date(2024, 1, 1))
+    assert not (cube_dir / "meta.json").exists()
+    MeteoService.get_weeks_for_cities([1, 2])
+    assert calls[-1] == [1, 2]
+
+
+def test_ecriture_invalide_la_matrice_des_scores(monkeypatch):
+    invalidated = []
+    monkeypatch.setattr(
+        meteo_service.TravelScoreService,
+        "invalidate",
+        classmethod(lambda cls: invalidated.append("scores")),
+    )
+    monkeypatch.setattr(
+        meteo_service.CountryService,
+        "invalidate",
+        staticmethod(lambda: invalidated.append("pays")),
+    )
+    monkeypatch.setattr(
+        meteo_service.WeekMeteoOrm, "bulk_upsert", staticmethod(lambda items: len(items))
+    )
+    week = WeekMeteo(
+        geoname_id=1,
+        week_start_date=date(2024, 1, 1),
+        week_end_date=date(2024, 1, 14),
+        temperature_max_avg=9.5,
+    )
+
+    assert MeteoService.bulk_create_or_update([week]) == 1
+    assert invalidated == ["scores", "pays"]
+
+
+def test_lectures_cube_identiques_a_mysql_periode_finissant_en_semaine(
+    monkeypatch, cube_dir
+):
+    # Périodes de 14 jours finissant chaque dimanche, puis la période
+    # incomplète d'un ETL arrêté un mardi (début hors grille)
+    rows = [
+        {
+            "geoname_id": gid,
+            "week_start_date": date(2024, 12, d),
+            "week_end_date": date(2024, 12, d + 13),
+            "temperature_max_avg": 10.0 + d + gid,
+            "temperature_min_avg": None if d == 9 else 1.25,
+            "precipitation_sum": 3.5,
+        }
+        for gid in (1, 2)
+        for d in (2, 9, 16)
+    ] + [
+        {
+            "geoname_id": gid,
+            "week_start_date": date(2024, 12, 18),
+            "week_end_date": date(2024, 12, 31),
+            "temperature_max_avg": 7.75,
+            "temperature_min_avg": 0.5,
+            "precipitation_sum": 12.0,
+        }
+        for gid in (1, 2)
+    ]
+
+    def mysql(geoname_ids, start_date=None, end_date=None):
+        # Même filtre et même tri que WeekMeteoOrm.get_range_many
+        selected = [
+            r
+            for r in rows
+            if r["geoname_id"] in geoname_ids
+            and (not start_date or r["week_start_date"] >= start_date)
+            and (not end_date or r["week_end_date"] <= end_date)
+        ]
+        selected.sort(key=lambda r: (r["geoname_id"], r["week_start_date"]))
+        return [WeekMeteo.from_dict(r) for r in selected]
+
+    monkeypatch.setattr(
+        meteo_service.WeekMeteoOrm, "get_range_many", staticmethod(mysql)
+    )
+    monkeypatch.setattr(
+        meteo_service.WeekMeteoOrm,
+        "get_range",
+        staticmethod(
+            lambda gid, s, e: mysql([gid], *((s, e) if s and e else (None, None)))
+        ),
+    )
+    ranges = [
+        (None, None),
+        (date(2024, 12, 1), date(2024, 12, 31)),
+        (date(2024, 12, 10), date(2024, 12, 31)),
+        (date(2024, 12, 17), None),
+        (date(2024, 12, 2), date(2024, 12, 30)),
+    ]
+
+    def reads():
+        return [
+            (
+                MeteoService.get_weeks_for_cities([1, 2], start, end),
+                MeteoService.get_weeks_for_city(1, start, end),
+            )
+            for start, end in ranges
+        ]
+
+    from_mysql = reads()
+    assert meteo_service.MeteoCube.build(rows) == 2
+    assert reads() == from_mysql
+    assert from_mysql[0][1][-1].week_end_date == date(2024, 12, 31)
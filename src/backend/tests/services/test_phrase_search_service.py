@@ -0,0 +1,141 @@
+import pytest
+
+import services.phrase_search_service as svc
+from services.conversation_service import ConversationService
+
+PhraseIndex = svc.PhraseIndex
+PhraseSearchService = svc.PhraseSearchService
+
+DOCS = [
+    {
+        "lang639-2": "fra",
+        "sentences": {
+            "THANK_YOU": "Merci beaucoup !",
+            "WHERE_STATION": "Où est la gare ?",
+            "WHERE_HOTEL": "Où est l'hôtel ?",
+        },
+    },
+    {
+        "lang639-2": "spa",
+        "sentences": {
+            "THANK_YOU": "Muchas gracias",
+            "WHERE_STATION": "¿Dónde está la estación?",
+        },
+    },
+    {
+        "lang639-2": "eng",
+        "sentences": {
+            "THANK_YOU": "Thank you very much",
+            "WHERE_STATION": "Where is the train station?",
+            "EMPTY": "",
+        },
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def fake_mongo(monkeypatch):
+    """Documents de conversation en mémoire, index remis à zéro"""
+    calls = {"n": 0}
+
+    def fake_find_all_sentences():
+        calls["n"] += 1
+        return DOCS
+
+    monkeypatch.setattr(
+        svc.ConversationOrm,
+        "find_all_sentences",
+        staticmethod(fake_find_all_sentences),
+    )
+    PhraseSearchService.invalidate()
+    yield calls
+    PhraseSearchService.invalidate()
+
+
+def test_index_normalise_et_ignore_les_phrases_vides():
+    index = PhraseIndex(DOCS)
+    assert len(index) == 7
+    # accents et ponctuation retirés : "Où" -> "ou", "estación?" -> "estacion"
+    assert {"ou", "gare", "estacion", "lhotel"} <= set(index.postings)
+
+
+def test_recherche_classee_par_pertinence():
+    results = PhraseIndex(DOCS).search("où est la GARE")
+    assert [(r.lang639_2, r.key) for r in results[:2]] == [
+        ("fra", "WHERE_STATION"),
+        ("fra", "WHERE_HOTEL"),
+    ]
+    assert results[0].sentence == "Où est la gare ?"
+    scores = [r.score for r in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_recherche_filtre_langues_et_limite():
+    index = PhraseIndex(DOCS)
+    results = index.search("station estacion", langs=["spa"])
+    assert [(r.lang639_2, r.key) for r in results] == [("spa", "WHERE_STATION")]
+    assert len(index.search("where est la", limit=2)) == 2
+    assert index.search("inconnu") == []
+
+
+def test_service_cache_et_invalidation_sur_ecriture(fake_mongo, monkeypatch):
+    assert PhraseSearchService.search("merci")[0].key == "THANK_YOU"
+    PhraseSearchService.search("gracias")
+    assert fake_mongo["n"] == 1
+
+    monkeypatch.setattr(
+        svc.ConversationOrm, "update", staticmethod(lambda cid, data: 1)
+    )
+    ConversationService.update("id", {"$set": {"sentences": {}}})
+    PhraseSearchService.search("gracias")
+    assert fake_mongo["n"] == 2
+
+
+def test_service_requete_et_langues_invalides():
+    with pytest.raises(ValueError, match="vide"):
+        PhraseSearchService.search(" ?! ")
+    assert PhraseSearchService.parse_langs(" FRA, spa,fra ") == ["fra", "spa"]
+    assert PhraseSearchService.parse_langs("") is None
+    with pytest.raises(ValueError, match="fr"):
+        PhraseSearchService.parse_langs("fr,spa")
+
+
+def test_catalogue_des_cles_par_langue():
+    index = PhraseIndex(DOCS)
+    assert list(index.coverage_langs) == ["eng", "fra", "spa"]
+    assert index.langs_with_key("WHERE_HOTEL") == ["fra"]
+    # ordre demandé conservé, phrase vide = clé absente
+    assert index.langs_with_key("THANK_YOU", ["spa", "deu", "fra"]) == ["spa", "fra"]
+    assert index.langs_with_key("EMPTY") == []
+    assert index.langs_with_key("INCONNUE") == []
+
+
+def test_phrase_une_seule_requete_sur_les_langues_couvertes(monkeypatch):
+    queries = []
+
+    def fake_find_sentence(key, lang_codes=None):
+        queries.append((key, lang_codes))
+        return [
+            {"lang639-2": d["lang639-2"], "sentences": {key: d["sentences"][key]}}
+            for d in DOCS
+            if d["lang639-2"] in lang_codes and key in d["sentences"]
+        ]
+
+    monkeypatch.setattr(
+        svc.ConversationOrm, "find_sentence", staticmethod(fake_find_sentence)
+    )
+    pivot = PhraseSearchService.get_phrase("WHERE_STATION", ["spa", "deu", "eng"])
+
+    assert queries == [("WHERE_STATION", ["spa", "eng"])]
+    assert [(t.lang639_2, t.sentence) for t in pivot.translations] == [
+        ("spa", "¿Dónde está la estación?"),
+        ("eng", "Where is the train station?"),
+    ]
+    assert pivot.missing == ["deu"]
+
+    # clé absente des langues demandées : aucune requête
+    with pytest.raises(ValueError, match="introuvable"):
+        PhraseSearchService.get_phrase("WHERE_HOTEL", ["spa"])
+    with pytest.raises(ValueError, match="invalide"):
+        PhraseSearchService.get_phrase("sentences.$x")
+    assert len(queries) == 1
@@ -0,0 +1,160 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+import services.travel_score_service as travel
+from models.travel_score import ComfortProfile
+
+TravelScoreService = travel.TravelScoreService
+
+
+def rows_for(gid, name, country, tmax_by_week, precip=0.0):
+    return [
+        {
+            "geoname_id": gid,
+            "name_en": name,
+            "country_3166a2": country,
+            "iso_week": week,
+            "temperature_max_avg": tmax,
+            "temperature_min_avg": None if tmax is None else tmax - 10,
+            "precipitation_sum": precip,
+        }
+        for week, tmax in tmax_by_week.items()
+    ]
+
+
+@pytest.fixture
+def meteo_rows():
+    return (
+        # Brest : deux années pour la semaine 30 (moyenne 22)
+        rows_for(1, "Brest", "fr", {1: 8.0, 30: 20.0, 40: 16.0})
+        + rows_for(1, "Brest", "fr", {30: 24.0})
+        + rows_for(2, "Nice", "fr", {1: 14.0, 30: 29.0, 40: 24.0})
+        + rows_for(3, "Lisbon", "pt", {1: 15.0, 30: 27.0, 40: 24.0}, precip=100.0)
+        + rows_for(4, "Oslo", "no", {30: None})
+    )
+
+
+@pytest.fixture(autouse=True)
+def orm(monkeypatch, meteo_rows):
+    """Fakes WeekMeteoOrm : compte les chargements complets de la table"""
+    state = {"signature": (len(meteo_rows), None, None, None), "loads": 0}
+
+    def fake_get_week_metrics():
+        state["loads"] += 1
+        return meteo_rows
+
+    monkeypatch.setattr(
+        travel.WeekMeteoOrm,
+        "get_signature",
+        staticmethod(lambda: state["signature"]),
+    )
+    monkeypatch.setattr(
+        travel.WeekMeteoOrm, "get_week_metrics", staticmethod(fake_get_week_metrics)
+    )
+    TravelScoreService.invalidate()
+    yield state
+    TravelScoreService.invalidate()
+
+
+def test_matrice_moyenne_interannuelle(meteo_rows):
+    matrix = travel.ClimateMatrix(meteo_rows)
+
+    assert matrix.values.shape == (4, 53, 3)
+    assert matrix.geoname_ids.tolist() == [1, 2, 3, 4]
+    assert matrix.values[matrix.index[1], 29, 0] == pytest.approx(22.0)
+    assert np.isnan(matrix.values[matrix.index[1], 1, 0])
+    assert np.isnan(matrix.values[matrix.index[4], 29, 0])
+
+
+def test_top_k_ignore_nan():
+    scores = np.array([10.0, np.nan, 30.0, 20.0, 5.0])
+    assert travel.top_k(scores, 2).tolist() == [2, 3]
+    assert travel.top_k(scores, 10).tolist() == [2, 3, 0, 4]
+
+
+def test_top_weeks_for_city():
+    weeks = TravelScoreService.top_weeks_for_city(1, ComfortProfile(), limit=2)
+
+    assert [w.iso_week for w in weeks] == [30, 40]
+    assert weeks[0].temperature_max_avg == 22.0
+    assert weeks[0].score > weeks[1].score
+    with pytest.raises(ValueError):
+        TravelScoreService.top_weeks_for_city(99, ComfortProfile())
+
+
+def test_top_weeks_for_country_moyenne_des_villes():
+    weeks = TravelScoreService.top_weeks_for_country("FR", ComfortProfile(), limit=3)
+
+    assert [w.iso_week for w in weeks] == [30, 40, 1]
+    assert weeks[0].cities_count == 2
+    assert weeks[0].temperature_max_avg == pytest.approx(25.5)
+    with pytest.raises(ValueError):
+        TravelScoreService.top_weeks_for_country("zz", ComfortProfile())
+
+
+def test_top_cities_for_week_profil_et_pays():
+    # La pluie pénalise Lisbonne quand son poids est élevé
+    dry = ComfortProfile(ideal_temp=27, rain_weight=0.8)
+    cities = TravelScoreService.top_cities_for_week(30, dry, limit=5)
+    assert [c.name_en for c in cities] == ["Nice", "Brest", "Lisbon"]
+
+    warm = ComfortProfile(ideal_temp=27, rain_weight=0.0)
+    cities = TravelScoreService.top_cities_for_week(30, warm, limit=1)
+    assert [(c.geoname_id, c.score) for c in cities] == [(3, 100.0)]
+
+    cities = TravelScoreService.top_cities_for_week(30, warm, country="FR")
+    assert {c.country_3166a2 for c in cities} == {"fr"}
+
+    with pytest.raises(ValueError):
+        TravelScoreService.top_cities_for_week(2, warm)
+
+
+def test_matrice_rechargee_si_la_table_change(orm, monkeypatch):
+    TravelScoreService.top_weeks_for_city(1, ComfortProfile())
+    TravelScoreService.top_weeks_for_city(2, ComfortProfile())
+    assert orm["loads"] == 1
+
+    # TTL expiré mais table inchangée : pas de rechargement
+    monkeypatch.setattr(TravelScoreService, "CACHE_TTL", 0.0)
+    TravelScoreService.top_weeks_for_city(1, ComfortProfile())
+    assert orm["loads"] == 1
+
+    orm["signature"] = (999, None, None, None)
+    TravelScoreService.top_weeks_for_city(1, ComfortProfile())
+    assert orm["loads"] == 2
+
+    # Valeurs modifiées sans changer le nombre de lignes ni les dates
+    orm["signature"] = (999, None, None, datetime(2024, 6, 1, 12, 0))
+    TravelScoreService.top_weeks_for_city(1, ComfortProfile())
+    assert orm["loads"] == 3
+
+
+def test_similar_cities_semaine_et_mois():
+    # Semaine 40 : Nice et Lisbonne ont la même T°, la pluie les sépare
+    cities = TravelScoreService.similar_cities(2, iso_week=40, limit=5)
+    assert [c.name_en for c in cities] == ["Brest", "Lisbon"]
+    assert cities[0].distance < cities[1].distance
+    assert all(c.geoname_id != 2 for c in cities)
+
+    # Janvier (semaine 1) : Nice plus proche de Lisbonne que Brest (T° plus douces)
+    cities = TravelScoreService.similar_cities(3, month=1, country="FR")
+    assert [c.name_en for c in cities] == ["Nice", "Brest"]
+    assert cities[0].month == 1 and cities[0].temperature_max_avg == 14.0
+
+    with pytest.raises(ValueError, match="semaine ISO ou un mois"):
+        TravelScoreService.similar_cities(1)
+    with pytest.raises(ValueError, match="sur cette période"):
+        TravelScoreService.similar_cities(4, iso_week=30)
+    with pytest.raises(ValueError):
+        TravelScoreService.similar_cities(99, iso_week=30)
+
+
+def test_matrice_normalisee_calculee_une_fois(meteo_rows):
+    matrix = travel.ClimateMatrix(meteo_rows)
+    z = matrix.normalized()
+
+    assert z is matrix.normalized()
+    assert np.nanmean(z[..., 0]) == pytest.approx(0.0, abs=1e-6)
+    assert np.nanstd(z[..., 0]) == pytest.approx(1.0, abs=1e-5)
@@ -0,0 +1,68 @@
+import pytest
+
+import utils.query_plan as qp
+from connexion.mysql_connect import MySQLConnection
+
+QueryPlanUtils = qp.QueryPlanUtils
+
+
+@pytest.fixture
+def call_log():
+    return {"execute_query": []}
+
+
+@pytest.fixture(autouse=True)
+def patch_mysql(monkeypatch, call_log):
+    """
+    Fake execute_query : renvoie un plan EXPLAIN en full scan pour Villes,
+    un accès par index (ref) pour les autres tables.
+    """
+
+    def fake_execute_query(query, params=None):
+        q = " ".join(query.split())
+        call_log["execute_query"].append((q, params))
+        if q.startswith("EXPLAIN"):
+            if "FROM Villes" in q:
+                return [{"table": "Villes", "type": "ALL", "rows": 150000}]
+            return [{"table": "Pays", "type": "ref", "rows": 1}]
+        return [{"ok": 1}]
+
+    monkeypatch.setattr(
+        MySQLConnection, "execute_query", staticmethod(fake_execute_query)
+    )
+
+
+def test_full_scans_respecte_le_seuil():
+    plan = [
+        {"table": "Villes", "type": "ALL", "rows": 5000},
+        {"table": "Credits", "type": "ALL", "rows": 12},
+        {"table": "Pays", "type": "eq_ref", "rows": 1},
+    ]
+    out = QueryPlanUtils.full_scans(plan, min_rows=1000)
+    assert [r["table"] for r in out] == ["Villes"]
+
+
+def test_explain_calls_detecte_full_scan(call_log):
+    scenarios = [
+        ("villes", lambda: MySQLConnection.execute_query("SELECT * FROM Villes")),
+        ("pays", lambda: MySQLConnection.execute_query("SELECT * FROM Pays")),
+    ]
+    violations = QueryPlanUtils.explain_calls(scenarios, min_rows=1000)
+
+    assert len(violations) == 1
+    assert violations[0]["scenario"] == "villes"
+    assert violations[0]["rows"] == 150000
+    # chaque SELECT est précédé de son EXPLAIN puis exécuté
+    qs = [q for q, _ in call_log["execute_query"]]
+    assert qs == [
+        "EXPLAIN SELECT * FROM Villes",
+        "SELECT * FROM Villes",
+        "EXPLAIN SELECT * FROM Pays",
+        "SELECT * FROM Pays",
+    ]
+
+
+def test_explain_calls_restaure_execute_query():
+    before = MySQLConnection.__dict__["execute_query"]
+    QueryPlanUtils.explain_calls([("noop", lambda: None)])
+    assert MySQLConnection.__dict__["execute_query"] is before
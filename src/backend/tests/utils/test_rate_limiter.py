@@ -0,0 +1,68 @@
+import pytest
+
+import utils.rate_limiter as rate_limiter
+
+TokenBucket = rate_limiter.TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Horloge simulée : sleep() avance monotonic() sans attendre"""
+    state = {"now": 0.0}
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: state["now"])
+
+    def fake_sleep(delay):
+        state["now"] += delay
+
+    monkeypatch.setattr(rate_limiter.time, "sleep", fake_sleep)
+    return state
+
+
+def test_acquire_rafale_puis_debit(clock):
+    bucket = TokenBucket(rate=2, capacity=2)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    # seau vide : un jeton toutes les 0.5 s
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock["now"] == pytest.approx(0.5)
+
+
+def test_rate_invalide():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_adaptive_penalise_puis_remonte(clock):
+    bucket = rate_limiter.AdaptiveTokenBucket(rate=8, min_rate=1, increase_step=1)
+
+    bucket.observe(429)
+    assert bucket.rate == 4
+    assert bucket.tokens == 0
+    bucket.observe(503)
+    bucket.observe(500)
+    bucket.observe(500)
+    assert bucket.rate == 1  # plancher
+
+    bucket.observe(404)  # erreur client : débit inchangé
+    assert bucket.rate == 1
+    for _ in range(10):
+        bucket.observe(200)
+    assert bucket.rate == 8  # plafond = débit initial
+
+
+def test_acquire_plusieurs_jetons(clock):
+    bucket = TokenBucket(rate=2, capacity=4)
+
+    assert bucket.acquire(4) == 0
+    # 3 jetons manquants à 2 jetons/s
+    assert bucket.acquire(3) == pytest.approx(1.5)
+    # Au-delà de la capacité, l'attente serait infinie
+    with pytest.raises(ValueError):
+        bucket.acquire(5)
+
+
+def test_adaptive_capacite_explicite():
+    bucket = rate_limiter.AdaptiveTokenBucket(rate=2, capacity=10)
+    assert bucket.capacity == 10
+    assert rate_limiter.AdaptiveTokenBucket(rate=2).capacity == 2
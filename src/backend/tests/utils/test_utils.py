@@ -0,0 +1,20 @@
+import pandas as pd
+
+from utils.utils import ETLUtils
+
+
+def test_normalize_series_equivalent_a_normalize():
+    values = ["São Tomé", "  Washington,  D.C. ", "Ñuñoa", "", None, "Zürich-Ost"]
+    out = ETLUtils.normalize_series(pd.Series(values, index=[5, 6, 7, 8, 9, 10]))
+
+    assert out.index.tolist() == [5, 6, 7, 8, 9, 10]
+    assert out.tolist() == [ETLUtils.normalize(v) for v in values]
+
+
+def test_similarity_many_equivalent_a_levenshtein():
+    candidates = ["rome", "roma", "", "paris", "romeo"]
+    dist = ETLUtils.levenshtein_many("rome", candidates)
+    assert dist.tolist() == [ETLUtils.levenshtein("rome", c) for c in candidates]
+
+    scores = ETLUtils.similarity_many("", ["", "a"])
+    assert scores.tolist() == [1.0, 0.0]
@@ -0,0 +1,156 @@
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+from connexion.mysql_connect import MySQLConnection
+
+
+class QueryPlanUtils:
+    """
+    Contrôle des plans d'exécution (EXPLAIN) des requêtes SELECT émises par orm/*.
+    Les méthodes ORM sont appelées telles quelles : chaque SELECT est intercepté
+    et précédé d'un EXPLAIN, ce qui évite de dupliquer le SQL des repositories.
+    """
+
+    # Taille (lignes estimées) à partir de laquelle un full scan est refusé
+    DEFAULT_MIN_ROWS = 1000
+
+    @staticmethod
+    def full_scans(plan: List[Dict[str, Any]], min_rows: int) -> List[Dict[str, Any]]:
+        """
+        Extrait d'un résultat EXPLAIN les accès en full scan (type = ALL)
+        sur des tables estimées à au moins `min_rows` lignes.
+
+        Args:
+            plan: Lignes retournées par EXPLAIN
+            min_rows: Seuil de taille de table
+
+        Returns:
+            Lignes du plan en infraction
+        """
+        offending = []
+        for row in plan:
+            access = str(row.get("type") or "").upper()
+            rows = int(row.get("rows") or 0)
+            if access == "ALL" and rows >= min_rows:
+                offending.append(row)
+        return offending
+
+    @staticmethod
+    def explain_calls(
+        scenarios: List[Tuple[str, Callable[[], Any]]],
+        min_rows: int = DEFAULT_MIN_ROWS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Exécute chaque scénario ORM en interceptant MySQLConnection.execute_query
+        pour passer un EXPLAIN sur chaque SELECT.
+
+        Args:
+            scenarios: Liste (libellé, appel ORM sans argument)
+            min_rows: Seuil de taille de table
+
+        Returns:
+            Liste des infractions {scenario, query, table, rows}
+        """
+        violations: List[Dict[str, Any]] = []
+        original = MySQLConnection.__dict__["execute_query"]
+        execute = MySQLConnection.execute_query
+        current = {"label": ""}
+
+        def explaining(query, params=None):
+            if query.lstrip().upper().startswith("SELECT"):
+                plan = execute("EXPLAIN " + query, params)
+                for row in QueryPlanUtils.full_scans(plan, min_rows):
+                    violations.append(
+                        {
+                            "scenario": current["label"],
+                            "query": " ".join(query.split()),
+                            "table": row.get("table"),
+                            "rows": int(row.get("rows") or 0),
+                        }
+                    )
+            return execute(query, params)
+
+        MySQLConnection.execute_query = staticmethod(explaining)
+        try:
+            for label, call in scenarios:
+                current["label"] = label
+                call()
+        finally:
+            MySQLConnection.execute_query = original
+
+        return violations
+
+    @staticmethod
+    def orm_scenarios() -> List[Tuple[str, Callable[[], Any]]]:
+        """
+        Appels ORM représentatifs des routes publiques (lecture).
+        Les identifiants sont pris dans la base pour que les plans soient réalistes.
+        """
+        from orm.country_orm import CountryOrm
+        from orm.ville_orm import VilleOrm
+        from orm.week_meteo_orm import WeekMeteoOrm
+        from orm.langue_orm import LangueOrm
+        from orm.currency_orm import CurrencyOrm
+        from orm.electricity_orm import ElectricityOrm
+
+        def first(query: str, key: str, default: Any) -> Any:
+            rows = MySQLConnection.execute_query(query)
+            return rows[0][key] if rows else default
+
+        iso2 = first("SELECT iso3166a2 FROM Pays LIMIT 1", "iso3166a2", "fr")
+        geoname_id = first("SELECT geoname_id FROM Villes LIMIT 1", "geoname_id", 0)
+        plug = first("SELECT plug_type FROM Electricite LIMIT 1", "plug_type", "C")
+        iso639 = first("SELECT iso639_2 FROM Langues LIMIT 1", "iso639_2", "fra")
+        iso4217 = first("SELECT iso4217 FROM Monnaies LIMIT 1", "iso4217", "EUR")
+
+        return [
+            ("CountryOrm.get_by_alpha2", lambda: CountryOrm.get_by_alpha2(iso2)),
+            ("CountryOrm.get_all", lambda: CountryOrm.get_all(0, 100)),
+            (
+                "CountryOrm.get_countries_by_plug_type",
+                lambda: CountryOrm.get_countries_by_plug_type(plug),
+            ),
+            ("VilleOrm.get_by_geoname_id", lambda: VilleOrm.get_by_geoname_id(geoname_id)),
+            ("VilleOrm.get_by_country", lambda: VilleOrm.get_by_country(iso2)),
+            (
+                "WeekMeteoOrm.get_range",
+                lambda: WeekMeteoOrm.get_range(geoname_id, None, None),
+            ),
+            ("WeekMeteoOrm.get_all", lambda: WeekMeteoOrm.get_all(0, 100)),
+            ("LangueOrm.find_by_iso639_2", lambda: LangueOrm.find_by_iso639_2(iso639)),
+            ("CurrencyOrm.find_by_iso4217", lambda: CurrencyOrm.find_by_iso4217(iso4217)),
+            (
+                "ElectricityOrm.find_by_plug_type",
+                lambda: ElectricityOrm.find_by_plug_type(plug),
+            ),
+        ]
+
+
+def main(min_rows: int = QueryPlanUtils.DEFAULT_MIN_ROWS) -> int:
+    """Vérifie les plans des requêtes ORM ; code de sortie 1 si full scan détecté"""
+    try:
+        MySQLConnection.connect()
+        violations = QueryPlanUtils.explain_calls(
+            QueryPlanUtils.orm_scenarios(), min_rows
+        )
+    finally:
+        MySQLConnection.close()
+
+    if not violations:
+        print(f"Aucun full scan sur les tables de plus de {min_rows} lignes")
+        return 0
+
+    print(f"{len(violations)} full scan(s) détecté(s) :")
+    for v in violations:
+        print(f"  - {v['scenario']} : table {v['table']} ({v['rows']} lignes)")
+        print(f"      {v['query']}")
+    return 1
+
+
+if __name__ == "__main__":
+    threshold = int(sys.argv[1]) if len(sys.argv) > 1 else QueryPlanUtils.DEFAULT_MIN_ROWS
+    sys.exit(main(threshold))
@@ -0,0 +1,106 @@
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Limiteur de débit (seau à jetons) partagé entre threads.
+    `rate` jetons sont ajoutés par seconde, dans la limite de `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Nombre de requêtes autorisées par seconde
+            capacity: Rafale maximale (par défaut : rate, minimum 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate doit être strictement positif")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Bloque jusqu'à disponibilité de `tokens` jetons puis les consomme.
+
+        Returns:
+            Temps d'attente total (secondes)
+
+        Raises:
+            ValueError: si `tokens` dépasse la capacité (attente infinie)
+        """
+        if tokens > self.capacity:
+            raise ValueError(
+                f"{tokens} jetons demandés pour une capacité de {self.capacity}"
+            )
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                delay = (tokens - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """
+    Seau à jetons dont le débit s'adapte aux réponses du serveur (AIMD) :
+    division sur 429/5xx, augmentation progressive sur succès,
+    dans les bornes [min_rate, max_rate].
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float = 0.5,
+        max_rate: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.1,
+        capacity: Optional[float] = None,
+    ):
+        """
+        Args:
+            rate: Débit initial (requêtes/s)
+            min_rate: Débit plancher après pénalités
+            max_rate: Débit plafond (par défaut : débit initial)
+            decrease_factor: Facteur appliqué au débit sur 429/5xx
+            increase_step: Gain de débit (requêtes/s) par succès
+            capacity: Rafale maximale (par défaut : débit initial, minimum 1)
+        """
+        super().__init__(rate, capacity=max(1.0, capacity or rate))
+        self.min_rate = min(min_rate, rate)
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+
+    def penalize(self) -> None:
+        """Réduit le débit et vide le seau (serveur saturé ou quota atteint)"""
+        with self.lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self.tokens = 0.0
+
+    def reward(self) -> None:
+        """Remonte progressivement le débit après une réponse valide"""
+        with self.lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def observe(self, status_code: int) -> None:
+        """Ajuste le débit selon le code HTTP d'une réponse"""
+        if status_code == 429 or status_code >= 500:
+            self.penalize()
+        elif status_code < 400:
+            self.reward()
@@ -1,7 +1,10 @@
 import re
+import sys
 import unicodedata
 from datetime import datetime
-from typing import Tuple, List
+from functools import lru_cache
+from typing import Tuple, List, Dict
+import numpy as np
 import pandas as pd
 
 
@@ -116,6 +119,106 @@ class ETLUtils:
             return 1.0
         return 1.0 - dist / max_len
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _combining_marks_table() -> Dict[int, None]:
+        """Table str.translate supprimant les marques diacritiques (catégorie Mn)"""
+        return {
+            cp: None
+            for cp in range(sys.maxunicode + 1)
+            if unicodedata.category(chr(cp)) == "Mn"
+        }
+
+    @staticmethod
+    def normalize_series(s: pd.Series) -> pd.Series:
+        """
+        Version colonne de normalize() (mêmes règles : sans accents, minuscules,
+        sans ponctuation). Un seul passage par valeur ; la décomposition unicode
+        n'est faite que pour les chaînes non ASCII.
+
+        Args:
+            s: Série de chaînes (NaN -> "")
+
+        Returns:
+            Série normalisée (même index)
+        """
+        marks = ETLUtils._combining_marks_table()
+        punct = re.compile(r"[^\w\s]")
+
+        def _norm(value: str) -> str:
+            if not value.isascii():
+                value = unicodedata.normalize("NFD", value).translate(marks)
+            return " ".join(punct.sub("", value.lower()).split())
+
+        values = s.fillna("").astype(str)
+        return pd.Series([_norm(v) for v in values], index=s.index, dtype=object)
+
+    @staticmethod
+    def levenshtein_many(a: str, candidates: List[str]) -> np.ndarray:
+        """
+        Distance de Levenshtein entre une chaîne et une liste de candidats,
+        calculée ligne par ligne avec numpy (vectorisée sur les candidats).
+
+        La dépendance horizontale de la récurrence (cur[j-1] + 1) est résolue
+        par un minimum cumulé : cur[j] = j + min(i, min_{l<=j}(t[l] - l)).
+
+        Args:
+            a: Chaîne de référence
+            candidates: Chaînes à comparer
+
+        Returns:
+            Tableau des distances (une par candidat)
+        """
+        k = len(candidates)
+        if k == 0:
+            return np.zeros(0, dtype=np.int32)
+        lengths = np.fromiter((len(c) for c in candidates), dtype=np.int32, count=k)
+        width = int(lengths.max()) if k else 0
+        if not a or width == 0:
+            return np.maximum(lengths, len(a)).astype(np.int32)
+
+        # Codes des caractères, complétés par -1 (ne correspond à aucun caractère)
+        codes = np.full((k, width), -1, dtype=np.int32)
+        for row, cand in enumerate(candidates):
+            if cand:
+                codes[row, : len(cand)] = np.frombuffer(
+                    cand.encode("utf-32-le"), dtype=np.int32
+                )
+
+        steps = np.arange(width + 1, dtype=np.int32)
+        prev = np.broadcast_to(steps, (k, width + 1)).copy()
+        for i, ca in enumerate(a, 1):
+            cost = (codes != ord(ca)).astype(np.int32)
+            t = np.minimum(prev[:, 1:] + 1, prev[:, :-1] + cost)
+            shifted = np.concatenate(
+                [np.full((k, 1), i, dtype=np.int32), t - steps[1:]], axis=1
+            )
+            prev = np.minimum.accumulate(shifted, axis=1) + steps
+
+        return prev[np.arange(k), lengths]
+
+    @staticmethod
+    def similarity_many(a: str, candidates: List[str]) -> np.ndarray:
+        """
+        Similarité (0.0 à 1.0) entre une chaîne et une liste de candidats.
+        Les chaînes doivent être déjà normalisées (voir normalize_series).
+
+        Args:
+            a: Chaîne de référence normalisée
+            candidates: Chaînes normalisées
+
+        Returns:
+            Tableau des scores (1.0 = identique)
+        """
+        dist = ETLUtils.levenshtein_many(a, candidates)
+        lengths = np.fromiter(
+            (len(c) for c in candidates), dtype=np.int32, count=len(candidates)
+        )
+        max_len = np.maximum(lengths, len(a))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sim = 1.0 - dist / max_len
+        return np.where(max_len == 0, 1.0, sim)
+
     # ========== MANIPULATION DE CHAÎNES ==========
 
     @staticmethod
@@ -231,6 +334,22 @@ class ETLUtils:
             return (parts[0], parts[1])
         return ("", "")
 
+    @staticmethod
+    def sql_values(s: pd.Series) -> List:
+        """
+        Convertit une colonne en liste de valeurs Python pour executemany :
+        NaN/NaT -> None, numpy -> types natifs (conversion par colonne).
+
+        Args:
+            s: Colonne pandas
+
+        Returns:
+            Liste alignée sur s
+        """
+        values = s.to_numpy(dtype=object)
+        values[s.isna().to_numpy()] = None
+        return values.tolist()
+
     # ========== EXTRACTION DE PATTERNS ==========
 
     @staticmethod
@@ -70,7 +70,8 @@ CREATE TABLE IF NOT EXISTS Villes (
     latitude FLOAT,
     longitude FLOAT,
     country_3166a2 VARCHAR(2) NULL,
-    is_capital BOOLEAN DEFAULT FALSE
+    is_capital BOOLEAN DEFAULT FALSE,
+    population INT UNSIGNED NULL
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- ============================================
@@ -84,6 +85,7 @@ CREATE TABLE IF NOT EXISTS Meteo_Weekly (
     temperature_max_avg DECIMAL(5,2),
     temperature_min_avg DECIMAL(5,2),
     precipitation_sum DECIMAL(7,2),
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
         
     FOREIGN KEY (geoname_id) REFERENCES Villes(geoname_id) 
         ON DELETE CASCADE 
@@ -93,6 +95,33 @@ CREATE TABLE IF NOT EXISTS Meteo_Weekly (
     INDEX idx_week_dates (week_start_date, week_end_date)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- ============================================
+-- Table Normales climatiques par Villes et semaine ISO
+-- (agrégat pluriannuel de Meteo_Weekly, recalculé par l'ETL météo)
+-- ============================================
+CREATE TABLE IF NOT EXISTS Meteo_Normals (
+    geoname_id INT UNSIGNED NOT NULL,
+    iso_week TINYINT UNSIGNED NOT NULL,
+    years_count SMALLINT UNSIGNED NOT NULL,
+    first_year SMALLINT UNSIGNED NOT NULL,
+    last_year SMALLINT UNSIGNED NOT NULL,
+    temperature_max_mean DECIMAL(5,2),
+    temperature_max_min DECIMAL(5,2),
+    temperature_max_max DECIMAL(5,2),
+    temperature_min_mean DECIMAL(5,2),
+    temperature_min_min DECIMAL(5,2),
+    temperature_min_max DECIMAL(5,2),
+    precipitation_mean DECIMAL(7,2),
+    precipitation_min DECIMAL(7,2),
+    precipitation_max DECIMAL(7,2),
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (geoname_id, iso_week),
+    FOREIGN KEY (geoname_id) REFERENCES Villes(geoname_id)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
 
 -- Sélection de la base
 USE traveltips;
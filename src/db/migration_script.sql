@@ -0,0 +1,51 @@
+-- Script de migration pour la base de données traveltips
+-- Exécuté une fois par processus après init_script.sql (MySQLConnection.run_migrations)
+-- Les instructions doivent rester rejouables : les erreurs "index déjà existant"
+-- (1061), "colonne déjà existante" (1060) et "index à supprimer absent" (1091)
+-- sont ignorées.
+
+-- Sélection de la base de données
+USE traveltips;
+
+-- ============================================
+-- Index secondaires / couvrants pour les requêtes de orm/*
+-- ============================================
+
+-- Villes : CountryOrm.get_by_alpha2 (villes du pays) et VilleOrm.get_by_country
+--   WHERE country_3166a2 = %s ORDER BY is_capital DESC, name_en
+--   Index couvrant : lat/lng inclus, geoname_id porté par la PK InnoDB
+--   is_capital DESC (MySQL >= 8) : même sens que l'ORDER BY, donc sans filesort
+CREATE INDEX idx_villes_country_order
+    ON Villes (country_3166a2, is_capital DESC, name_en, latitude, longitude);
+-- Ancienne version tout ASC (ne servait pas l'ORDER BY à sens mixtes)
+DROP INDEX idx_villes_country_cover ON Villes;
+
+-- Pays : CountryOrm.get_all -> ORDER BY name_en LIMIT/OFFSET
+CREATE INDEX idx_pays_name_en ON Pays (name_en);
+
+-- Pays_Electricite : CountryOrm.get_countries_by_plug_type
+--   WHERE plug_type = %s (voltage / frequency lus depuis l'index)
+CREATE INDEX idx_pe_plug_cover ON Pays_Electricite (plug_type, voltage, frequency);
+
+-- Meteo_Weekly : WeekMeteoOrm.get_range / get_all
+--   WHERE geoname_id = %s AND week_start_date >= %s ORDER BY week_start_date
+--   Index couvrant : évite un accès PK (id) par semaine retournée
+CREATE INDEX idx_meteo_city_range
+    ON Meteo_Weekly (geoname_id, week_start_date, week_end_date,
+                     temperature_max_avg, temperature_min_avg, precipitation_sum);
+
+-- Non indexables volontairement :
+--   Villes.name_en / Langues.name_* / Monnaies.name : LIKE '%...%' (joker en tête)
+--   Familles.branche_* : LOWER(...) LIKE (table de 26 lignes)
+
+-- ============================================
+-- Colonnes ajoutées après la création initiale
+-- ============================================
+
+-- Villes.population (GeoNames) : pondération de CountryOrm.get_meteo_weeks
+ALTER TABLE Villes ADD COLUMN population INT UNSIGNED NULL;
+
+-- Meteo_Weekly.updated_at : version de la table (WeekMeteoOrm.get_signature),
+--   change à chaque upsert qui modifie une valeur
+ALTER TABLE Meteo_Weekly
+    ADD COLUMN updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP;
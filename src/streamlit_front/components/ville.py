@@ -200,10 +200,17 @@ def ville_component(country_data: Dict):
 
     def get_meteo_cached(geoname_id: int):
         if geoname_id not in st.session_state.meteo_cache:
+            # Un seul appel pour toutes les villes du pays pas encore chargées
+            missing = tuple(
+                c["geoname_id"]
+                for c in cities
+                if c.get("geoname_id")
+                and c["geoname_id"] not in st.session_state.meteo_cache
+            )
             with st.spinner("Chargement météo..."):
-                st.session_state.meteo_cache[geoname_id] = (
-                    api_client.get_meteo_for_city(geoname_id)
-                )
+                batch = api_client.get_meteo_for_cities(missing) or {}
+            for gid in missing:
+                st.session_state.meteo_cache[gid] = batch.get(gid) or None
         return st.session_state.meteo_cache[geoname_id]
 
     def render_city_card(city: Dict, is_capital: bool = False):
@@ -19,6 +19,7 @@ API_ROUTES: Dict[str, str] = {
     "country_by_id": "/api/countries/by_id/{alpha2}",
     "country_by_name": "/api/countries/by_name/{name}",
     "meteo": "/api/meteo/{geoname_id}",
+    "meteo_batch": "/api/meteo/batch",
     "conversations": "/api/conversations/by_lang/{lang_code}",
     "country_by_plug": "/api/countries/by_plug_type/{plug_type}",
     "health": "/health",
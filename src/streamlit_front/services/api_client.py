@@ -100,6 +100,26 @@ class TravelTipsAPI:
 
         return _self._make_request("GET", endpoint, params=params)
 
+    @st.cache_data(ttl=CACHE_TTL)
+    def get_meteo_for_cities(
+        _self,
+        geoname_ids: tuple,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Optional[Dict[int, List[Dict]]]:
+        """Récupère en un appel les semaines météo de plusieurs villes (par geoname_id)"""
+        params = {"ids": ",".join(str(g) for g in geoname_ids)}
+
+        if start_date:
+            params["start_date"] = start_date.isoformat()
+        if end_date:
+            params["end_date"] = end_date.isoformat()
+
+        data = _self._make_request("GET", API_ROUTES["meteo_batch"], params=params)
+        if data is None:
+            return None
+        return {item["geoname_id"]: item["weeks"] for item in data}
+
     # === CONVERSATIONS ===
 
     @st.cache_data()